@@ -0,0 +1,127 @@
+"""
+    Contains the script to benchmark raising and catching the exceptions.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import timeit
+
+from functools import partial
+from typing import Callable
+
+# User.
+from gutilities.exceptions.ecollections import (
+    NotInCollectionError, WrongLengthError
+)
+from gutilities.exceptions.edicts import WrongKeysError
+from gutilities.exceptions.enumbers import (
+    AboveBelowBoundError, NotInRangeError
+)
+from gutilities.exceptions.etypes import WrongTypeError
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Number of calls per measurement and number of measurements.
+NUMBER: int = 20_000
+REPEAT: int = 5
+
+# The exceptions and the parameters used to create them.
+ERRORS: dict = {
+    "NotInCollectionError": (
+        NotInCollectionError, (None, "z", tuple(range(100)))
+    ),
+    "WrongLengthError": (WrongLengthError, (None, 3, 4)),
+    "AboveBelowBoundError": (AboveBelowBoundError, (None, 1.5, 2.0)),
+    "NotInRangeError": (NotInRangeError, (None, 3, (0, 1), (True, True))),
+    "WrongTypeError": (WrongTypeError, (None, 1, str)),
+    "WrongKeysError": (
+        WrongKeysError,
+        (None, {"a": {"b": 1}, "c": 2}, {"a": {"d": 1}, "c": 2}, -1)
+    )
+}
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _measure(function: Callable) -> float:
+    """
+        Measures the time per call of the given function.
+
+        :param function: The function to be measured; it takes no parameters.
+
+        :return: The best time per call, in microseconds.
+    """
+    # Best of the repetitions.
+    best: float = min(timeit.repeat(function, number=NUMBER, repeat=REPEAT))
+
+    return best / NUMBER * 1e6
+
+
+def _raise_catch(error: type, parameters: tuple, render: bool) -> None:
+    """
+        Raises and catches the given exception.
+
+        :param error: The class of the exception.
+
+        :param parameters: The tuple with the parameters of the exception.
+
+        :param render: A boolean flag indicating whether the message must be
+         rendered after catching the exception. True, if the message must be
+         rendered; False, if the exception is discarded.
+    """
+    try:
+        raise error(*parameters)
+
+    except error as exception:
+        if render:
+            str(exception)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def run() -> None:
+    """
+        Runs the benchmarks; the cost of raising and catching each exception
+        is measured when the exception is discarded, and when its message is
+        rendered. Run it against a previous version of the package to compare
+        with the eager rendering of the messages.
+    """
+    print(f"Raise-and-catch cost; best of {REPEAT} runs of {NUMBER} calls.")
+
+    for name, (error, parameters) in ERRORS.items():
+        # Discarded and rendered.
+        discarded: float = _measure(
+            partial(_raise_catch, error, parameters, False)
+        )
+        rendered: float = _measure(
+            partial(_raise_catch, error, parameters, True)
+        )
+
+        print(
+            f"{name:<22} discarded: {discarded:7.2f} us, rendered: "
+            f"{rendered:7.2f} us"
+        )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    run()
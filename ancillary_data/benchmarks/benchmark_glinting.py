@@ -0,0 +1,240 @@
+"""
+    Contains the script to benchmark linting a synthetic tree of modules with
+    Flake8 and Pylint, serially and with different numbers of processes.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import io
+import os
+import tempfile
+import timeit
+
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable
+
+# User.
+from gutilities.general.glinting import lint_all, lint_flake8, lint_pylint
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Number of calls per measurement and number of measurements.
+NUMBER: int = 1
+REPEAT: int = 1
+
+# Number of packages, and number of modules per package.
+PACKAGES: int = 20
+MODULES: int = 20
+
+# Template of the generated modules; with a few messages of each linter.
+TEMPLATE: str = '''"""
+    Generated module {index}.
+"""
+
+import os
+import sys
+
+
+CONSTANT_{index} = {index}
+
+
+def function_{index}(value, factor=2):
+    """
+        Scales the value.
+    """
+    unused = os.sep
+    if value>{index}:
+        return value * factor
+    return sys.maxsize
+
+
+class Class{index}:
+    """
+        Generated class.
+    """
+
+    def __init__(self, value):
+        self.value = function_{index}(value)
+
+    def method(self):
+        """
+            Gets the value.
+        """
+        return [x for x in range(self.value % 97) if x % 2 == 0]
+'''
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _get_jobs() -> list:
+    """
+        Gets the numbers of processes to be measured; the powers of two up to
+        the number of processors, and the number of processors.
+
+        :return: The sorted list with the numbers of processes.
+    """
+    # Auxiliary variables.
+    processors: int = os.cpu_count() or 1
+
+    return sorted(
+        {2 ** x for x in range(processors.bit_length())} | {processors}
+    )
+
+
+def _get_report(file: Path) -> list:
+    """
+        Gets the lines of the report in the given file; without the separators
+        and the previous evaluation of Pylint, that depend on the persisted
+        statistics.
+
+        :param file: The path of the file with the report.
+
+        :return: The list with the lines of the report.
+    """
+    return [
+        x.split(" (previous run:", 1)[0]
+        for x in file.read_text(encoding="utf-8").splitlines()
+        if x.strip("-") != ""
+    ]
+
+
+def _make_tree(root: Path) -> None:
+    """
+        Makes the synthetic tree of PACKAGES packages, of MODULES modules each.
+
+        :param root: The path of the directory where the tree is made.
+    """
+    for package in range(PACKAGES):
+        # Make the package.
+        directory: Path = root / f"package_{package}"
+        directory.mkdir()
+        (directory / "__init__.py").write_text("", encoding="utf-8")
+
+        for module in range(MODULES):
+            # Auxiliary variables.
+            index: int = package * MODULES + module
+
+            (directory / f"module_{index}.py").write_text(
+                TEMPLATE.format(index=index), encoding="utf-8"
+            )
+
+
+def _measure(function: Callable) -> float:
+    """
+        Measures the time per call of the given function.
+
+        :param function: The function to be measured; it takes no parameters.
+
+        :return: The best time per call, in seconds.
+    """
+    # Best of the repetitions; without the messages to the user.
+    with redirect_stdout(io.StringIO()):
+        best: float = min(
+            timeit.repeat(function, number=NUMBER, repeat=REPEAT)
+        )
+
+    return best / NUMBER
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def run() -> None:
+    """
+        Runs the benchmarks; the synthetic tree is linted with Flake8 and
+        Pylint, with one process (i.e., serially) and with more processes up
+        to the number of processors; and serially with a cold and a warm lint
+        cache. The results are checked to be the same as the serial one.
+        Finally, both engines are run one after the other, and concurrently.
+    """
+    print(
+        f"Cost per call of {PACKAGES * MODULES} modules; best of {REPEAT} "
+        f"runs of {NUMBER} calls."
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Auxiliary variables.
+        root: Path = Path(directory) / "tree"
+        root.mkdir()
+        _make_tree(root)
+
+        for function in (lint_flake8, lint_pylint):
+            # Serial time and report, for the speedup and the comparison.
+            serial: float = 0.0
+            expected: list = []
+
+            for jobs in _get_jobs():
+                # Linted.
+                file: Path = Path(directory) / f"{function.__name__}.txt"
+                elapsed: float = _measure(
+                    lambda f=function, j=jobs, p=file: f(
+                        [f"{root}"], p, True, j
+                    )
+                )
+
+                # The merged report.
+                report: list = _get_report(file)
+
+                serial = serial or elapsed
+                expected = expected or report
+
+                print(
+                    f"{function.__name__:<11} jobs: {jobs:3d} "
+                    f"{elapsed:8.2f} s, speedup: {serial / elapsed:5.2f}x, "
+                    f"same report: {report == expected}"
+                )
+
+            for name in ("cold", "warm"):
+                # Linted with the cache.
+                elapsed = _measure(
+                    lambda f=function, p=file, c=Path(directory) / "cache": f(
+                        [f"{root}"], p, True, 1, c
+                    )
+                )
+                report = _get_report(file)
+
+                print(
+                    f"{function.__name__:<11} cache: {name} "
+                    f"{elapsed:8.2f} s, speedup: {serial / elapsed:5.2f}x, "
+                    f"same report: {report == expected}"
+                )
+
+        # Both engines; one after the other, and concurrently.
+        items: list = [f"{root}"]
+        file = Path(directory) / "all.txt"
+
+        serial = _measure(
+            lambda p=file: (
+                lint_flake8(items, p, True), lint_pylint(items, p, True)
+            )
+        )
+        elapsed = _measure(lambda p=file: lint_all(items, p, recursive=True))
+
+        print(
+            f"{'lint_all':<11} engines: 2 {elapsed:6.2f} s, speedup: "
+            f"{serial / elapsed:5.2f}x"
+        )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    run()
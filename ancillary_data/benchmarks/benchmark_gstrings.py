@@ -0,0 +1,178 @@
+"""
+    Contains the script to benchmark the string normalization functions.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import random
+import timeit
+
+from typing import Callable
+
+# User.
+from gutilities.general.gstrings import (
+    MessageBuilder, messages_concat, normalize, normalize_bytes,
+    normalize_repr
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Number of calls per measurement and number of measurements.
+NUMBER: int = 1
+REPEAT: int = 3
+
+# Size of the log messages, in characters.
+SIZE: int = 1_000_000
+
+# Number of entries of the error report.
+ENTRIES: int = 20_000
+
+# Seed for the random words.
+SEED: int = 7
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _build_report(entries: list) -> str:
+    """
+        Builds the error report with the MessageBuilder class.
+
+        :param entries: The list with the entries of the report.
+
+        :return: The report.
+    """
+    # Auxiliary variables.
+    builder: MessageBuilder = MessageBuilder("The report")
+
+    for entry in entries:
+        builder.append(entry)
+
+    return builder.build()
+
+
+def _concat_report(entries: list) -> str:
+    """
+        Builds the error report with the messages_concat function.
+
+        :param entries: The list with the entries of the report.
+
+        :return: The report.
+    """
+    # Auxiliary variables.
+    report: str = "The report"
+
+    for entry in entries:
+        report = messages_concat(report, entry)
+
+    return report
+
+
+def _get_messages() -> dict:
+    """
+        Gets the log messages of, approximately, SIZE characters.
+
+        :return: The dictionary with the name and the text of each message.
+    """
+    # Auxiliary variables.
+    generator: random.Random = random.Random(SEED)
+    words: list = [
+        "".join(generator.choices("abcdefghij", k=generator.randint(1, 12)))
+        for _ in range(SIZE // 7)
+    ]
+
+    # Lines of words, words only, a single token (e.g., a payload), short
+    # indented lines (e.g., a dump of settings) and wide characters.
+    lines: list = [" ".join(words[i:i + 12]) for i in range(0, len(words), 12)]
+    tabs: list = [f"\t{x}: {y}" for x, y in zip(words[::2], words[1::2])]
+    wide: str = " ".join(words).translate(
+        str.maketrans("abcdefghij", "日本語漢字中文한국어")
+    )
+
+    return {
+        "words": " ".join(words)[:SIZE],
+        "lines": "\n".join(lines)[:SIZE],
+        "token": "x" * SIZE,
+        "tabs": "\n".join(tabs)[:SIZE],
+        "wide": wide[:SIZE],
+    }
+
+
+def _measure(function: Callable) -> float:
+    """
+        Measures the time per call of the given function.
+
+        :param function: The function to be measured; it takes no parameters.
+
+        :return: The best time per call, in milliseconds.
+    """
+    # Best of the repetitions.
+    best: float = min(timeit.repeat(function, number=NUMBER, repeat=REPEAT))
+
+    return best / NUMBER * 1e3
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def run() -> None:
+    """
+        Runs the benchmarks; 1 MB log messages are normalized, as text and as
+        representation, by display width, and from their UTF-8 encoding; the
+        latter includes the decoding. Then, an error report of ENTRIES entries
+        is concatenated, and built. Run it against a previous version of the
+        package to compare.
+    """
+    print(f"Cost per call; best of {REPEAT} runs of {NUMBER} calls.")
+
+    for name, text in _get_messages().items():
+        for function in (normalize, normalize_repr):
+            # Normalized.
+            elapsed: float = _measure(lambda f=function, t=text: f(t, 1, 79))
+
+            print(f"{function.__name__:<19} {name:<6} {elapsed:10.1f} ms")
+
+        # Normalized by display width.
+        elapsed = _measure(
+            lambda t=text: normalize(t, 1, 79, width="display")
+        )
+
+        print(f"{'normalize (display)':<19} {name:<6} {elapsed:10.1f} ms")
+
+        # Normalized from the encoded text.
+        elapsed = _measure(
+            lambda b=text.encode(): normalize_bytes(b, 1, 79)
+        )
+
+        print(f"{normalize_bytes.__name__:<19} {name:<6} {elapsed:10.1f} ms")
+
+    # Error report.
+    entries: list = [f"Mismatch at key {x}: an int" for x in range(ENTRIES)]
+
+    for function in (_concat_report, _build_report):
+        # Built.
+        elapsed = _measure(lambda f=function: f(entries))
+
+        print(f"{function.__name__:<19} report {elapsed:10.1f} ms")
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    run()
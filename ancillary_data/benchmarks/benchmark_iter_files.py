@@ -0,0 +1,157 @@
+"""
+    Contains the script to benchmark the discovery of the files to be linted,
+    in a synthetic tree of 100k entries; most of them in directories that are
+    excluded or ignored (i.e., .git, node_modules and build).
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import tempfile
+import timeit
+
+from pathlib import Path
+from typing import Callable
+
+# User.
+from gutilities.general.glinting import iter_files
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Number of calls per measurement and number of measurements.
+NUMBER: int = 1
+REPEAT: int = 5
+
+# Number of directories, and number of files per directory, of each part of
+# the tree; about 100k entries in total.
+PARTS: dict = {
+    "src": (200, 50),
+    ".git/objects": (400, 100),
+    "node_modules": (400, 100),
+    "build": (200, 50),
+}
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _iter_files_rglob(item: str) -> list:
+    """
+        Gets the python files in the directory as the previous versions did;
+        i.e., the whole tree is walked with rglob, every entry is checked to
+        be a file, and only then filtered.
+
+        :param item: The path of the directory.
+
+        :return: The list with the paths of the files.
+    """
+    return [
+        f"{x}" for x in Path(item).rglob("*")
+        if x.is_file() and "__pycache__" not in f"{x}" and x.suffix == ".py"
+    ]
+
+
+def _make_tree(root: Path) -> int:
+    """
+        Makes the synthetic tree; half of the files of each directory are
+        python files. The build directory is ignored through .gitignore.
+
+        :param root: The path of the directory where the tree is made.
+
+        :return: The number of entries of the tree.
+    """
+    # Auxiliary variables.
+    entries: int = 0
+
+    (root / ".gitignore").write_text("build/\n", encoding="utf-8")
+
+    for part, (directories, files) in PARTS.items():
+        for i in range(directories):
+            # Make the directory.
+            directory: Path = root / part / f"d{i}"
+            directory.mkdir(parents=True)
+
+            for j in range(files):
+                suffix: str = ".py" if j % 2 == 0 else ".txt"
+                (directory / f"f{j}{suffix}").touch()
+
+            entries += files + 1
+
+    return entries
+
+
+def _measure(function: Callable) -> float:
+    """
+        Measures the time per call of the given function.
+
+        :param function: The function to be measured; it takes no parameters.
+
+        :return: The best time per call, in milliseconds.
+    """
+    # Best of the repetitions.
+    best: float = min(timeit.repeat(function, number=NUMBER, repeat=REPEAT))
+
+    return best / NUMBER * 1e3
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def run() -> None:
+    """
+        Runs the benchmarks; the python files of the synthetic tree are
+        discovered as the previous versions did, with iter_files walking the
+        whole tree (i.e., without excludes and .gitignore), and with iter_files
+        pruning the excluded and ignored directories.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Auxiliary variables.
+        entries: int = _make_tree(Path(directory))
+        cases: dict = {
+            "rglob (previous)": lambda: _iter_files_rglob(directory),
+            "iter_files (walk all)": lambda: list(
+                iter_files([directory], True, excludes=(), gitignore=False)
+            ),
+            "iter_files (pruned)": lambda: list(
+                iter_files([directory], True)
+            ),
+        }
+
+        print(
+            f"Cost per call of a tree of {entries} entries; best of {REPEAT} "
+            f"runs of {NUMBER} calls."
+        )
+
+        # Time of the previous version, for the speedup.
+        previous: float = 0.0
+
+        for name, function in cases.items():
+            # Discovered.
+            elapsed: float = _measure(function)
+            previous = previous or elapsed
+
+            print(
+                f"{name:<22} files: {len(function()):6d} {elapsed:9.1f} ms, "
+                f"speedup: {previous / elapsed:6.2f}x"
+            )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,134 @@
+"""
+    Contains the script to benchmark the normalization of many independent
+    messages, serially and with process pools of different sizes.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import os
+import random
+import timeit
+
+from typing import Callable
+
+# User.
+from gutilities.general.gstrings import normalize_many, normalize_repr_many
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Number of calls per measurement and number of measurements.
+NUMBER: int = 1
+REPEAT: int = 3
+
+# Number of messages, and number of words per message.
+MESSAGES: int = 100_000
+WORDS: int = 40
+
+# Seed for the random words.
+SEED: int = 7
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _get_messages() -> list:
+    """
+        Gets the independent messages, of WORDS random words each.
+
+        :return: The list with the messages.
+    """
+    # Auxiliary variables.
+    generator: random.Random = random.Random(SEED)
+    words: list = [
+        "".join(generator.choices("abcdefghij", k=generator.randint(1, 12)))
+        for _ in range(1_000)
+    ]
+
+    return [
+        " ".join(generator.choices(words, k=WORDS)) for _ in range(MESSAGES)
+    ]
+
+
+def _get_workers() -> list:
+    """
+        Gets the numbers of processes to be measured; the powers of two up to
+        the number of processors, and the number of processors.
+
+        :return: The sorted list with the numbers of processes.
+    """
+    # Auxiliary variables.
+    processors: int = os.cpu_count() or 1
+
+    return sorted(
+        {2 ** x for x in range(processors.bit_length())} | {processors}
+    )
+
+
+def _measure(function: Callable) -> float:
+    """
+        Measures the time per call of the given function.
+
+        :param function: The function to be measured; it takes no parameters.
+
+        :return: The best time per call, in milliseconds.
+    """
+    # Best of the repetitions.
+    best: float = min(timeit.repeat(function, number=NUMBER, repeat=REPEAT))
+
+    return best / NUMBER * 1e3
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def run() -> None:
+    """
+        Runs the benchmarks; the messages are normalized, as text and as
+        representation, with one process (i.e., serially) and with pools of
+        processes up to the number of processors.
+    """
+    # Auxiliary variables.
+    messages: list = _get_messages()
+
+    print(
+        f"Cost per call of {MESSAGES} messages; best of {REPEAT} runs of "
+        f"{NUMBER} calls."
+    )
+
+    for function in (normalize_many, normalize_repr_many):
+        # Serial time, for the speedup.
+        serial: float = 0.0
+
+        for workers in _get_workers():
+            # Normalized.
+            elapsed: float = _measure(
+                lambda f=function, w=workers: f(messages, 1, 79, workers=w)
+            )
+            serial = serial or elapsed
+
+            print(
+                f"{function.__name__:<19} workers: {workers:3d} "
+                f"{elapsed:10.1f} ms, speedup: {serial / elapsed:5.2f}x"
+            )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    run()
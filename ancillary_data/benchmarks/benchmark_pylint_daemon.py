@@ -0,0 +1,199 @@
+"""
+    Contains the script to benchmark linting a few changed modules with
+    Pylint, in a new process each time and through the Pylint daemon.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import io
+import multiprocessing
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable
+
+# User.
+from gutilities.general.glinting import (
+    lint_pylint_daemon, serve_pylint, stop_pylint_daemon
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Number of calls per measurement and number of measurements.
+NUMBER: int = 1
+REPEAT: int = 5
+
+# Number of changed modules linted per call.
+MODULES: int = 3
+
+# Template of the generated modules; they import large modules of the
+# standard library, that astroid must infer.
+TEMPLATE: str = '''"""
+    Generated module {index}.
+"""
+
+import asyncio
+import email.mime.multipart
+import http.client
+import json
+
+
+def function_{index}(value):
+    """
+        Gets the objects; stamp {stamp}.
+    """
+    return (
+        asyncio.get_event_loop_policy(),
+        email.mime.multipart.MIMEMultipart(),
+        http.client.HTTPConnection(value).request,
+        json.dumps(value),
+    )
+'''
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _lint_process(items: list, file: Path) -> None:
+    """
+        Lints the files with lint_pylint in a new process; i.e., as a call
+        from the command line, with the whole startup of Pylint.
+
+        :param items: The list with the paths of the files.
+
+        :param file: The path of the file with the report.
+    """
+    subprocess.run(
+        [
+            sys.executable, "-c",
+            f"from gutilities.general.glinting import lint_pylint; "
+            f"lint_pylint({items!r}, {f'{file}'!r})"
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL
+    )
+
+
+def _make_modules(root: Path) -> list:
+    """
+        Makes (or changes) the modules to be linted; their content changes in
+        each call.
+
+        :param root: The path of the directory of the modules.
+
+        :return: The list with the paths of the modules.
+    """
+    # Auxiliary variables.
+    items: list = []
+    stamp: int = time.perf_counter_ns()
+
+    for index in range(MODULES):
+        file: Path = root / f"module_{index}.py"
+        file.write_text(
+            TEMPLATE.format(index=index, stamp=stamp), encoding="utf-8"
+        )
+        items.append(f"{file}")
+
+    return items
+
+
+def _measure(function: Callable) -> float:
+    """
+        Measures the time per call of the given function.
+
+        :param function: The function to be measured; it takes no parameters.
+
+        :return: The best time per call, in milliseconds.
+    """
+    # Best of the repetitions; without the messages to the user.
+    with redirect_stdout(io.StringIO()):
+        best: float = min(
+            timeit.repeat(function, number=NUMBER, repeat=REPEAT)
+        )
+
+    return best / NUMBER * 1e3
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def run() -> None:
+    """
+        Runs the benchmarks; the modules are changed and linted, in a new
+        process each time, and through the daemon once it is warm. The reports
+        are checked to be the same.
+    """
+    print(
+        f"Cost per call of {MODULES} changed modules; best of {REPEAT} runs "
+        f"of {NUMBER} calls."
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Auxiliary variables.
+        root: Path = Path(directory)
+        address: Path = root / "pylint.sock"
+        daemon: multiprocessing.Process = multiprocessing.Process(
+            target=serve_pylint, args=(address,)
+        )
+
+        daemon.start()
+
+        while not address.is_socket():
+            time.sleep(0.01)
+
+        # Warm the daemon.
+        with redirect_stdout(io.StringIO()):
+            lint_pylint_daemon(
+                _make_modules(root), root / "daemon.txt", address=address
+            )
+
+        process: float = _measure(
+            lambda: _lint_process(_make_modules(root), root / "process.txt")
+        )
+        warm: float = _measure(
+            lambda: lint_pylint_daemon(
+                _make_modules(root), root / "daemon.txt", address=address
+            )
+        )
+
+        stop_pylint_daemon(address)
+        daemon.join()
+
+        # Same messages; the modules of both reports are the same.
+        same: bool = (
+            (root / "process.txt").read_text("utf-8").split("\n---")[0] ==
+            (root / "daemon.txt").read_text("utf-8").split("\n---")[0]
+        )
+
+        print(f"{'new process':<14} {process:9.1f} ms")
+        print(
+            f"{'daemon (warm)':<14} {warm:9.1f} ms, speedup: "
+            f"{process / warm:6.2f}x, same report: {same}"
+        )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,121 @@
+"""
+    Contains the script to benchmark the validation functions with and
+    without the validation of their own parameters; i.e., the savings of the
+    trusted mode.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import timeit
+
+from functools import partial
+from typing import Callable
+
+# User.
+from gutilities.context_managers.ctrusted import TrustedValidation
+from gutilities.validation.vcollections import validate_in
+from gutilities.validation.vdicts import (
+    validate_keys_equal,
+    validate_keys_equal_and_type,
+    validate_keys_subset,
+    validate_keys_subset_and_type
+)
+from gutilities.validation.vgeneral import validate_length, validate_type
+from gutilities.validation.vnumbers import (
+    validate_greater_than,
+    validate_in_range,
+    validate_less_than
+)
+from gutilities.validation.vstrings import validate_string_empty
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Number of calls per measurement and number of measurements.
+NUMBER: int = 100_000
+REPEAT: int = 5
+
+# Small dictionaries, as found in configuration files.
+BASE: dict = {"name": "", "value": 0, "options": {"a": 0, "b": 0}}
+DICTIONARY: dict = {"name": "x", "value": 1, "options": {"a": 1, "b": 2}}
+SCHEMA: dict = {"name": str, "value": int, "options": {"a": int, "b": int}}
+
+# The functions and the parameters used to call them.
+FUNCTIONS: dict = {
+    "validate_type": (validate_type, (3, (int, float))),
+    "validate_length": (validate_length, ((1, 2, 3), 3)),
+    "validate_in": (validate_in, (3, (1, 2, 3))),
+    "validate_in_range": (validate_in_range, (1.5, (0, 3))),
+    "validate_greater_than": (validate_greater_than, (1.5, 0)),
+    "validate_less_than": (validate_less_than, (1.5, 3)),
+    "validate_string_empty": (validate_string_empty, ("  ", False, True)),
+    "validate_keys_equal": (validate_keys_equal, (BASE, DICTIONARY, -1)),
+    "validate_keys_subset": (validate_keys_subset, (BASE, DICTIONARY, -1)),
+    "validate_keys_equal_and_type": (
+        validate_keys_equal_and_type, (SCHEMA, DICTIONARY)
+    ),
+    "validate_keys_subset_and_type": (
+        validate_keys_subset_and_type, (SCHEMA, DICTIONARY)
+    ),
+}
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _measure(function: Callable) -> float:
+    """
+        Measures the time per call of the given function.
+
+        :param function: The function to be measured; it takes no parameters.
+
+        :return: The best time per call, in microseconds.
+    """
+    # Best of the repetitions.
+    best: float = min(timeit.repeat(function, number=NUMBER, repeat=REPEAT))
+
+    return best / NUMBER * 1e6
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def run() -> None:
+    """
+        Runs the benchmarks; the cost of each validation function is measured
+        with the validation of its parameters, and in the trusted mode.
+    """
+    print(f"Cost per call; best of {REPEAT} runs of {NUMBER} calls.")
+
+    for name, (function, parameters) in FUNCTIONS.items():
+        # Checked and trusted.
+        checked: float = _measure(partial(function, *parameters))
+
+        with TrustedValidation():
+            trusted: float = _measure(partial(function, *parameters))
+
+        print(
+            f"{name:<30} checked: {checked:6.3f} us, trusted: {trusted:6.3f} "
+            f"us, saved: {1 - trusted / checked:6.1%}"
+        )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    run()
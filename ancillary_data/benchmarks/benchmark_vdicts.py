@@ -0,0 +1,203 @@
+"""
+    Contains the script to benchmark the dictionary validation functions.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import copy as cp
+import timeit
+
+from functools import partial
+from typing import Callable
+
+# User.
+from gutilities.validation.vdicts import (
+    compile_schema,
+    validate_keys_equal,
+    validate_keys_equal_and_type,
+    validate_keys_subset,
+    validate_keys_subset_and_type
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Number of calls per measurement and number of measurements.
+NUMBER: int = 2_000
+REPEAT: int = 5
+
+# Number of calls per measurement for the large trees.
+TREE_NUMBER: int = 20
+
+# Depth of the deep tree; beyond the default recursion limit.
+TREE_DEPTH: int = 1_000
+
+# Number of nodes per level of the wide tree; 10 x 1000 nodes.
+TREE_WIDTH: tuple = (10, 1_000)
+
+# Schema with the types at the ends.
+SCHEMA: dict = {
+    f"section_{i}": {
+        f"entry_{j}": {
+            "name": str,
+            "value": (int, float),
+            "enabled": bool,
+            "comment": (str, None)
+        }
+        for j in range(5)
+    }
+    for i in range(5)
+}
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _get_payload() -> dict:
+    """
+        Gets a payload that is consistent with the schema.
+
+        :return: The dictionary with the payload.
+    """
+    # Auxiliary variables.
+    payload: dict = cp.deepcopy(SCHEMA)
+
+    # Fill the ends with values.
+    for section in payload.values():
+        for entry in section.values():
+            entry.update(name="name", value=1.0, enabled=True, comment=None)
+
+    return payload
+
+
+def _get_trees() -> dict:
+    """
+        Gets the large trees; a deep tree, with a single nested dictionary per
+        level, and a wide tree, with about 10k nodes.
+
+        :return: The dictionary with the name of the trees and the trees.
+    """
+    # Auxiliary variables.
+    deep: dict = {"value": 1}
+    wide: dict = {
+        f"section_{i}": {f"entry_{j}": j for j in range(TREE_WIDTH[1])}
+        for i in range(TREE_WIDTH[0])
+    }
+
+    # The deep tree is built from the innermost level.
+    for i in range(TREE_DEPTH):
+        deep = {f"level_{i}": deep, "value": i}
+
+    return {
+        f"deep_{TREE_DEPTH}": deep,
+        f"wide_{TREE_WIDTH[0] * TREE_WIDTH[1]}": wide
+    }
+
+
+def _measure(function: Callable, number: int = NUMBER) -> float:
+    """
+        Measures the time per call of the given function.
+
+        :param function: The function to be measured; it takes no parameters.
+
+        :param number: The number of calls per measurement.
+
+        :return: The best time per call, in microseconds.
+    """
+    # Best of the repetitions.
+    best: float = min(timeit.repeat(function, number=number, repeat=REPEAT))
+
+    return best / number * 1e6
+
+
+def _report(name: str, current: float, compiled: float) -> None:
+    """
+        Prints the comparison between the current and compiled validators.
+
+        :param name: The name of the validation mode.
+
+        :param current: The time per call of the validate_keys_* function, in
+         microseconds.
+
+        :param compiled: The time per call of the compiled validator, in
+         microseconds.
+    """
+    print(
+        f"{name:<26} function: {current:9.2f} us, compiled: "
+        f"{compiled:9.2f} us, speedup: {current / compiled:6.2f}x"
+    )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def run() -> None:
+    """
+        Runs the benchmarks; the time per payload of the validate_keys_*
+        functions is compared against the compiled validators.
+    """
+    # Auxiliary variables.
+    payload: dict = _get_payload()
+    functions: dict = {
+        "equal": validate_keys_equal,
+        "subset": validate_keys_subset,
+        "equal_and_type": validate_keys_equal_and_type,
+        "subset_and_type": validate_keys_subset_and_type
+    }
+
+    print(f"Per-payload cost; best of {REPEAT} runs of {NUMBER} calls.")
+
+    for mode, function in functions.items():
+        # Keys only, or keys and types.
+        typed: bool = mode.endswith("_and_type")
+        option: dict = {"extract": False} if typed else {"depth": -1}
+        base: dict = SCHEMA if typed else payload
+
+        # Compile once; the compiling time is not part of the measurement.
+        validator: Callable = compile_schema(base, mode=mode, **option)
+
+        current: float = _measure(partial(function, base, payload, **option))
+        compiled: float = _measure(partial(validator, payload))
+
+        _report(mode, current, compiled)
+
+    print(f"\nLarge trees; best of {REPEAT} runs of {TREE_NUMBER} calls.")
+
+    for name, tree in _get_trees().items():
+        # Keys only, and keys and types.
+        for mode in ("equal", "equal_and_type"):
+            function: Callable = functions[mode]
+            option: dict = {"extract": True}
+
+            if mode == "equal":
+                option = {"depth": -1}
+
+            validator: Callable = compile_schema(tree, mode=mode, **option)
+
+            current: float = _measure(
+                partial(function, tree, tree, **option), TREE_NUMBER
+            )
+            compiled: float = _measure(partial(validator, tree), TREE_NUMBER)
+
+            _report(f"{name} {mode}", current, compiled)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    run()
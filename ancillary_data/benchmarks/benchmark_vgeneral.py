@@ -0,0 +1,111 @@
+"""
+    Contains the script to benchmark the general validation functions.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import timeit
+
+from typing import Callable, Iterable
+
+# User.
+from gutilities.validation.vgeneral import validate_length
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Number of calls per measurement and number of measurements.
+NUMBER: int = 5
+REPEAT: int = 3
+
+# Number of items of the collections.
+SIZE: int = 10_000_000
+
+# The collections; generators are created anew for each call.
+LIST: list = list(range(SIZE))
+MEMORYVIEW: memoryview = memoryview(bytearray(SIZE))
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _count(value: Iterable, length: int) -> bool:
+    """
+        Validates the length by counting all the items; i.e., as done before
+        the length of sized objects was taken directly.
+
+        :param value: The iterable with the items to be counted.
+
+        :param length: The expected length.
+
+        :return: True, if the iterable has the expected length; False,
+         otherwise.
+    """
+    return sum(1 for _ in value) == length
+
+
+def _measure(function: Callable) -> float:
+    """
+        Measures the time per call of the given function.
+
+        :param function: The function to be measured; it takes no parameters.
+
+        :return: The best time per call, in milliseconds.
+    """
+    # Best of the repetitions.
+    best: float = min(timeit.repeat(function, number=NUMBER, repeat=REPEAT))
+
+    return best / NUMBER * 1e3
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def run() -> None:
+    """
+        Runs the benchmarks; the length of a list, a memoryview and a
+        generator, with SIZE items, is validated against the full count and
+        with validate_length. The generator is validated against a length of
+        10; the counting must stop after 11 items.
+    """
+    # Auxiliary variables.
+    cases: dict = {
+        "list": (lambda: LIST, SIZE),
+        "memoryview": (lambda: MEMORYVIEW, SIZE),
+        "generator": (lambda: (x for x in range(SIZE)), 10),
+    }
+
+    print(f"Cost per call; best of {REPEAT} runs of {NUMBER} calls.")
+
+    for name, (get, length) in cases.items():
+        # Counted and validated.
+        counted: float = _measure(lambda g=get, n=length: _count(g(), n))
+        validated: float = _measure(
+            lambda g=get, n=length: validate_length(g(), n, consume=True)
+        )
+
+        print(
+            f"{name:<12} counted: {counted:9.3f} ms, validate_length: "
+            f"{validated:9.3f} ms"
+        )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Main Program
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    run()
@@ -14,7 +14,7 @@ import shutil
 from pathlib import Path
 
 # User.
-from gutilities.general.glinting import lint_flake8, lint_pylint
+from gutilities.general.glinting import ENGINES, lint_all
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -40,23 +40,21 @@ def _lint_directory(path: Path, name: str) -> None:
 
         :param name: The name to append to the output files.
     """
-    # Name of the files.
-    base_flake8: str = f"linting_flake8_{name}.txt"
-    base_pylint: str = f"linting_pylint_{name}.txt"
-
-    # Run Flake8.
-    lint_flake8(
+    # Run Flake8 and Pylint; the name of each engine is appended.
+    lint_all(
         [f"{path}"],
-        f"{PATH_ROOT}/{base_flake8}",
+        f"{PATH_ROOT}/linting_{name}.txt",
         recursive=True
     )
 
-    # Run pylint.
-    lint_pylint(
-        [f"{path}"],
-        f"{PATH_ROOT}/{base_pylint}",
-        recursive=True
-    )
+    # Keep the usual names of the files; i.e., linting_<engine>_<name>.txt.
+    for engine, title in ENGINES.items():
+        file: Path = (PATH_ROOT / f"linting_{name}_{engine}.txt").replace(
+            PATH_ROOT / f"linting_{engine}_{name}.txt"
+        )
+
+        # Message to the user.
+        print(f"The {title} results were moved to the file: {file}")
 
 
 def _remove_cache() -> None:
@@ -0,0 +1,93 @@
+"""
+    Contains the context manager to temporarily skip the validation of the
+    parameters of the validation functions.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+from contextvars import Token
+from typing import Any, Union
+
+# User.
+from gutilities.validation.vtrusted import TRUSTED
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TrustedValidation:
+    """
+        Temporarily sets the trusted mode of the validation functions, and
+        restores the previous mode on exit. In the trusted mode, the
+        validation functions do NOT validate their own parameters, which is
+        meant for hot loops where the parameters are known to be valid; the
+        results are the same.
+
+        PARAMETERS:
+        ___________
+
+        - self.token: The token to restore the previous mode; None, until the
+          context is entered.
+
+        - self.trusted: A boolean flag indicating if the trusted mode must be
+          on inside the context. True, if the parameters must NOT be
+          validated; False, if they must be validated, e.g., to re-enable the
+          validation inside a trusted context.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Dunder
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __enter__(self) -> bool:
+        """
+            Sets the trusted mode.
+
+            :return: The trusted mode set inside the context.
+        """
+        # Set the mode.
+        self.token = TRUSTED.set(self.trusted)
+
+        return self.trusted
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """
+            Restores the previous mode.
+
+            :param exc_type: The object with the exception types.
+
+            :param exc_value: The object with the exception values.
+
+            :param traceback: The object with the exception tracebacks.
+        """
+        # Restore the mode.
+        TRUSTED.reset(self.token)
+        self.token = None
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, trusted: bool = True) -> None:
+        """
+            Initializes the context manager.
+
+            :param trusted: A boolean flag indicating if the trusted mode must
+             be on inside the context. True, if the parameters must NOT be
+             validated; False, otherwise. True by default.
+
+            :raise ValueError: If the flag is not a boolean value.
+        """
+        # Validate the parameters.
+        if not isinstance(trusted, bool):
+            raise ValueError("The \"trusted\" flag must be a boolean value.")
+
+        # Set the attributes.
+        self.token: Union[None, Token] = None
+        self.trusted: bool = trusted
@@ -0,0 +1,156 @@
+"""
+    Contains the base class for the custom exceptions.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+from typing import Union
+
+# User.
+from gutilities.general.gstrings import MessageBuilder
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes - Exceptions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class LazyMessageError(Exception):
+    """
+        Base exception whose message is rendered lazily; i.e., only when the
+        message, the string representation or the arguments are first
+        accessed, and then cached. Exceptions that are caught and discarded
+        never pay for formatting the message. Since the details are kept by
+        reference, they should not be modified before the message is rendered.
+
+        Subclasses must implement the _customize method, which completes the
+        message, through the builder attribute, with the details given to the
+        constructor; the message is joined only once, when it is rendered.
+
+        PARAMETERS:
+        ___________
+
+        - self._builder: The builder of the message, while the message is
+          rendered; None, otherwise.
+
+        - self._details: The tuple with the details used to render the
+          message.
+
+        - self._header: The default or custom message, before rendering.
+
+        - self._message: The rendered message; None, until it is rendered.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Dunder
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __repr__(self) -> str:
+        """
+            Gets the representation of the exception.
+
+            :return: The representation of the exception, with the rendered
+             message.
+        """
+        return f"{type(self).__name__}({self.message!r})"
+
+    def __str__(self) -> str:
+        """
+            Gets the string representation of the exception.
+
+            :return: The rendered message.
+        """
+        return self.message
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _customize(self) -> None:
+        """
+            Customizes the exception message, with the details given to the
+            constructor, through the builder; must be implemented by the
+            subclasses.
+        """
+        raise NotImplementedError(
+            f"The {type(self).__name__} class must implement the _customize "
+            f"method."
+        )
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, message: str, details: tuple):
+        """
+            Constructor for the exception; the message is NOT rendered here.
+
+            :param message: The default or custom message.
+
+            :param details: The tuple with the details used to render the
+             message.
+        """
+        # Initialize the variables.
+        self._builder: Union[None, MessageBuilder] = None
+        self._details: tuple = details
+        self._header: str = message
+        self._message: Union[None, str] = None
+
+        # Call the parent constructor.
+        super().__init__(message)
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Properties
+    # /////////////////////////////////////////////////////////////////////////
+
+    @property
+    def args(self) -> tuple:
+        """
+            Gets the arguments of the exception; i.e., the rendered message.
+
+            :return: The tuple with the rendered message.
+        """
+        return (self.message,)
+
+    @args.setter
+    def args(self, value: tuple) -> None:
+        """
+            Sets the arguments of the exception; the message is replaced with
+            the string representation of the arguments.
+
+            :param value: The new arguments of the exception.
+        """
+        # Auxiliary variables.
+        value = tuple(value)
+
+        # As the string representation of the built-in exceptions.
+        self.message = str(value[0] if len(value) == 1 else value or "")
+
+    @property
+    def message(self) -> str:
+        """
+            Gets the message of the exception; rendered on the first access.
+
+            :return: The rendered message.
+        """
+        # Render the message, only once.
+        if self._message is None:
+            self._builder = MessageBuilder(self._header)
+            self._customize()
+            self._message = self._builder.build()
+            self._builder = None
+
+        return self._message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        """
+            Sets the message of the exception.
+
+            :param value: The new message.
+        """
+        self._message = value
@@ -9,10 +9,13 @@
 
 
 # Standard Library.
-from typing import Any, Collection, Union
+import reprlib
+
+from itertools import islice
+from typing import Any, Collection, Mapping, Sized, Union
 
 # User.
-import gutilities.general.gstrings as ustrings
+from gutilities.exceptions.ebase import LazyMessageError
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -20,39 +23,48 @@ import gutilities.general.gstrings as ustrings
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
-class NotInCollectionError(Exception):
+class NotInCollectionError(LazyMessageError):
     """
-        Exception raised when an object is not in the given collection.
+        Exception raised when an object is not in the given collection. Only a
+        sample of the collection is rendered in the message, bounded by a
+        number of items and characters, followed by the number of items in
+        the collection; the collection is iterated only up to the sample.
 
         PARAMETERS:
         ___________
 
+        - self.budget: The 2-tuple with the maximum number of items and
+          characters of the collection that are rendered in the message.
+
         - self.message: The custom message, if any.
     """
     # /////////////////////////////////////////////////////////////////////////
     # Class Variables
     # /////////////////////////////////////////////////////////////////////////
 
+    BRACKETS: dict = {
+        dict: ("{", "}"),
+        frozenset: ("frozenset({", "})"),
+        list: ("[", "]"),
+        set: ("{", "}"),
+        tuple: ("(", ")")
+    }
+
+    BUDGET: tuple = (10, 200)
+
     DEFAULT: str = "The given item is not in the collection."
 
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Auxiliary
     # /////////////////////////////////////////////////////////////////////////
 
-    def _customize(
-        self,
-        vobject: Any,
-        collection: Union[Collection, None]
-    ) -> None:
+    def _customize(self) -> None:
         """
-            Customizes the exception message.
-
-            :param vobject: The object that was not found in the collection.
-
-            :param collection: The collection in which the object should be
-             found.
+            Customizes the exception message, with the details given to the
+            constructor.
         """
         # Auxiliary variables.
+        vobject, collection = self._details
         message: str = ""
 
         # Set the value.
@@ -60,10 +72,159 @@ class NotInCollectionError(Exception):
             message = f"Object being validated: {vobject}. "
 
         if collection is not None:
-            message = f"{message}Collection of possible objects: {collection}."
+            message = (
+                f"{message}Collection of possible objects: "
+                f"{self._get_sample(collection)}."
+            )
 
         # Set the final message.
-        self.message = ustrings.messages_concat(self.message, message.strip())
+        self._builder.append(message.strip())
+
+    def _get_repr(self, level: int = 2) -> reprlib.Repr:
+        """
+            Gets the bounded representation of the objects, within the budget;
+            i.e., the full representation of the collection, or its items, is
+            never built. The nested collections are shown up to the given
+            level, with the number of items of the budget; the strings, and
+            other objects, up to the number of characters of the budget.
+
+            :param level: The number of nested levels that are shown; the
+             items of a collection are one level below the collection.
+
+            :return: The object that gets the bounded representations.
+        """
+        # Auxiliary variables.
+        items, chars = self.budget
+        bounded: reprlib.Repr = reprlib.Repr()
+
+        # Set the limits.
+        bounded.maxlevel = level
+
+        for name in (
+            "maxarray", "maxdeque", "maxdict", "maxfrozenset", "maxlist",
+            "maxset", "maxtuple"
+        ):
+            setattr(bounded, name, items)
+
+        for name in ("maxlong", "maxother", "maxstring"):
+            setattr(bounded, name, chars)
+
+        return bounded
+
+    def _get_sample(self, collection: Any) -> str:
+        """
+            Gets the string representation of the collection, within the
+            budget; i.e., the collection as it is, if it fits, or a sample of
+            the collection followed by the number of items, if known.
+
+            :param collection: The collection in which the object was not
+             found; it can also be an iterator or a generator.
+
+            :return: The string representation of the sample.
+        """
+        # Auxiliary variables.
+        items, chars = self.budget
+        size: Union[None, int] = None
+
+        if isinstance(collection, Sized):
+            size = len(collection)
+
+        # Strings and ranges are shown as they are, up to the budget.
+        if isinstance(collection, str) and size > chars:
+            return f"{collection[:chars]}... ({size} characters)"
+
+        if isinstance(collection, (range, str)):
+            return f"{collection}"
+
+        # Small built-in collections are shown as they are; bounded.
+        if type(collection) in self.BRACKETS and size <= items:
+            sample: str = self._get_repr().repr(collection)
+
+            if len(sample) <= chars:
+                return sample
+
+        return self._get_sample_items(collection, size)
+
+    def _get_sample_items(
+        self,
+        collection: Any,
+        size: Union[None, int]
+    ) -> str:
+        """
+            Gets the string representation of the first items of the
+            collection, within the budget.
+
+            :param collection: The collection in which the object was not
+             found; it can also be an iterator or a generator.
+
+            :param size: The number of items in the collection; None, if it is
+             not known.
+
+            :return: The string representation of the sample.
+        """
+        # Auxiliary variables.
+        items, chars = self.budget
+        bounded: reprlib.Repr = self._get_repr(1)
+        mapping: bool = isinstance(collection, Mapping)
+        entries: list = []
+        length: int = 0
+        truncated: bool = False
+
+        # The brackets of the built-in collections; the type name, otherwise.
+        opening, closing = self.BRACKETS.get(
+            type(collection),
+            (f"{type(collection).__name__}({{", "})") if mapping else
+            (f"{type(collection).__name__}([", "])")
+        )
+
+        # Only iterate the items in the sample; plus one to detect the rest.
+        for entry in islice(collection, items + 1):
+            text: str = bounded.repr(entry)
+
+            if mapping:
+                text = f"{text}: {bounded.repr(collection[entry])}"
+
+            # Stop when the budget is exhausted; the first item is always
+            # shown, even if it must be truncated.
+            if len(text) > chars:
+                text = f"{text[:chars]}..."
+
+            length += len(text) + 2
+
+            if len(entries) == items or (entries and length > chars):
+                truncated = True
+                break
+
+            entries.append(text)
+
+        # Indicate the items that are not shown.
+        if truncated:
+            entries.append("...")
+
+        # Format the sample.
+        sample: str = f"{opening}{', '.join(entries)}{closing}"
+
+        if truncated and size is not None:
+            sample = f"{sample} ({size} items)"
+
+        return sample
+
+    def _validate_budget(self) -> None:
+        """
+            Validates the budget attribute.
+
+            :raises ValueError: If the budget is not a 2-tuple of positive
+             integers.
+        """
+        # Check the budget properties.
+        if not (
+            isinstance(self.budget, tuple) and len(self.budget) == 2 and
+            all(isinstance(x, int) and x > 0 for x in self.budget)
+        ):
+            raise ValueError(
+                f"The budget must be a 2-tuple with the positive number of "
+                f"items and characters; current value: {self.budget}."
+            )
 
     # /////////////////////////////////////////////////////////////////////////
     # Constructor
@@ -73,7 +234,8 @@ class NotInCollectionError(Exception):
         self,
         message: Union[None, str] = None,
         vobject: Any = None,
-        collection: Union[Collection, None] = None
+        collection: Union[Collection, None] = None,
+        budget: Union[None, tuple[int, int]] = None
     ):
         """
             Constructor for the exception.
@@ -84,19 +246,27 @@ class NotInCollectionError(Exception):
 
             :param collection: The collection in which the object was not
              found.
+
+            :param budget: The 2-tuple with the maximum number of items and
+             characters of the collection that are rendered in the message.
+             None, to use the default budget of the class, BUDGET.
         """
         # Auxiliary variables.
         default: str = NotInCollectionError.DEFAULT
 
-        # Initialize the variables.
-        self.message: str = default if message is None else message
-        self._customize(vobject, collection)
+        # Extract the parameters.
+        self.budget: tuple = self.BUDGET if budget is None else budget
+
+        # Validate the parameters before continuing.
+        self._validate_budget()
 
-        # Call the parent constructor.
-        super().__init__(self.message)
+        # Call the parent constructor; the message is rendered lazily.
+        super().__init__(
+            default if message is None else message, (vobject, collection)
+        )
 
 
-class WrongLengthError(Exception):
+class WrongLengthError(LazyMessageError):
     """
         Exception raised when the collection is not of the expected length.
 
@@ -115,31 +285,27 @@ class WrongLengthError(Exception):
     # Methods - Auxiliary
     # /////////////////////////////////////////////////////////////////////////
 
-    def _customize(
-        self,
-        clength: Union[int, None],
-        elength: Union[int, None]
-    ) -> None:
+    def _customize(self) -> None:
         """
-            Customizes the exception message.
-
-            :param clength: The length of the collection that was not
-             of the expected length.
-
-            :param elength: The expected length of the collection.
+            Customizes the exception message, with the details given to the
+            constructor.
         """
         # Auxiliary variables.
+        clength, elength, bounded = self._details
         message: str = ""
 
         # Set the values.
         if clength is not None:
-            message = f"Current length of the collection: {clength}. "
+            message = (
+                f"Current length of the collection: "
+                f"{'at least ' if bounded else ''}{clength}. "
+            )
 
         if elength is not None:
             message = f"{message}Expected length: {elength}."
 
         # Set the final message.
-        self.message = ustrings.messages_concat(self.message, message.strip())
+        self._builder.append(message.strip())
 
     # /////////////////////////////////////////////////////////////////////////
     # Constructor
@@ -149,7 +315,8 @@ class WrongLengthError(Exception):
         self,
         message: Union[None, str] = None,
         clength: Union[int, None] = None,
-        elength: Union[int, None] = None
+        elength: Union[int, None] = None,
+        bounded: bool = False
     ):
         """
             Constructor for the exception.
@@ -160,13 +327,16 @@ class WrongLengthError(Exception):
              the expected length.
 
             :param elength: The expected length of the collection.
+
+            :param bounded: A boolean flag indicating if the counting stopped
+             before the end of the collection; i.e., the current length is a
+             lower bound. False by default.
         """
         # Auxiliary variables.
         default: str = WrongLengthError.DEFAULT
 
-        # Initialize the variables.
-        self.message: str = default if message is None else message
-        self._customize(clength, elength)
-
-        # Call the parent constructor.
-        super().__init__(self.message)
+        # Call the parent constructor; the message is rendered lazily.
+        super().__init__(
+            default if message is None else message,
+            (clength, elength, bounded)
+        )
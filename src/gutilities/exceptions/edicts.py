@@ -9,13 +9,10 @@
 
 
 # Standard Library.
-from typing import Any, Type, Union
+from typing import Callable, Type, Union
 
 # User.
-import gutilities.general.gstrings as ustrings
-from gutilities.validation.vgeneral import (
-    validate_type
-)
+from gutilities.exceptions.ebase import LazyMessageError
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -23,6 +20,177 @@ from gutilities.validation.vgeneral import (
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def _get_messages(
+    mismatches: list,
+    extract: Union[bool, None],
+    subset: bool
+) -> list:
+    """
+        Gets the error messages for the mismatches between the dictionaries.
+
+        :param mismatches: The list with the mismatches, as found by the
+         traversal of the validation functions.
+
+        :param extract: A boolean flag indicating whether the data type of the
+         base dictionary was extracted rather than directly used; None, if
+         only the keys were validated.
+
+        :param subset: A boolean flag indicating whether the original
+         dictionary is only required to be a subset of the base dictionary.
+         True, if it is only required to be a subset; False, otherwise.
+
+        :return: The list of tuples with the parts of each error message.
+    """
+    return [_get_message(x, extract, subset) for x in mismatches]
+
+
+def _get_mismatches(
+    base: dict,
+    original: dict,
+    depth: Union[int, None],
+    subset: bool,
+    extract: Union[bool, None]
+) -> list:
+    """
+        Gets all the mismatches between the dictionaries; the dictionaries are
+        traversed with the same traversal used by the validation functions.
+
+        :param base: The base dictionary.
+
+        :param original: The original dictionary.
+
+        :param depth: The depth to which the validation should be performed;
+         -1, to the deepest level of the base dictionary. None, if the types
+         at the ends of the base dictionary must be validated.
+
+        :param subset: A boolean flag indicating whether the original
+         dictionary is only required to be a subset of the base dictionary.
+         True, if it is only required to be a subset; False, otherwise.
+
+        :param extract: A boolean flag indicating whether the data type of the
+         base dictionary must be extracted rather than directly used; None, if
+         only the keys must be validated.
+
+        :return: The list with the mismatches, in depth-first order.
+    """
+    # Imported here, since the validation module imports the exceptions.
+    # pylint: disable-next=import-outside-toplevel
+    from gutilities.validation.vdicts import (
+        _traverse, _validate_type_extract, _validate_type_leaf
+    )
+
+    # Auxiliary variables; the same rules as the validation functions, i.e.,
+    # the keys are only required to be a subset at the root, and the keys
+    # and types at every level.
+    check: Union[None, Callable] = None
+    level: int = 1 if subset else 0
+
+    if depth is None:
+        check = _validate_type_extract if extract else _validate_type_leaf
+        level = -1 if subset else 0
+
+    return _traverse(
+        original, base, (-1 if depth is None else depth, level, check), False
+    )
+
+
+def _get_message(
+    mismatch: tuple,
+    extract: Union[bool, None],
+    subset: bool
+) -> tuple:
+    """
+        Gets the parts of the error message for the given mismatch.
+
+        :param mismatch: The tuple with the kind of mismatch, the depth, the
+         path and the details of the mismatch; as found by the traversal.
+
+        :param extract: A boolean flag indicating whether the data type of the
+         base dictionary was extracted rather than directly used; None, if
+         only the keys were validated.
+
+        :param subset: A boolean flag indicating whether the original
+         dictionary is only required to be a subset of the base dictionary.
+         True, if it is only required to be a subset; False, otherwise.
+
+        :return: The tuple with the parts of the error message.
+    """
+    # Auxiliary variables.
+    kind, depth, path, details = mismatch
+    message: str = ""
+
+    # Set the message for the kind of mismatch.
+    if kind == "keys" and subset and not details[0]:
+        message = f"Error: Excess keys: {details[1] or '{}'}."
+
+    elif kind == "keys":
+        message = (
+            f"Error: Missing or excess keys; missing: {details[0] or '{}'}, "
+            f"excess: {details[1] or '{}'}."
+        )
+
+    elif kind == "type":
+        # Extract the types.
+        dtype_b: Union[None, tuple, Type] = details[0]
+        dtype_b = type(dtype_b) if extract else dtype_b
+        dtype_o: Union[None, Type] = None
+
+        if details[1] is not None:
+            dtype_o = type(details[1])
+
+        message = (
+            f"Error: The original object of the original dictionary is not "
+            f"of the requested type; requested type: "
+            f"{_get_types_name(dtype_b)}, current type: "
+            f"{_get_types_name(dtype_o)}."
+        )
+
+    elif kind == "notdict" and extract is not None:
+        message = (
+            f"Error: The original object is a NOT dictionary when it should; "
+            f"current type: {_get_types_name(type(details))}."
+        )
+
+    elif kind == "notdict":
+        message = (
+            "Error: The original object is NOT a dictionary at this depth "
+            "and key when it should be."
+        )
+
+    else:
+        message = (
+            "Error: The original object is a dictionary at this depth and "
+            "key when it should not be."
+        )
+
+    # Keys and types mismatches do not report the depth.
+    if extract is not None:
+        return f"Key: {_get_path(path)},", message
+
+    return f"Depth: {depth},", f"Key: {_get_path(path)},", message
+
+
+def _get_path(path: Union[None, tuple]) -> str:
+    """
+        Gets the string representation of the path, as found by the
+        traversal; i.e., the keys joined with periods starting from the root.
+
+        :param path: None for the root, or a tuple with the path of the parent
+         and the key, otherwise.
+
+        :return: The string with the path.
+    """
+    # Auxiliary variables.
+    keys: list = []
+
+    # Walk back to the root.
+    while path is not None:
+        path, key = path
+        keys.append(f"'{key}'" if isinstance(key, str) else f"{key}")
+
+    return ".".join(["'root'"] + keys[::-1])
+
+
 def _get_types_name(dtype: Union[None, tuple, Type]) -> str:
     """
         Extracts the type name from the given object.
@@ -57,7 +225,7 @@ def _get_types_name(dtype: Union[None, tuple, Type]) -> str:
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
-class WrongKeysError(Exception):
+class WrongKeysError(LazyMessageError):
     """
         Exception raised when the dictionary does not have the expected keys.
 
@@ -69,6 +237,9 @@ class WrongKeysError(Exception):
         - self.message: The custom message, if any.
 
         - self._messages: A list with the error messages.
+
+        - self._mismatches: A list with the mismatches between the
+          dictionaries; None, until they are found.
     """
     # /////////////////////////////////////////////////////////////////////////
     # Class Variables
@@ -80,85 +251,31 @@ class WrongKeysError(Exception):
     # Methods - Auxiliary
     # /////////////////////////////////////////////////////////////////////////
 
-    def _check_keys(
-        self,
-        base: Any,
-        original: Any,
-        depth: int,
-        path: str
-    ) -> None:
+    def _customize(self) -> None:
         """
-            Recursively checks the keys in the dictionaries.
-
-            :param base: The base dictionary.
-
-            :param original: The original dictionary.
-
-            :param depth: The depth to which the validation should be
-             performed. If None, the validation is performed to the deepest
-             level of the base dictionary.
-
-            :param path: The key of the dictionary.
+            Customizes the exception message, with the details given to the
+            constructor; i.e., the base and original dictionaries.
         """
-        # Maximum depth reached.
-        flag: bool = self.depth is not None
-
-        if flag and self.depth != -1 and depth > self.depth:
-            return
-
-        # Determine if the dictionaries are dictionaries.
-        isdict_b: bool = isinstance(base, dict)
-        isdict_o: bool = isinstance(original, dict)
-
-        # Edge cases.
-        if not (isdict_b or isdict_o):
-            # Neither one is a dictionary, comparison has succeeded.
-            return
-
-        if not isdict_b and isdict_o:
-            # The original object is a dictionary, when it shouldn't.
-            self._messages.append((
-                f"Depth: {depth},",
-                f"Key: {path},",
-                "Error: The original object is a dictionary at this depth and "
-                "key when it should not be."
-            ))
-            return
+        # Auxiliary variables.
+        base, original = self._details
 
-        if isdict_b and not isdict_o:
-            # The original object is NOT a dictionary, when it should be.
-            self._messages.append((
-                f"Depth: {depth},",
-                f"Key: {path},",
-                "Error: The original object is NOT a dictionary at this depth "
-                "and key when it should be."
-            ))
+        # No need to set the message.
+        if self.depth is None:
             return
 
-        # Missing and excess keys.
-        missing: set = set(base.keys()) - set(original.keys())
-        excess: set = set(original.keys()) - set(base.keys())
-
-        if missing or excess:
-            self._messages.append((
-                f"Depth: {depth},",
-                f"Key: {path},",
-                f"Error: Missing or excess keys; missing: {missing or '{}'}, "
-                f"excess: {excess or '{}'}."
-            ))
+        # Determine if dictionaries are needed.
+        isdict_orig: bool = isinstance(original, dict)
+        isdict_base: bool = isinstance(base, dict)
 
-        # Next depth level.
-        for key in base.keys():
-            # Check if the key exits.
-            if key not in original:
-                continue
+        # Format the message accordingly.
+        if isdict_orig and isdict_base:
+            self._customize_both(base, original)
 
-            # Extract the next key.
-            tkey: str = f"'{key}'" if isinstance(key, str) else f"{key}"
-            tkey = f"{path}.{tkey}" if path != "" else tkey
+        if not isdict_base:
+            self._customize_base()
 
-            # Recursive step.
-            self._check_keys(base[key], original[key], depth + 1, tkey)
+        if not isdict_orig:
+            self._customize_original()
 
     def _customize_base(self) -> None:
         """
@@ -173,7 +290,7 @@ class WrongKeysError(Exception):
         )
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, message)
+        self._builder.append(message)
 
     def _customize_both(self, base: dict, original: dict) -> None:
         """
@@ -184,18 +301,21 @@ class WrongKeysError(Exception):
 
             :param original: The original dictionary.
         """
-        # Auxiliary variables.
-        self._messages: list = []
+        # Find the mismatches, unless they were already found.
+        if self._mismatches is None:
+            self._mismatches = _get_mismatches(
+                base, original, self.depth, False, None
+            )
 
         # Check the keys.
-        self._check_keys(base, original, 0, "'root'")
+        self._messages = _get_messages(self._mismatches, None, False)
 
         # Format the final message.
         self._messages = [" ".join(x) for x in self._messages]
         fmessage = "\nErrors:" + "\n- " + "\n- ".join(self._messages)
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, fmessage)
+        self._builder.append(fmessage)
 
     def _customize_original(self) -> None:
         """
@@ -210,33 +330,7 @@ class WrongKeysError(Exception):
         )
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, message)
-
-    def _set_message(self, base: Any, original: Any) -> None:
-        """
-            Sets the message properly.
-
-            :param base: The base dictionary.
-
-            :param original: The original dictionary.
-        """
-        # No need to set the message.
-        if self.depth is None:
-            return
-
-        # Determine if dictionaries are needed.
-        isdict_orig: bool = isinstance(original, dict)
-        isdict_base: bool = isinstance(base, dict)
-
-        # Format the message accordingly.
-        if isdict_orig and isdict_base:
-            self._customize_both(base, original)
-
-        if not isdict_base:
-            self._customize_base()
-
-        if not isdict_orig:
-            self._customize_original()
+        self._builder.append(message)
 
     def _validate_depth(self) -> None:
         """
@@ -264,12 +358,15 @@ class WrongKeysError(Exception):
     # Constructor
     # /////////////////////////////////////////////////////////////////////////
 
+    # pylint: disable-next=too-many-arguments
     def __init__(
         self,
         message: Union[None, str] = None,
         base: Union[dict, None] = None,
         original: Union[dict, None] = None,
-        depth: Union[int, None] = None
+        depth: Union[int, None] = None,
+        *,
+        mismatches: Union[list, None] = None
     ):
         """
             Initializes the exception.
@@ -282,24 +379,29 @@ class WrongKeysError(Exception):
 
             :param depth: The depth to which the validation should be
              performed. If None, the validation is NOT performed.
+
+            :param mismatches: The list with the mismatches between the
+             dictionaries, as found by the validation functions; if given, the
+             dictionaries are not traversed again. None, by default.
         """
         # Auxiliary variables.
         default: str = WrongKeysError.DEFAULT
 
         # Extract the parameters.
         self.depth: Union[int, None] = depth
-        self.message: str = default if message is None else message
         self._messages: list = []
+        self._mismatches: Union[list, None] = mismatches
 
         # Validate the parameters before continuing.
         self._validate_depth()
-        self._set_message(base, original)
 
-        # Call the parent constructor.
-        super().__init__(self.message)
+        # Call the parent constructor; the message is rendered lazily.
+        super().__init__(
+            default if message is None else message, (base, original)
+        )
 
 
-class WrongKeysAndTypeError(Exception):
+class WrongKeysAndTypeError(LazyMessageError):
     """
         Exception raised when the dictionary does not have the expected keys,
         and the types at the branches of the base dictionary are the same
@@ -315,6 +417,9 @@ class WrongKeysAndTypeError(Exception):
         - self.message: The custom message, if any.
 
         - self._messages: A list with the error messages.
+
+        - self._mismatches: A list with the mismatches between the
+          dictionaries; None, until they are found.
     """
     # /////////////////////////////////////////////////////////////////////////
     # Class Variables
@@ -329,82 +434,27 @@ class WrongKeysAndTypeError(Exception):
     # Methods - Auxiliary
     # /////////////////////////////////////////////////////////////////////////
 
-    def _check_keys(
-        self,
-        base: Any,
-        original: Any,
-        path: str
-    ) -> None:
+    def _customize(self) -> None:
         """
-            Recursively checks the keys in the dictionaries.
-
-            :param base: The base dictionary.
-
-            :param original: The original dictionary.
-
-            :param depth: The depth to which the validation should be
-             performed. If None, the validation is performed to the deepest
-             level of the base dictionary.
-
-            :param path: The key of the dictionary.
-        """
-        # Determine if the dictionaries are dictionaries.
-        isdict_b: bool = isinstance(base, dict)
-        isdict_o: bool = isinstance(original, dict)
-
-        dtype: Type = type(base) if self.extract and not isdict_b else base
-
-        # Edge cases.
-        if not isdict_b:
-            # Extract the types.
-            flag: bool = original is None
-            dtype_b: Union[tuple, Type] = type(base) if self.extract else base
-            dtype_o: Union[None, Type] = None if flag else type(original)
-
-            # If the types are not valid.
-            if not validate_type(original, dtype):
-                self._messages.append((
-                    f"Key: {path},",
-                    f"Error: The original object of the original dictionary "
-                    f"is not of the requested type; requested type: "
-                    f"{_get_types_name(dtype_b)}, current type: "
-                    f"{_get_types_name(dtype_o)}."
-                ))
-
-            return
-
-        if not isdict_o:
-            # The original object is a NOT a dictionary, when it should.
-            self._messages.append((
-                f"Key: {path},",
-                f"Error: The original object is a NOT dictionary when it "
-                f"should; current type: {_get_types_name(type(isdict_o))}."
-            ))
-            return
-
-        # Missing and excess keys.
-        excess: set = set(original.keys()) - set(base.keys())
-        missing: set = set(base.keys()) - set(original.keys())
+            Customizes the exception message, with the details given to the
+            constructor; i.e., the base and original dictionaries.
+        """
+        # Auxiliary variables.
+        base, original = self._details
 
-        if excess or missing:
-            self._messages.append((
-                f"Key: {path},",
-                f"Error: Missing or excess keys; missing: {missing or '{}'}, "
-                f"excess: {excess or '{}'}."
-            ))
+        # Determine if dictionaries are needed.
+        isdict_orig: bool = isinstance(original, dict)
+        isdict_base: bool = isinstance(base, dict)
 
-        # Next depth level.
-        for key in base.keys():
-            # Check if the key exits.
-            if key not in original:
-                continue
+        # Format the message accordingly.
+        if isdict_orig and isdict_base:
+            self._customize_both(base, original)
 
-            # Extract the next key.
-            tkey: str = f"'{key}'" if isinstance(key, str) else f"{key}"
-            tkey = f"{path}.{tkey}" if path != "" else tkey
+        if not isdict_base:
+            self._customize_base()
 
-            # Recursive step.
-            self._check_keys(base[key], original[key], tkey)
+        if not isdict_orig:
+            self._customize_original()
 
     def _customize_base(self) -> None:
         """
@@ -419,7 +469,7 @@ class WrongKeysAndTypeError(Exception):
         )
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, message)
+        self._builder.append(message)
 
     def _customize_both(self, base: dict, original: dict) -> None:
         """
@@ -430,18 +480,21 @@ class WrongKeysAndTypeError(Exception):
 
             :param original: The original dictionary.
         """
-        # Auxiliary variables.
-        self._messages: list = []
+        # Find the mismatches, unless they were already found.
+        if self._mismatches is None:
+            self._mismatches = _get_mismatches(
+                base, original, None, False, self.extract
+            )
 
         # Check the keys.
-        self._check_keys(base, original, "'root'")
+        self._messages = _get_messages(self._mismatches, self.extract, False)
 
         # Format the final message.
         self._messages = [" ".join(x) for x in self._messages]
         fmessage = "\nErrors:" + "\n- " + "\n- ".join(self._messages)
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, fmessage)
+        self._builder.append(fmessage)
 
     def _customize_original(self) -> None:
         """
@@ -456,29 +509,7 @@ class WrongKeysAndTypeError(Exception):
         )
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, message)
-
-    def _set_message(self, base: Any, original: Any) -> None:
-        """
-            Sets the message properly.
-
-            :param base: The base dictionary.
-
-            :param original: The original dictionary.
-        """
-        # Determine if dictionaries are needed.
-        isdict_orig: bool = isinstance(original, dict)
-        isdict_base: bool = isinstance(base, dict)
-
-        # Format the message accordingly.
-        if isdict_orig and isdict_base:
-            self._customize_both(base, original)
-
-        if not isdict_base:
-            self._customize_base()
-
-        if not isdict_orig:
-            self._customize_original()
+        self._builder.append(message)
 
     def _validate_extract(self) -> None:
         """
@@ -497,12 +528,15 @@ class WrongKeysAndTypeError(Exception):
     # Constructor
     # /////////////////////////////////////////////////////////////////////////
 
+    # pylint: disable-next=too-many-arguments
     def __init__(
         self,
         message: Union[None, str] = None,
         base: Union[dict, None] = None,
         original: Union[dict, None] = None,
         extract: bool = False,
+        *,
+        mismatches: Union[list, None] = None
     ):
         """
             Initializes the exception.
@@ -516,24 +550,29 @@ class WrongKeysAndTypeError(Exception):
             :param extract: A boolean flag indicating whether the data type of
              the base dictionary must be extracted rather than directly used.
              True, if the data type must be extracted; False, otherwise.
+
+            :param mismatches: The list with the mismatches between the
+             dictionaries, as found by the validation functions; if given, the
+             dictionaries are not traversed again. None, by default.
         """
         # Auxiliary variables.
         default: str = WrongKeysAndTypeError.DEFAULT
 
         # Extract the parameters.
         self.extract: bool = extract
-        self.message: str = default if message is None else message
         self._messages: list = []
+        self._mismatches: Union[list, None] = mismatches
 
         # Validate the parameters before continuing.
         self._validate_extract()
-        self._set_message(base, original)
 
-        # Call the parent constructor.
-        super().__init__(self.message)
+        # Call the parent constructor; the message is rendered lazily.
+        super().__init__(
+            default if message is None else message, (base, original)
+        )
 
 
-class WrongKeysSubsetError(Exception):
+class WrongKeysSubsetError(LazyMessageError):
     """
         Exception raised when a dictionary is NOT a subset of a base
         dictionary, in relation to the keys.
@@ -546,6 +585,9 @@ class WrongKeysSubsetError(Exception):
         - self.message: The custom message, if any.
 
         - self._messages: A list with the error messages.
+
+        - self._mismatches: A list with the mismatches between the
+          dictionaries; None, until they are found.
     """
     # /////////////////////////////////////////////////////////////////////////
     # Class Variables
@@ -557,83 +599,31 @@ class WrongKeysSubsetError(Exception):
     # Methods - Auxiliary
     # /////////////////////////////////////////////////////////////////////////
 
-    def _check_keys(
-        self,
-        base: Any,
-        original: Any,
-        depth: int,
-        path: str
-    ) -> None:
+    def _customize(self) -> None:
         """
-            Recursively checks the keys in the dictionaries.
-
-            :param base: The base dictionary.
-
-            :param original: The original dictionary.
-
-            :param depth: The depth to which the validation should be
-             performed. If None, the validation is performed to the deepest
-             level of the base dictionary.
-
-            :param path: The key of the dictionary.
+            Customizes the exception message, with the details given to the
+            constructor; i.e., the base and original dictionaries.
         """
-        # Maximum depth reached.
-        flag: bool = self.depth is not None
-
-        if flag and self.depth != -1 and depth > self.depth:
-            return
-
-        # Determine if the dictionaries are dictionaries.
-        isdict_b: bool = isinstance(base, dict)
-        isdict_o: bool = isinstance(original, dict)
-
-        # Edge cases.
-        if not (isdict_b or isdict_o):
-            # Neither one is a dictionary, comparison has succeeded.
-            return
-
-        if not isdict_b and isdict_o:
-            # The original object is a dictionary, when it shouldn't.
-            self._messages.append((
-                f"Depth: {depth},",
-                f"Key: {path},",
-                "Error: The original object is a dictionary at this depth and "
-                "key when it should not be."
-            ))
-            return
+        # Auxiliary variables.
+        base, original = self._details
 
-        if isdict_b and not isdict_o:
-            # The original object is NOT a dictionary, when it should be.
-            self._messages.append((
-                f"Depth: {depth},",
-                f"Key: {path},",
-                "Error: The original object is NOT a dictionary at this depth "
-                "and key when it should be."
-            ))
+        # No need to set the message.
+        if self.depth is None:
             return
 
-        # Excess keys.
-        excess: set = set(original.keys()) - set(base.keys())
-
-        if excess:
-            self._messages.append((
-                f"Depth: {depth},",
-                f"Key: {path},",
-                f"Error: Excess keys: {excess or '{}'}."
-            ))
+        # Determine if dictionaries are needed.
+        isdict_orig: bool = isinstance(original, dict)
+        isdict_base: bool = isinstance(base, dict)
 
-        # Next depth level.
-        for key in base.keys():
-            # Check if the key exits.
-            if key not in original:
-                continue
+        # Format the message accordingly.
+        if isdict_orig and isdict_base:
+            self._customize_both(base, original)
 
-            # Extract the next key.
-            tkey: str = f"'{key}'" if isinstance(key, str) else f"{key}"
-            tkey = f"{path}.{tkey}" if path != "" else tkey
+        if not isdict_base:
+            self._customize_base()
 
-            # Recursive step.
-            self._check_keys(base[key], original[key], depth + 1, tkey)
+        if not isdict_orig:
+            self._customize_original()
 
     def _customize_base(self) -> None:
         """
@@ -648,7 +638,7 @@ class WrongKeysSubsetError(Exception):
         )
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, message)
+        self._builder.append(message)
 
     def _customize_both(self, base: dict, original: dict) -> None:
         """
@@ -659,18 +649,21 @@ class WrongKeysSubsetError(Exception):
 
             :param original: The original dictionary.
         """
-        # Auxiliary variables.
-        self._messages: list = []
+        # Find the mismatches, unless they were already found.
+        if self._mismatches is None:
+            self._mismatches = _get_mismatches(
+                base, original, self.depth, True, None
+            )
 
         # Check the keys.
-        self._check_keys(base, original, 0, "'root'")
+        self._messages = _get_messages(self._mismatches, None, True)
 
         # Format the final message.
         self._messages = [" ".join(x) for x in self._messages]
         fmessage = "\nErrors:" + "\n- " + "\n- ".join(self._messages)
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, fmessage)
+        self._builder.append(fmessage)
 
     def _customize_original(self) -> None:
         """
@@ -685,33 +678,7 @@ class WrongKeysSubsetError(Exception):
         )
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, message)
-
-    def _set_message(self, base: Any, original: Any) -> None:
-        """
-            Sets the message properly.
-
-            :param base: The base dictionary.
-
-            :param original: The original dictionary.
-        """
-        # No need to set the message.
-        if self.depth is None:
-            return
-
-        # Determine if dictionaries are needed.
-        isdict_orig: bool = isinstance(original, dict)
-        isdict_base: bool = isinstance(base, dict)
-
-        # Format the message accordingly.
-        if isdict_orig and isdict_base:
-            self._customize_both(base, original)
-
-        if not isdict_base:
-            self._customize_base()
-
-        if not isdict_orig:
-            self._customize_original()
+        self._builder.append(message)
 
     def _validate_depth(self) -> None:
         """
@@ -739,12 +706,15 @@ class WrongKeysSubsetError(Exception):
     # Constructor
     # /////////////////////////////////////////////////////////////////////////
 
+    # pylint: disable-next=too-many-arguments
     def __init__(
         self,
         message: Union[None, str] = None,
         base: Union[dict, None] = None,
         original: Union[dict, None] = None,
-        depth: Union[int, None] = None
+        depth: Union[int, None] = None,
+        *,
+        mismatches: Union[list, None] = None
     ):
         """
             Initializes the exception.
@@ -757,24 +727,29 @@ class WrongKeysSubsetError(Exception):
 
             :param depth: The depth to which the validation should be
              performed. If None, the validation is NOT performed.
+
+            :param mismatches: The list with the mismatches between the
+             dictionaries, as found by the validation functions; if given, the
+             dictionaries are not traversed again. None, by default.
         """
         # Auxiliary variables.
         default: str = WrongKeysSubsetError.DEFAULT
 
         # Extract the parameters.
         self.depth: Union[int, None] = depth
-        self.message: str = default if message is None else message
         self._messages: list = []
+        self._mismatches: Union[list, None] = mismatches
 
         # Validate the parameters before continuing.
         self._validate_depth()
-        self._set_message(base, original)
 
-        # Call the parent constructor.
-        super().__init__(self.message)
+        # Call the parent constructor; the message is rendered lazily.
+        super().__init__(
+            default if message is None else message, (base, original)
+        )
 
 
-class WrongKeysSubsetAndTypeError(Exception):
+class WrongKeysSubsetAndTypeError(LazyMessageError):
     """
         Exception raised when a dictionary is NOT a subset of a base
         dictionary, in relation to the keys, and the types at the branches of
@@ -790,6 +765,9 @@ class WrongKeysSubsetAndTypeError(Exception):
         - self.message: The custom message, if any.
 
         - self._messages: A list with the error messages.
+
+        - self._mismatches: A list with the mismatches between the
+          dictionaries; None, until they are found.
     """
     # /////////////////////////////////////////////////////////////////////////
     # Class Variables
@@ -804,80 +782,27 @@ class WrongKeysSubsetAndTypeError(Exception):
     # Methods - Auxiliary
     # /////////////////////////////////////////////////////////////////////////
 
-    def _check_keys(
-        self,
-        base: Any,
-        original: Any,
-        path: str
-    ) -> None:
+    def _customize(self) -> None:
         """
-            Recursively checks the keys in the dictionaries.
-
-            :param base: The base dictionary.
-
-            :param original: The original dictionary.
-
-            :param depth: The depth to which the validation should be
-             performed. If None, the validation is performed to the deepest
-             level of the base dictionary.
-
-            :param path: The key of the dictionary.
-        """
-        # Determine if the dictionaries are dictionaries.
-        isdict_b: bool = isinstance(base, dict)
-        isdict_o: bool = isinstance(original, dict)
-
-        dtype: Type = type(base) if not isdict_b and self.extract else base
-
-        # Edge cases.
-        if not isdict_b:
-            # Extract the types.
-            flag: bool = original is None
-            dtype_b: Union[tuple, Type] = type(base) if self.extract else base
-            dtype_o: Union[None, Type] = None if flag else type(original)
-
-            # If the types are not valid.
-            if not validate_type(original, dtype):
-                self._messages.append((
-                    f"Key: {path},",
-                    f"Error: The original object of the original dictionary "
-                    f"is not of the requested type; requested type: "
-                    f"{_get_types_name(dtype_b)}, current type: "
-                    f"{_get_types_name(dtype_o)}."
-                ))
-
-            return
-
-        if not isdict_o:
-            # The original object is a NOT a dictionary, when it should.
-            self._messages.append((
-                f"Key: {path},",
-                f"Error: The original object is a NOT dictionary when it "
-                f"should; current type: {_get_types_name(type(isdict_o))}."
-            ))
-            return
-
-        # Excess keys.
-        excess: set = set(original.keys()) - set(base.keys())
+            Customizes the exception message, with the details given to the
+            constructor; i.e., the base and original dictionaries.
+        """
+        # Auxiliary variables.
+        base, original = self._details
 
-        if excess:
-            self._messages.append((
-                f"Key: {path},",
-                f"Error: Excess keys: {excess or '{}'}."
-            ))
+        # Determine if dictionaries are needed.
+        isdict_orig: bool = isinstance(original, dict)
+        isdict_base: bool = isinstance(base, dict)
 
-        # Next depth level.
-        for key in base.keys():
-            # Check if the key exits.
-            if key not in original:
-                continue
+        # Format the message accordingly.
+        if isdict_orig and isdict_base:
+            self._customize_both(base, original)
 
-            # Extract the next key.
-            tkey: str = f"'{key}'" if isinstance(key, str) else f"{key}"
-            tkey = f"{path}.{tkey}" if path != "" else tkey
+        if not isdict_base:
+            self._customize_base()
 
-            # Recursive step.
-            self._check_keys(base[key], original[key], tkey)
+        if not isdict_orig:
+            self._customize_original()
 
     def _customize_base(self) -> None:
         """
@@ -892,7 +817,7 @@ class WrongKeysSubsetAndTypeError(Exception):
         )
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, message)
+        self._builder.append(message)
 
     def _customize_both(self, base: dict, original: dict) -> None:
         """
@@ -903,18 +828,21 @@ class WrongKeysSubsetAndTypeError(Exception):
 
             :param original: The original dictionary.
         """
-        # Auxiliary variables.
-        self._messages: list = []
+        # Find the mismatches, unless they were already found.
+        if self._mismatches is None:
+            self._mismatches = _get_mismatches(
+                base, original, None, True, self.extract
+            )
 
         # Check the keys.
-        self._check_keys(base, original, "'root'")
+        self._messages = _get_messages(self._mismatches, self.extract, True)
 
         # Format the final message.
         self._messages = [" ".join(x) for x in self._messages]
         fmessage = "\nErrors:" + "\n- " + "\n- ".join(self._messages)
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, fmessage)
+        self._builder.append(fmessage)
 
     def _customize_original(self) -> None:
         """
@@ -929,29 +857,7 @@ class WrongKeysSubsetAndTypeError(Exception):
         )
 
         # Concatenate the messages.
-        self.message = ustrings.messages_concat(self.message, message)
-
-    def _set_message(self, base: Any, original: Any) -> None:
-        """
-            Sets the message properly.
-
-            :param base: The base dictionary.
-
-            :param original: The original dictionary.
-        """
-        # Determine if dictionaries are needed.
-        isdict_orig: bool = isinstance(original, dict)
-        isdict_base: bool = isinstance(base, dict)
-
-        # Format the message accordingly.
-        if isdict_orig and isdict_base:
-            self._customize_both(base, original)
-
-        if not isdict_base:
-            self._customize_base()
-
-        if not isdict_orig:
-            self._customize_original()
+        self._builder.append(message)
 
     def _validate_extract(self) -> None:
         """
@@ -970,12 +876,15 @@ class WrongKeysSubsetAndTypeError(Exception):
     # Constructor
     # /////////////////////////////////////////////////////////////////////////
 
+    # pylint: disable-next=too-many-arguments
     def __init__(
         self,
         message: Union[None, str] = None,
         base: Union[dict, None] = None,
         original: Union[dict, None] = None,
-        extract: bool = False
+        extract: bool = False,
+        *,
+        mismatches: Union[list, None] = None
     ):
         """
             Initializes the exception.
@@ -986,21 +895,26 @@ class WrongKeysSubsetAndTypeError(Exception):
 
             :param original: The original dictionary.
 
-        - self.extract: A boolean flag indicating whether the data type of the
-          base dictionary must be extracted rather than directly used. True, if
-          the data type must be extracted; False, otherwise.
+            :param extract: A boolean flag indicating whether the data type of
+             the base dictionary must be extracted rather than directly used.
+             True, if the data type must be extracted; False, otherwise.
+
+            :param mismatches: The list with the mismatches between the
+             dictionaries, as found by the validation functions; if given, the
+             dictionaries are not traversed again. None, by default.
         """
         # Auxiliary variables.
         default: str = WrongKeysSubsetAndTypeError.DEFAULT
 
         # Extract the parameters.
         self.extract: bool = extract
-        self.message: str = default if message is None else message
         self._messages: list = []
+        self._mismatches: Union[list, None] = mismatches
 
         # Validate the parameters before continuing.
         self._validate_extract()
-        self._set_message(base, original)
 
-        # Call the parent constructor.
-        super().__init__(self.message)
+        # Call the parent constructor; the message is rendered lazily.
+        super().__init__(
+            default if message is None else message, (base, original)
+        )
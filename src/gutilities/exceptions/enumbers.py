@@ -9,11 +9,42 @@
 
 
 # Standard Library.
+from itertools import islice
 from numbers import Real
-from typing import Union
+from typing import Sequence, Union
 
 # User.
-from gutilities.general.gstrings import messages_concat
+from gutilities.exceptions.ebase import LazyMessageError
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _get_indices(indices: Union[None, Sequence[int]], shown: int) -> str:
+    """
+        Gets the message with the number of offending values and their
+        indices; only the first indices are shown.
+
+        :param indices: The sequence with the indices of the offending values;
+         None, if the value is a scalar.
+
+        :param shown: The maximum number of indices to be shown.
+
+        :return: The message with the count and the indices; an empty string,
+         if there are no indices.
+    """
+    # No indices to show.
+    if indices is None:
+        return ""
+
+    # Auxiliary variables.
+    count: int = len(indices)
+    sample: str = ", ".join(str(index) for index in islice(indices, shown))
+    sample += ", ..." if count > shown else ""
+
+    return f"Offending values: {count}, at the indices: [{sample}]. "
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -21,7 +52,7 @@ from gutilities.general.gstrings import messages_concat
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
-class AboveBelowBoundError(Exception):
+class AboveBelowBoundError(LazyMessageError):
     """
         Exception raised when a number is above or below the expected bound;
         i.e., the opposite bound to the one provided as a parameter is an
@@ -30,6 +61,12 @@ class AboveBelowBoundError(Exception):
         PARAMETERS:
         ___________
 
+        - self.count: The number of offending values; None, if the value is a
+          scalar.
+
+        - self.indices: The sequence with the indices of the offending values;
+          None, if the value is a scalar.
+
         - self.message: The custom message, if any.
     """
     # /////////////////////////////////////////////////////////////////////////
@@ -38,34 +75,19 @@ class AboveBelowBoundError(Exception):
 
     DEFAULT: str = "The value is not in the expected range."
 
+    SHOWN: int = 10
+
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Auxiliary
     # /////////////////////////////////////////////////////////////////////////
 
-    def _customize(
-        self,
-        value: Union[None, Real] = None,
-        bound: Union[None, Real] = None,
-        include: bool = False,
-        greater: bool = True
-    ) -> None:
+    def _customize(self) -> None:
         """
-            Customizes the exception message.
-
-            :param value: The value that was not above/below the type.
-
-            :param bound: The lower bound of the value; non-inclusive by
-            default.
-
-            :param include: A boolean flag indicating if the lower bound is
-             inclusive. True, if inclusive; False, if non-inclusive. False by
-             default.
-
-            :param greater: A boolean flag indicating if the value should be
-             greater than the bound. True, if greater; False, if less.
-             True by default.
+            Customizes the exception message, with the details given to the
+            constructor.
         """
         # Auxiliary variables.
+        value, bound, include, greater, indices = self._details
         gmessage: str = "greater than" if greater else "less than"
         imessage: str = ", or equal to," if include else ""
 
@@ -76,20 +98,24 @@ class AboveBelowBoundError(Exception):
         ) if value is not None else ""
 
         message += f"The bound is {bound}. " if bound is not None else ""
+        message += _get_indices(indices, self.SHOWN)
 
         # Set the final message.
-        self.message = messages_concat(self.message, message.strip())
+        self._builder.append(message.strip())
 
     # /////////////////////////////////////////////////////////////////////////
     # Constructor
     # /////////////////////////////////////////////////////////////////////////
 
+    # pylint: disable-next=too-many-arguments
     def __init__(
         self,
         message: Union[None, str] = None,
         value: Union[None, Real] = None,
         bound: Union[None, Real] = None,
-        include_greater: tuple[bool, bool] = (False, True)
+        include_greater: tuple[bool, bool] = (False, True),
+        *,
+        indices: Union[None, Sequence[int]] = None
     ):
         """
             Constructor for the exception.
@@ -107,25 +133,41 @@ class AboveBelowBoundError(Exception):
              default. The second entry is a boolean flag indicating if the
              value should be greater than the bound. True, if greater, False,
              if less; False by default.
+
+            :param indices: The sequence with the indices of the offending
+             values, when an array of values was validated; None, if the value
+             is a scalar. In the former case, the value is the first offending
+             value.
         """
         # Auxiliary variables.
         default: str = AboveBelowBoundError.DEFAULT
 
-        # Set the message.
-        self.message: str = default if message is None else message
-        self._customize(value, bound, include_greater[0], include_greater[1])
+        # The offending values.
+        self.count: Union[None, int] = (
+            None if indices is None else len(indices)
+        )
+        self.indices: Union[None, Sequence[int]] = indices
 
-        # Call the parent constructor.
-        super().__init__(self.message)
+        # Call the parent constructor; the message is rendered lazily.
+        super().__init__(
+            default if message is None else message,
+            (value, bound, include_greater[0], include_greater[1], indices)
+        )
 
 
-class NotInRangeError(Exception):
+class NotInRangeError(LazyMessageError):
     """
         Exception raised when a number is not in the expected range.
 
         PARAMETERS:
         ___________
 
+        - self.count: The number of offending values; None, if the value is a
+          scalar.
+
+        - self.indices: The sequence with the indices of the offending values;
+          None, if the value is a scalar.
+
         - self.message: The custom message, if any.
     """
     # /////////////////////////////////////////////////////////////////////////
@@ -134,26 +176,19 @@ class NotInRangeError(Exception):
 
     DEFAULT: str = "The value is not in the expected range."
 
+    SHOWN: int = 10
+
     # /////////////////////////////////////////////////////////////////////////
     # Methods - Auxiliary
     # /////////////////////////////////////////////////////////////////////////
 
-    def _customize(
-        self,
-        value: Union[None, Real] = None,
-        vrange: Union[None, tuple[Real, Real]] = None,
-        include: Union[None, tuple[bool, bool]] = None
-    ) -> None:
+    def _customize(self) -> None:
         """
-            Customizes the exception message.
-
-            :param value: The value that was not of the expected type.
-
-            :param vrange: The expected range of the value.
-
-            :param include: Whether the range includes the limits.
+            Customizes the exception message, with the details given to the
+            constructor.
         """
         # Auxiliary variables.
+        value, vrange, include, indices = self._details
         message: str = ""
 
         # Set the value.
@@ -164,21 +199,26 @@ class NotInRangeError(Exception):
             message += f"Expected range: {tuple(vrange)}. "
 
         if include is not None:
-            message += f"Included (lower, upper)? {tuple(include)}."
+            message += f"Included (lower, upper)? {tuple(include)}. "
+
+        message += _get_indices(indices, self.SHOWN)
 
         # Set the final message.
-        self.message = messages_concat(self.message, message.strip())
+        self._builder.append(message.strip())
 
     # /////////////////////////////////////////////////////////////////////////
     # Constructor
     # /////////////////////////////////////////////////////////////////////////
 
+    # pylint: disable-next=too-many-arguments
     def __init__(
         self,
         message: Union[None, str] = None,
         value: Union[None, Real] = None,
         vrange: Union[None, tuple[Real, Real]] = None,
-        include: Union[None, tuple[bool, bool]] = None
+        include: Union[None, tuple[bool, bool]] = None,
+        *,
+        indices: Union[None, Sequence[int]] = None
     ):
         """
             Constructor for the exception.
@@ -190,13 +230,23 @@ class NotInRangeError(Exception):
             :param vrange: The expected range of the value.
 
             :param include: Whether the range includes the limits.
+
+            :param indices: The sequence with the indices of the offending
+             values, when an array of values was validated; None, if the value
+             is a scalar. In the former case, the value is the first offending
+             value.
         """
         # Auxiliary variables.
         default: str = NotInRangeError.DEFAULT
 
-        # Set the message.
-        self.message: str = default if message is None else message
-        self._customize(value, vrange, include)
-
-        # Call the parent constructor.
-        super().__init__(self.message)
+        # The offending values.
+        self.count: Union[None, int] = (
+            None if indices is None else len(indices)
+        )
+        self.indices: Union[None, Sequence[int]] = indices
+
+        # Call the parent constructor; the message is rendered lazily.
+        super().__init__(
+            default if message is None else message,
+            (value, vrange, include, indices)
+        )
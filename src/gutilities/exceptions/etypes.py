@@ -9,10 +9,10 @@
 
 
 # Standard Library.
-from typing import Any, Type, Union
+from typing import Any, Union
 
 # User.
-import gutilities.general.gstrings as ustrings
+from gutilities.exceptions.ebase import LazyMessageError
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -20,7 +20,7 @@ import gutilities.general.gstrings as ustrings
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
-class WrongTypeError(Exception):
+class WrongTypeError(LazyMessageError):
     """
         Exception raised when the value is not of the expected type.
 
@@ -39,15 +39,13 @@ class WrongTypeError(Exception):
     # Methods - Auxiliary
     # /////////////////////////////////////////////////////////////////////////
 
-    def _customize(self, value: Any, vtype: Type) -> None:
+    def _customize(self) -> None:
         """
-            Customizes the exception message.
-
-            :param value: The value that was not of the expected type.
-
-            :param vtype: The expected type of the value.
+            Customizes the exception message, with the details given to the
+            constructor.
         """
         # Auxiliary variables.
+        value, vtype = self._details
         message: str = ""
 
         # Set the value.
@@ -58,7 +56,7 @@ class WrongTypeError(Exception):
             message += f"Expected type: \"{vtype.__name__}\"."
 
         # Set the final message.
-        self.message = ustrings.messages_concat(self.message, message.strip())
+        self._builder.append(message.strip())
 
     # /////////////////////////////////////////////////////////////////////////
     # Constructor
@@ -82,9 +80,7 @@ class WrongTypeError(Exception):
         # Auxiliary variables.
         default: str = WrongTypeError.DEFAULT
 
-        # Set the message.
-        self.message: str = default if message is None else message
-        self._customize(value, vtype)
-
-        # Call the parent constructor.
-        super().__init__(self.message)
+        # Call the parent constructor; the message is rendered lazily.
+        super().__init__(
+            default if message is None else message, (value, vtype)
+        )
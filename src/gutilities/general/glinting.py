@@ -9,157 +9,2047 @@
 
 
 # Standard Library.
+import ast
+import configparser
+import fnmatch
+import hashlib
+import io
+import json
+import os
+import re
+import socket
+import sys
+import tempfile
+import tomllib
+
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import redirect_stdout, redirect_stderr
+from functools import partial
+from importlib.metadata import entry_points, packages_distributions, version
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Callable, Union
+from typing import Any, Callable, Iterator, TextIO, Union
+
+# Third party.
+import flake8.api.legacy as flake8
+
+from astroid import MANAGER
+from astroid.inference_tip import clear_inference_tip_cache
+from flake8.formatting.base import BaseFormatter
+from flake8.main.options import JobsArgument
+from flake8.violation import Violation
+from pylint.checkers.clear_lru_cache import clear_lru_caches
+from pylint.config import find_default_config_files
+from pylint.lint import PyLinter, Run, load_results, save_results
+from pylint.message import Message
+from pylint.reporters.base_reporter import BaseReporter
+from pylint.reporters.text import TextReporter
+from pylint.reporters.ureports.nodes import BaseLayout, EvaluationSection
+from pylint.utils import LinterStats
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Maximum size of the lint cache, in bytes; the least recently used entries
+# are evicted beyond it.
+CACHE_SIZE: int = 64 << 20
+
+# Pylint checks across files; i.e., their messages depend on all the linted
+# files, so they are NOT linted with the others; see _lint_pylint.
+CROSS_CHECKS: tuple = ("cyclic-import", "duplicate-code")
+
+# Linting engines, and their names for the user.
+ENGINES: dict = {"flake8": "Flake8", "pylint": "Pylint"}
+
+# Globs of the names of the files and directories that are NOT discovered;
+# the directories are pruned, i.e., never walked.
+EXCLUDES: tuple = (
+    "__pycache__", "*.egg-info", ".eggs", ".git", ".hg", ".mypy_cache", ".nox",
+    ".pytest_cache", ".svn", ".tox", ".venv", "node_modules", "venv"
+)
+
+# Options of the Flake8 style guide.
+FLAKE8: dict = {
+    "format": "pylint",
+    "ignore": [],
+    "isolated": True,
+    "select": ["E", "W", "F", "C"]
+}
+
+# Number of records written between flushes, in the NDJSON output.
+FLUSH: int = 1_000
+
+# Output formats of the results, and the suffixes of their files.
+OUTPUTS: dict = {"ndjson": ".ndjson", "text": ".txt"}
+
+# Path of the Unix socket of the Pylint daemon, per user; in the runtime
+# directory of the user, if any. See serve_pylint.
+SOCKET: str = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR", "") or tempfile.gettempdir(),
+    f"gutilities_pylint_{os.getuid() if hasattr(os, 'getuid') else 0}.sock"
+)
+
+# Seconds to wait for the request of a client, and for the connection with
+# the daemon; and for its reply, i.e., while it lints the files of other
+# clients and those of the request. See serve_pylint.
+TIMEOUT: float = 5.0
+TIMEOUT_REPLY: float = 600.0
+
+# Statistics of Pylint used to evaluate the code.
+STATISTICS: tuple = (
+    "convention", "error", "fatal", "info", "refactor", "statement", "warning"
+)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Auxiliary
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _cache_entries(
+    function: Callable, digests: dict, directory: Path, fingerprint: str
+) -> dict:
+    """
+        Gets the lint entries of the files from the cache; only the files that
+        are NOT in the cache are linted, and their entries are saved.
+
+        :param function: The function that lints a list of files; it returns
+         the dictionary with the entry of each file.
+
+        :param digests: The dictionary with the digest of the content of each
+         file to be linted; see _get_digests.
+
+        :param directory: The path of the directory of the cache.
+
+        :param fingerprint: The fingerprint of the linter and its
+         configuration.
+
+        :return: The dictionary with the entry of each file.
+    """
+    # Auxiliary variables.
+    keys: dict = {
+        x: _get_cache_key(x, y, fingerprint) for x, y in digests.items()
+    }
+    entries: dict = {}
+
+    directory.mkdir(parents=True, exist_ok=True)
+
+    # Load the cached entries; the used ones are the most recent.
+    for file, key in keys.items():
+        try:
+            entries[file] = json.loads(
+                (directory / f"{key}.json").read_text(encoding="utf-8")
+            )
+            os.utime(directory / f"{key}.json")
+
+        except (OSError, ValueError):
+            continue
+
+    # Lint the missing ones and save them.
+    missing: list = [x for x in digests if x not in entries]
+
+    if len(missing) > 0:
+        for file, entry in function(missing).items():
+            # Atomically, other runs may share the cache.
+            temporary: Path = directory / f"{keys[file]}.{os.getpid()}.tmp"
+            temporary.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(temporary, directory / f"{keys[file]}.json")
+
+            entries[file] = entry
+
+        _cache_evict(directory)
+
+    return entries
+
+
+def _cache_evict(directory: Path) -> None:
+    """
+        Evicts the least recently used entries of the cache, until its size is
+        NOT greater than CACHE_SIZE.
+
+        :param directory: The path of the directory of the cache.
+    """
+    # Auxiliary variables.
+    entries: list = []
+
+    for file in directory.glob("*.json"):
+        try:
+            entries.append((file.stat(), file))
+
+        except OSError:
+            continue
+
+    size: int = sum(x.st_size for x, _ in entries)
+
+    # Oldest first.
+    for stat, file in sorted(entries, key=lambda x: x[0].st_mtime):
+        if size <= CACHE_SIZE:
+            break
+
+        file.unlink(missing_ok=True)
+        size -= stat.st_size
+
+
+def _daemon_lint(request: dict, stamps: dict) -> dict:
+    """
+        Lints the files of the request with Pylint, in the directory of the
+        client; the modules of astroid whose files changed are evicted before
+        and after linting, so the rest of them stay warm.
+
+        :param request: The dictionary with the request; i.e., the directory
+         of the client, and the arguments of lint_pylint.
+
+        :param stamps: The dictionary with the stamp of the file of each
+         module of astroid; see _daemon_refresh.
+
+        :return: The dictionary with the reply; i.e., the message to the user,
+         and the type and message of the error, if any.
+    """
+    # Auxiliary variables.
+    cwd: str = os.getcwd()
+    reply: dict = {"error": "", "output": "", "type": ""}
+    stream: io.StringIO = io.StringIO()
+
+    try:
+        os.chdir(request["cwd"])
+        _daemon_refresh(stamps)
+
+        with redirect_stdout(stream):
+            lint_pylint(*request["args"], **request["kwargs"])
+
+        _daemon_refresh(stamps)
+
+    # The daemon must keep serving.
+    # pylint: disable-next=broad-exception-caught
+    except Exception as error:
+        reply["error"] = f"{error}"
+        reply["type"] = type(error).__name__
+
+    finally:
+        os.chdir(cwd)
+
+    reply["output"] = stream.getvalue()
+
+    return reply
+
+
+def _daemon_refresh(stamps: dict) -> None:
+    """
+        Evicts the modules of astroid whose files changed; i.e., whose
+        modification time or size is NOT the stamp of the file when the module
+        was first seen. The import caches are cleared too, so the new files
+        are found; and, if any module is evicted, the inference caches of
+        astroid and Pylint, since they may refer to it. If the private caches
+        of astroid are NOT available (e.g., in a newer version), all the
+        modules are evicted.
+
+        :param stamps: The dictionary with the stamp of the file of each
+         module of astroid; it is updated.
+    """
+    # Auxiliary variables.
+    changed: bool = False
+
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        from astroid.context import _invalidate_cache
+
+        # pylint: disable-next=protected-access
+        lookups: dict = MANAGER._mod_file_cache
+
+    except (AttributeError, ImportError):
+        MANAGER.clear_cache()
+        stamps.clear()
+        return
+
+    for name, module in list(MANAGER.astroid_cache.items()):
+        # Built-in modules do NOT have a file.
+        if module.file is None:
+            continue
+
+        try:
+            status: os.stat_result = os.stat(module.file)
+            stamp: Union[None, tuple] = (status.st_mtime_ns, status.st_size)
+
+        except OSError:
+            stamp = None
+
+        if stamps.setdefault(module.file, stamp) != stamp:
+            del MANAGER.astroid_cache[name]
+            del stamps[module.file]
+            changed = True
+
+    # The lookups of the modules are cheap; new files must be found.
+    lookups.clear()
+
+    if changed:
+        _invalidate_cache()
+        clear_inference_tip_cache()
+        clear_lru_caches()
+
+
+def _daemon_request(address: str, request: dict) -> dict:
+    """
+        Sends the request to the Pylint daemon, and waits for its reply; see
+        serve_pylint.
+
+        :param address: The path of the Unix socket of the daemon.
+
+        :param request: The dictionary with the request.
+
+        :return: The dictionary with the reply.
+
+        :raise OSError: If the daemon is NOT reachable, or the socket is NOT
+         owned by the user; or if it does NOT reply in time (see TIMEOUT and
+         TIMEOUT_REPLY).
+    """
+    # Only the daemons of the user; the requests load its configuration.
+    if hasattr(os, "getuid") and os.stat(address).st_uid != os.getuid():
+        raise PermissionError(
+            f"The socket is NOT owned by the user: {address}"
+        )
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(TIMEOUT)
+        client.connect(address)
+
+        with client.makefile("rwb") as stream:
+            stream.write(f"{json.dumps(request)}\n".encode())
+            stream.flush()
+
+            # The daemon may be linting.
+            client.settimeout(TIMEOUT_REPLY)
+
+            return json.loads(stream.readline() or "{}")
+
+
+def _daemon_serve(connection: socket.socket, stamps: dict) -> bool:
+    """
+        Serves the request of the connection; see serve_pylint.
+
+        :param connection: The connection with the client.
+
+        :param stamps: The dictionary with the stamp of the file of each
+         module of astroid; see _daemon_refresh.
+
+        :return: A boolean value indicating if the daemon must stop. True, if
+         it must stop; False, otherwise.
+
+        :raise OSError: If the connection fails; e.g., the client is gone, or
+         it does NOT send the request in time (see TIMEOUT).
+
+        :raise ValueError: If the request is NOT a JSON object.
+    """
+    # The idle clients must NOT block the daemon.
+    connection.settimeout(TIMEOUT)
+
+    with connection, connection.makefile("rwb") as stream:
+        # Empty requests only check the daemon.
+        request: Any = json.loads(stream.readline() or "{}")
+
+        if not isinstance(request, dict):
+            raise ValueError(f"The request must be a JSON object: {request}")
+
+        reply: dict = (
+            _daemon_lint(request, stamps) if "args" in request else {}
+        )
+
+        stream.write(f"{json.dumps(reply)}\n".encode())
+        stream.flush()
+
+    return request.get("stop", False) is True
+
+
+def _get_cache_key(file: str, digest: str, fingerprint: str) -> str:
+    """
+        Gets the key of the file in the cache; from the fingerprint of the
+        linter, the path of the file (i.e., it is in the messages) and the
+        digest of its content.
+
+        :param file: The path of the file.
+
+        :param digest: The digest of the content of the file.
+
+        :param fingerprint: The fingerprint of the linter and its
+         configuration.
+
+        :return: The hexadecimal digest of the key.
+    """
+    return hashlib.sha256(
+        f"{fingerprint}\0{file}\0{digest}".encode()
+    ).hexdigest()
+
+
+def _get_digests(files: list) -> dict:
+    """
+        Gets the digests of the content of the files; each file is read once,
+        whatever the number of linters that use them.
+
+        :param files: The list with the paths of the files.
+
+        :return: The dictionary with the hexadecimal digest of each file, in
+         the same order.
+    """
+    return {x: hashlib.sha256(Path(x).read_bytes()).hexdigest() for x in files}
+
+
+def _get_files(
+    items: Union[list, tuple],
+    recursive: bool,
+    excludes: Union[list, tuple] = EXCLUDES,
+    gitignore: bool = True
+) -> list:
+    """
+        Gets the python files to be linted.
+
+        :param items: The list or tuple with the objects to be linted; all
+         the objects must be strings, and must represent paths.
+
+        :param recursive: A boolean flag indicating whether the files must be
+         recursively checked, in the case that a directory is passed. True,
+         if directories must be recursively linted; False, otherwise.
+
+        :param excludes: The list or tuple with the globs of the names of the
+         files and directories that are NOT discovered.
+
+        :param gitignore: A boolean flag indicating whether the .gitignore
+         files are honored. True, if the ignored files are NOT discovered;
+         False, otherwise.
+
+        :return: The list with the paths of the files, sorted without case.
+    """
+    return sorted(
+        set(_iter_files(items, recursive, excludes, gitignore)),
+        key=lambda x: x.lower()
+    )
+
+
+def _get_fingerprint(isflake: bool) -> str:
+    """
+        Gets the fingerprint of the linter and its configuration; i.e., the
+        versions of Python, the linter and its dependencies, and the options of
+        Flake8 or the configuration files of Pylint. The plugins are included
+        too; i.e., the plugins of Flake8 registered by the installed packages
+        (e.g., mccabe), and the plugins of Pylint in the load-plugins option,
+        with the versions of their packages, or the content of their modules
+        if they are NOT installed.
+
+        :param isflake: A boolean flag indicating whether the linting engine is
+         flake8 or Pylint. True, if the linting engine is Flake8; False, if the
+         linting engine is Pylint.
+
+        :return: The fingerprint.
+    """
+    # Auxiliary variables.
+    names: tuple = (
+        ("flake8", "pycodestyle", "pyflakes") if isflake else
+        ("pylint", "astroid")
+    )
+    parts: list = [sys.version, *(f"{x} {version(x)}" for x in names)]
+
+    # The configuration and the plugins.
+    if isflake:
+        parts.append(json.dumps(FLAKE8, sort_keys=True))
+        parts.extend(sorted(
+            f"{x.group} {x.name} {x.value} {x.dist.name} {x.dist.version}"
+            for group in ("flake8.extension", "flake8.report")
+            for x in entry_points(group=group)
+        ))
+
+    else:
+        parts.extend(
+            f"{x.resolve()}\0{x.read_text(encoding='utf-8')}"
+            for x in find_default_config_files()
+        )
+        parts.extend(_get_pylint_plugins())
+
+    return "\0".join(parts)
+
+
+def _get_flake8_style_guide(
+    jobs: int, output: str = "text"
+) -> flake8.StyleGuide:
+    """
+        Gets the Flake8 style guide, with the options in FLAKE8.
+
+        :param jobs: The number of processes used to lint the files; if zero,
+         the number of processors.
+
+        :param output: The output format of the results; see OUTPUTS.
+
+        :return: The style guide.
+    """
+    # Auxiliary variables.
+    style_guide: flake8.StyleGuide = flake8.get_style_guide(
+        **FLAKE8, jobs=JobsArgument(f"{jobs or 'auto'}")
+    )
+
+    if output == "ndjson":
+        style_guide.init_report(_JSONFormatter)
+
+    return style_guide
+
+
+def _get_gitignore(directory: str) -> list:
+    """
+        Gets the rules of the .gitignore file in the directory.
+
+        :param directory: The path of the directory.
+
+        :return: The list with the rules, in order; i.e., the 3-tuples with
+         the compiled pattern, and whether the rule is negated and whether it
+         only matches directories. Empty, if there is no .gitignore file.
+    """
+    # Auxiliary variables.
+    rules: list = []
+
+    try:
+        with open(
+            os.path.join(directory, ".gitignore"), encoding="utf-8"
+        ) as stream:
+            lines: list = stream.read().splitlines()
+
+    except (OSError, UnicodeDecodeError):
+        return rules
+
+    for line in lines:
+        # Blank lines and comments.
+        line = line.rstrip()
+
+        if line in ("", "!") or line.startswith("#"):
+            continue
+
+        # Negated, and only for directories.
+        negated: bool = line.startswith("!")
+        line = line[1:] if negated else line
+        dironly: bool = line.endswith("/")
+        line = line.rstrip("/")
+
+        if line != "":
+            rules.append((_get_gitignore_regex(line), negated, dironly))
+
+    return rules
+
+
+def _get_gitignore_parents(directory: str) -> list:
+    """
+        Gets the rules of the .gitignore files of the parents of the directory,
+        up to the root of its repository; i.e., the first parent with a .git
+        entry. If the directory is NOT in a repository, or it is its root,
+        there are no rules.
+
+        :param directory: The path of the directory.
+
+        :return: The list with the 3-tuples of each parent with rules, from
+         the root of the repository; the number of characters to strip from
+         the relative paths (i.e., zero), the prefix to prepend to them (i.e.,
+         the path of the directory relative to the parent) and the rules (see
+         _get_gitignore).
+    """
+    # Auxiliary variables.
+    current: Path = Path(os.path.abspath(directory))
+    parents: list = []
+
+    if (current / ".git").exists():
+        return parents
+
+    for parent in current.parents:
+        # The rules of the parent.
+        rules: list = _get_gitignore(f"{parent}")
+
+        if len(rules) > 0:
+            parents.append(
+                (0, f"{current.relative_to(parent).as_posix()}/", rules)
+            )
+
+        # The root of the repository.
+        if (parent / ".git").exists():
+            return parents[::-1]
+
+    return []
+
+
+def _get_gitignore_regex(pattern: str) -> re.Pattern:
+    """
+        Gets the compiled regular expression of the .gitignore pattern; it
+        matches the paths relative to the directory of the .gitignore file,
+        with forward slashes. A pattern with a slash is anchored to the
+        directory; otherwise, it matches at any level.
+
+        :param pattern: The pattern; without the negation and the trailing
+         slashes.
+
+        :return: The compiled regular expression.
+    """
+    # Auxiliary variables.
+    segments: list = pattern.lstrip("/").split("/")
+    regex: str = "" if "/" in pattern else "(?:.*/)?"
+
+    for i, segment in enumerate(segments):
+        # Any number of directories, or everything inside.
+        if segment == "**":
+            regex += ".*" if i == len(segments) - 1 else "(?:[^/]*/)*"
+            continue
+
+        # A glob within the segment; the wildcards do NOT match slashes.
+        for token in re.findall(r"\\.|\[!?[^]]+\]|.", segment):
+            if token in ("*", "?"):
+                regex += "[^/]*" if token == "*" else "[^/]"
+
+            elif token.startswith("[") and len(token) > 1:
+                regex += f"[^{token[2:-1]}]" if token[1] == "!" else token
+
+            else:
+                regex += re.escape(token[-1])
+
+        regex += "" if i == len(segments) - 1 else "/"
+
+    return re.compile(regex)
+
+
+def _get_imports(files: list) -> dict:
+    """
+        Gets the files, among the given ones, imported by each file; i.e., the
+        modules, and their packages, named in its import statements (even if
+        they are NOT executed). The files that can NOT be parsed import none.
+
+        :param files: The list with the paths of the files.
+
+        :return: The dictionary with the set of files imported by each file.
+    """
+    # Auxiliary variables.
+    names: dict = {}
+    imports: dict = {x: set() for x in files}
+
+    for file in files:
+        names.setdefault(".".join(_get_module_parts(file)), set()).add(file)
+
+    for file in files:
+        try:
+            tree: ast.Module = ast.parse(Path(file).read_bytes(), file)
+
+        except (OSError, SyntaxError, ValueError):
+            continue
+
+        # The package of the relative imports.
+        package: list = _get_module_parts(file)
+        package = package if file.endswith("__init__.py") else package[:-1]
+
+        for node in ast.walk(tree):
+            # Auxiliary variables.
+            modules: list = []
+
+            if isinstance(node, ast.Import):
+                modules = [x.name for x in node.names]
+
+            elif isinstance(node, ast.ImportFrom):
+                base: list = (
+                    package[:len(package) - node.level + 1]
+                    if node.level > 0 else []
+                ) + ([] if node.module is None else node.module.split("."))
+                modules = [".".join(base)] + [
+                    ".".join(base + [x.name]) for x in node.names
+                ]
+
+            # The packages are imported too.
+            for module in modules:
+                parts: list = module.split(".")
+                imports[file].update(
+                    y for x in range(len(parts))
+                    for y in names.get(".".join(parts[:x + 1]), ())
+                )
+
+    return imports
+
+
+def _get_module_parts(file: str) -> list:
+    """
+        Gets the parts of the name of the module of the file; i.e., the names
+        of its packages (the parent directories with an __init__.py file) and
+        its own name, NOT for the packages themselves.
+
+        :param file: The path of the file.
+
+        :return: The list with the parts of the name of the module.
+    """
+    # Auxiliary variables.
+    path: Path = Path(file).absolute()
+    parts: list = [] if path.name == "__init__.py" else [path.stem]
+
+    while (path.parent / "__init__.py").is_file():
+        path = path.parent
+        parts.insert(0, path.name)
+
+    return parts
+
+
+def _get_pylint_digests(digests: dict) -> dict:
+    """
+        Gets the digests of the files for the lint cache of Pylint; i.e., the
+        digest of the content of each file, and of the linted files that it
+        imports, directly or NOT, since the inference of Pylint depends on
+        them.
+
+        :param digests: The dictionary with the digest of the content of each
+         file to be linted; see _get_digests.
+
+        :return: The dictionary with the digest of each file and its imports.
+    """
+    # Auxiliary variables.
+    imports: dict = _get_imports(list(digests))
+    results: dict = {}
+
+    for file in digests:
+        # The imports, directly or NOT.
+        closure: set = {file}
+        pending: list = [file]
+
+        while len(pending) > 0:
+            for imported in imports[pending.pop()] - closure:
+                closure.add(imported)
+                pending.append(imported)
+
+        results[file] = hashlib.sha256(
+            "\0".join(f"{x}\0{digests[x]}" for x in sorted(closure)).encode()
+        ).hexdigest()
+
+    return results
+
+
+def _get_pylint_evaluation(entries: list, config: Any) -> str:
+    """
+        Gets the evaluation of the code, from the statistics of Pylint of each
+        file; as Pylint displays it at the end of its report, compared with
+        that of the previous run. As Pylint does, the statistics are saved for
+        the next run if they must be persisted, by the name of the module of
+        the last file.
+
+        :param entries: The list with the entries of the files, in order; see
+         _lint_pylint_files.
+
+        :param config: The configuration of Pylint; see _get_pylint_linter.
+
+        :return: The text of the evaluation; empty, if there are no statements
+         or the score must not be displayed.
+    """
+    # Auxiliary variables.
+    module: str = entries[-1]["module"]
+    previous: Union[None, LinterStats] = load_results(module)
+    stats: LinterStats = LinterStats()
+    text: str = ""
+
+    for name in STATISTICS:
+        setattr(stats, name, sum(x["statistics"][name] for x in entries))
+
+    # Same expression and format as Pylint.
+    if stats.statement > 0:
+        try:
+            # pylint: disable-next=eval-used
+            stats.global_note = eval(
+                config.evaluation,
+                {},
+                {x: getattr(stats, x) for x in STATISTICS}
+            )
+            text = f"Your code has been rated at {stats.global_note:.2f}/10"
+
+            if previous is not None and previous.global_note is not None:
+                text += (
+                    f" (previous run: {previous.global_note:.2f}/10, "
+                    f"{stats.global_note - previous.global_note:+.2f})"
+                )
+
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            text = f"An exception occurred while rating: {error}"
+
+    if config.persistent:
+        save_results(stats, module)
+
+    # Nothing to display.
+    if text == "" or not config.score:
+        return ""
+
+    stream: io.StringIO = io.StringIO()
+    TextReporter(stream).display_reports(EvaluationSection(text))
+
+    return stream.getvalue()
+
+
+def _get_pylint_linter() -> PyLinter:
+    """
+        Gets the linter of Pylint, configured by its configuration files;
+        i.e., without linting any file.
+
+        :return: The linter.
+    """
+    # Auxiliary variables.
+    reporter: TextReporter = TextReporter(io.StringIO())
+
+    # Pylint exits, there are no files to lint.
+    with redirect_stdout(io.StringIO()):
+        try:
+            Run([], exit=False, reporter=reporter)
+
+        except SystemExit:
+            pass
+
+    return reporter.linter
+
+
+def _get_pylint_plugins() -> list:
+    """
+        Gets the plugins of Pylint in the load-plugins option of its
+        configuration files, with the versions of their packages; or the
+        digest of their modules, if they are NOT installed.
+
+        :return: The sorted list with the name of each plugin, and the
+         versions of its packages or the digest of its module.
+    """
+    # Auxiliary variables.
+    distributions: dict = packages_distributions()
+    plugins: set = set()
+    parts: list = []
+
+    for file in find_default_config_files():
+        sections: dict = {}
+
+        if file.suffix == ".toml":
+            with open(file, "rb") as stream:
+                sections = tomllib.load(stream).get("tool", {}).get(
+                    "pylint", {}
+                )
+
+        else:
+            parser: configparser.ConfigParser = configparser.ConfigParser(
+                interpolation=None
+            )
+            parser.read(file, encoding="utf-8")
+            sections = {x: dict(parser[x]) for x in parser.sections()}
+
+        # The option is in the main section; e.g., [MAIN].
+        for name, section in sections.items():
+            if (
+                isinstance(section, dict) and
+                name.lower().removeprefix("pylint.") in ("main", "master")
+            ):
+                value: Any = section.get("load-plugins", [])
+                value = value.split(",") if isinstance(value, str) else value
+                plugins.update(x.strip() for x in value if x.strip())
+
+    for plugin in sorted(plugins):
+        names: list = sorted(set(distributions.get(plugin.split(".")[0], [])))
+        part: str = " ".join(f"{x} {version(x)}" for x in names)
+
+        # The local modules.
+        if part == "":
+            try:
+                spec: Any = find_spec(plugin)
+                part = hashlib.sha256(
+                    Path(spec.origin).read_bytes()
+                ).hexdigest()
+
+            except (AttributeError, ImportError, OSError, TypeError,
+                    ValueError):
+                part = "missing"
+
+        parts.append(f"{plugin} {part}")
+
+    return parts
+
+
+def _get_pylint_record(msg: Message) -> dict:
+    """
+        Gets the record of the Pylint message, for the NDJSON output.
+
+        :param msg: The message.
+
+        :return: The record; see lint_pylint.
+    """
+    return {
+        "engine": "pylint",
+        "file": msg.path,
+        "line": msg.line,
+        "column": msg.column + 1,
+        "code": msg.msg_id,
+        "message": msg.msg,
+    }
+
+
+def _get_results(
+    path: Union[None, Path, str], engine: str, output: str = "text"
+) -> str:
+    """
+        Gets the path of the file where the results of linting will be saved.
+
+        :param path: The path where the results of linting will be saved; if
+         it is a directory, or None (i.e., the current directory), the file is
+         named after the linting engine, with a counter if it already exists.
+
+        :param engine: The name of the linting engine; see ENGINES.
+
+        :param output: The output format of the results; see OUTPUTS.
+
+        :return: The path of the file.
+    """
+    # Set the path.
+    root: Path = Path.cwd()
+
+    if isinstance(path, (Path, str)):
+        root = path if isinstance(path, Path) else Path(path)
+
+    # Get the proper file path.
+    file: Path = root
+
+    if root.is_dir():
+        counter: int = 0
+        name: str = f"results_{engine}{OUTPUTS[output]}"
+        file = root / name
+
+        while file.is_file():
+            tname: str = f"{(root / name).with_suffix('')}"
+            file = Path(f"{tname}({counter}){OUTPUTS[output]}")
+            counter += 1
+
+    return f"{file}"
+
+
+def _is_ignored(rules: list, relative: str, isdir: bool) -> bool:
+    """
+        Determines whether the path is ignored by the .gitignore rules; the
+        last rule that matches the path wins, and the deeper .gitignore files
+        go last.
+
+        :param rules: The list with the 3-tuples of the .gitignore files; the
+         number of characters to strip from the relative path, the prefix to
+         prepend to it, and the rules (see _get_gitignore).
+
+        :param relative: The path relative to the discovered directory, with
+         forward slashes.
+
+        :param isdir: A boolean flag indicating whether the path is a
+         directory. True, if it is a directory; False, otherwise.
+
+        :return: True, if the path is ignored; False, otherwise.
+    """
+    # Auxiliary variables.
+    ignored: bool = False
+
+    for strip, prefix, patterns in rules:
+        # Relative to the directory of the .gitignore file.
+        path: str = f"{prefix}{relative[strip:]}"
+
+        for regex, negated, dironly in patterns:
+            # Only the rules that would change the result.
+            if (
+                ignored == negated and (isdir or not dironly) and
+                regex.fullmatch(path)
+            ):
+                ignored = not negated
+
+    return ignored
+
+
+def _iter_files(
+    items: Union[list, tuple],
+    recursive: bool,
+    excludes: Union[list, tuple],
+    gitignore: bool
+) -> Iterator:
+    """
+        Gets the python files to be linted, lazily; directory by directory.
+        The files are always yielded if given, even if excluded or ignored.
+
+        :param items: The list or tuple with the objects to be linted; all
+         the objects must be strings, and must represent paths.
+
+        :param recursive: A boolean flag indicating whether the files must be
+         recursively checked, in the case that a directory is passed. True,
+         if directories must be recursively linted; False, otherwise.
+
+        :param excludes: The list or tuple with the globs of the names of the
+         files and directories that are NOT discovered.
+
+        :param gitignore: A boolean flag indicating whether the .gitignore
+         files are honored. True, if the ignored files are NOT discovered;
+         False, otherwise.
+
+        :return: The iterator over the paths of the files; possibly repeated,
+         if the items overlap.
+    """
+    # Auxiliary variables.
+    exclude: Union[None, re.Pattern] = (
+        re.compile("|".join(fnmatch.translate(x) for x in excludes))
+        if len(excludes) > 0 else None
+    )
+
+    for item in items:
+        # Append the file.
+        if Path(item).is_file():
+            yield item
+            continue
+
+        # Walk the directory; depth first.
+        root: str = f"{Path(item)}"
+        stack: list = [
+            (root, "", _get_gitignore_parents(root) if gitignore else [])
+        ]
+
+        while len(stack) > 0:
+            directory, relative, rules = stack.pop()
+            patterns: list = _get_gitignore(directory) if gitignore else []
+
+            if len(patterns) > 0:
+                rules = [*rules, (len(relative), "", patterns)]
+
+            files, directories = _scan_directory(
+                directory, relative, rules, exclude
+            )
+
+            yield from files
+
+            if recursive:
+                stack.extend((x, y, rules) for x, y in directories)
+
+
+def _iter_results(
+    file: Union[Path, str],
+    codes: Union[None, tuple],
+    files: Union[None, re.Pattern]
+) -> Iterator:
+    """
+        Loads the records of the messages in the NDJSON results, lazily; see
+        iter_results.
+
+        :param file: The path of the NDJSON file with the results.
+
+        :param codes: The tuple with the prefixes of the codes of the messages
+         to be loaded; if None, all of them.
+
+        :param files: The pattern of the files of the messages to be loaded;
+         if None, all of them.
+
+        :return: The iterator over the records.
+    """
+    with open(file, encoding="utf-8") as stream:
+        for line in stream:
+            # Ignore the blank lines.
+            if line.strip() == "":
+                continue
+
+            record: dict = json.loads(line)
+
+            if codes is not None and not record["code"].startswith(codes):
+                continue
+
+            if files is not None and files.match(record["file"]) is None:
+                continue
+
+            yield record
+
+
+# pylint: disable-next=too-many-arguments
+def _lint_flake8(
+    files: list,
+    file: str,
+    jobs: int,
+    cache_dir: Union[None, Path, str],
+    digests: dict,
+    *,
+    output: str
+) -> None:
+    """
+        Lints the given files with Flake8; see lint_flake8.
+
+        :param files: The list with the paths of the files to be linted.
+
+        :param file: The path of the file where the results will be saved.
+
+        :param jobs: The number of processes used to lint the files.
+
+        :param cache_dir: The path of the directory of the lint cache.
+
+        :param digests: The dictionary with the digest of the content of each
+         file to be linted, if there is a cache; see _get_digests.
+
+        :param output: The output format of the results; see OUTPUTS.
+    """
+    with open(file, encoding="utf-8", mode="w") as stream:
+        # Check the files or ignore.
+        if len(files) == 0:
+            stream.write(
+                "NO FILES FOUND TO LINT.\n" if output == "text" else ""
+            )
+
+        elif cache_dir is None:
+            # The errors would break the records.
+            with redirect_stdout(stream):
+                with redirect_stderr(
+                    stream if output == "text" else sys.stderr
+                ):
+                    _get_flake8_style_guide(jobs, output).check_files(files)
+
+        else:
+            entries: dict = _cache_entries(
+                partial(_lint_flake8_files, jobs=jobs),
+                digests,
+                Path(cache_dir),
+                _get_fingerprint(True)
+            )
+
+            # Sorted as Flake8 does.
+            _write_entries(stream, [entries[x] for x in sorted(files)], output)
+
+
+def _lint_flake8_files(files: list, jobs: int) -> dict:
+    """
+        Lints the given files with Flake8, keeping the messages of each file
+        apart; the messages are written as records (see _JSONFormatter), and
+        the report is made from them as the Pylint format of Flake8 does.
+
+        :param files: The list with the paths of the files to be linted.
+
+        :param jobs: The number of processes used to lint the files; if zero,
+         the number of processors.
+
+        :return: The dictionary with the entry of each file; i.e., the
+         dictionary with its records and its report.
+    """
+    # Auxiliary variables; Flake8 writes to the buffer of the stream.
+    buffer: io.BytesIO = io.BytesIO()
+    stream: io.TextIOWrapper = io.TextIOWrapper(buffer, "utf-8")
+    entries: dict = {x: {"records": [], "report": ""} for x in files}
+    file: str = min(files)
+
+    with redirect_stdout(stream):
+        with redirect_stderr(stream):
+            _get_flake8_style_guide(jobs, "ndjson").check_files(files)
+
+    stream.flush()
+
+    # Other lines go with the previous file.
+    for line in buffer.getvalue().decode().splitlines(keepends=True):
+        try:
+            record: dict = json.loads(line)
+            file = record["file"] if record["file"] in entries else file
+            line = (
+                f"{record['file']}:{record['line']}: [{record['code']}] "
+                f"{record['message']}\n"
+            )
+            entries[file]["records"].append(record)
+
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        entries[file]["report"] += line
+
+    return entries
+
+
+# pylint: disable-next=too-many-arguments
+def _lint_pylint(
+    files: list,
+    file: str,
+    jobs: int,
+    cache_dir: Union[None, Path, str],
+    digests: dict,
+    *,
+    output: str
+) -> None:
+    """
+        Lints the given files with Pylint; see lint_pylint.
+
+        :param files: The list with the paths of the files to be linted.
+
+        :param file: The path of the file where the results will be saved.
+
+        :param jobs: The number of processes used to lint the files; if zero,
+         the number of processors.
+
+        :param cache_dir: The path of the directory of the lint cache.
+
+        :param digests: The dictionary with the digest of the content of each
+         file to be linted, if there is a cache; see _get_digests.
+
+        :param output: The output format of the results; see OUTPUTS.
+    """
+    # Auxiliary variables.
+    jobs = jobs or os.cpu_count() or 1
+
+    with open(file, encoding="utf-8", mode="w") as stream:
+        # Check the files or ignore.
+        if len(files) == 0:
+            stream.write(
+                "NO FILES FOUND TO LINT.\n" if output == "text" else ""
+            )
+
+        elif jobs == 1 and cache_dir is None:
+            reporter: BaseReporter = (
+                TextReporter(stream) if output == "text" else
+                _JSONReporter(stream)
+            )
+
+            Run(
+                sorted(files, key=lambda x: x.lower()),
+                exit=False,
+                reporter=reporter
+            )
+
+        else:
+            function: Callable = partial(
+                _lint_pylint_files,
+                arguments=[
+                    f"--jobs={jobs}", f"--disable={','.join(CROSS_CHECKS)}"
+                ]
+            )
+            entries: dict = (
+                function(files) if cache_dir is None else
+                _cache_entries(
+                    function,
+                    _get_pylint_digests(digests),
+                    Path(cache_dir),
+                    _get_fingerprint(False)
+                )
+            )
+            linter: PyLinter = _get_pylint_linter()
+            crosses: list = [
+                x for x in CROSS_CHECKS if linter.is_message_enabled(x)
+            ]
+
+            # In one process, the checks across files see all of them.
+            if len(crosses) > 0:
+                entries = _merge_pylint_entries(
+                    entries,
+                    _lint_pylint_files(
+                        files,
+                        arguments=[
+                            "--jobs=1",
+                            "--disable=all",
+                            f"--enable={','.join(crosses)}"
+                        ]
+                    )
+                )
+
+            _write_entries(stream, [entries[x] for x in files], output)
+
+            # The statistics are saved, even if the evaluation is NOT written.
+            evaluation: str = _get_pylint_evaluation(
+                [entries[x] for x in files], linter.config
+            )
+
+            if output == "text":
+                stream.write(evaluation)
+
+
+def _lint_pylint_files(files: list, arguments: list) -> dict:
+    """
+        Lints the given files with Pylint, keeping the messages of each file
+        apart; the evaluation is left out, since it must be made from the
+        statistics of all the files. The statistics are NOT persisted here,
+        they are NOT those of all the files; see _get_pylint_evaluation.
+
+        :param files: The list with the paths of the files to be linted.
+
+        :param arguments: The list with the arguments of Pylint; e.g., the
+         number of processes, or the checks to be disabled.
+
+        :return: The dictionary with the entry of each file; i.e., the
+         dictionary with the name of its module, its records, its report and
+         its statistics (see STATISTICS).
+    """
+    # Auxiliary variables.
+    reporter: _FileReporter = _FileReporter(files)
+
+    run: Run = Run(
+        ["--persistent=n", *arguments, *files],
+        exit=False,
+        reporter=reporter
+    )
+    modules: dict = run.linter.stats.by_module
+
+    return {
+        x: {
+            "module": reporter.modules.get(x, ""),
+            "records": reporter.records[x],
+            "report": reporter.streams[x].getvalue(),
+            "statistics": {
+                y: modules.get(reporter.modules.get(x, ""), {}).get(y, 0)
+                for y in STATISTICS
+            }
+        }
+        for x in files
+    }
+
+
+def _merge_pylint_entries(entries: dict, crosses: dict) -> dict:
+    """
+        Merges the lint entries of the checks across files into those of the
+        other checks; their messages go after the others of the same file, as
+        Pylint emits them when it closes, and only their messages are counted,
+        the statements already are.
+
+        :param entries: The dictionary with the entry of each file; see
+         _lint_pylint_files.
+
+        :param crosses: The dictionary with the entry of each file, from the
+         checks across files; see CROSS_CHECKS.
+
+        :return: The dictionary with the merged entry of each file.
+    """
+    # Auxiliary variables.
+    merged: dict = {}
+
+    for file, entry in entries.items():
+        cross: dict = crosses[file]
+        header, _, lines = cross["report"].partition("\n")
+
+        merged[file] = {
+            **entry,
+            "records": entry["records"] + cross["records"],
+            # The header of the module is written once.
+            "report": entry["report"] + (
+                lines if entry["report"].startswith(f"{header}\n") else
+                cross["report"]
+            ),
+            "statistics": {
+                x: entry["statistics"][x] + (
+                    0 if x == "statement" else cross["statistics"][x]
+                )
+                for x in STATISTICS
+            }
+        }
+
+    return merged
+
+
+def _parameters_daemon(address: Any) -> None:
+    """
+        Validates the address of the Pylint daemon.
+
+        :param address: The path of the Unix socket of the daemon.
+
+        :raise ValueError: If the address is NOT valid, or the platform does
+         NOT support Unix sockets.
+    """
+    # Auxiliary variables.
+    message: str = ""
+
+    if not hasattr(socket, "AF_UNIX"):
+        message += "The platform does NOT support Unix sockets. "
+
+    if not (isinstance(address, (Path, str)) and f"{address}" != ""):
+        message += (
+            f"The \"address\" must be the path, a Path or a string, of a "
+            f"Unix socket: {address}. "
+        )
+
+    # Raise an error if needed.
+    if message != "":
+        raise ValueError(message.strip())
+
+
+def _parameters_discovery(excludes: Any, gitignore: Any) -> None:
+    """
+        Validates the parameters for the discovery of the files to be linted.
+
+        :param excludes: The list or tuple with the globs of the names of the
+         files and directories that are NOT discovered.
+
+        :param gitignore: A boolean flag indicating whether the .gitignore
+         files are honored.
+
+        :raise ValueError: If any of the parameters are NOT valid; either in
+         type or in value.
+    """
+    # Auxiliary variables.
+    message: str = ""
+
+    # Validate the types.
+    if not (
+        isinstance(excludes, (list, tuple)) and
+        all(isinstance(x, str) for x in excludes)
+    ):
+        message += "The \"excludes\" must be a list or a tuple of strings. "
+
+    if not isinstance(gitignore, bool):
+        message += "The \"gitignore\" must be a boolean value. "
+
+    # Raise an error if needed.
+    if message != "":
+        raise ValueError(message.strip())
+
+
+def _parameters_engines(engines: Any) -> None:
+    """
+        Validates the linting engines; the parameters that are common to all
+        the engines are validated by _parameters_linting.
+
+        :param engines: The list or tuple with the names of the linting
+         engines; see ENGINES.
+
+        :raise ValueError: If any of the parameters are NOT valid; either in
+         type or in value.
+    """
+    # Validate the type.
+    if not isinstance(engines, (list, tuple)):
+        raise ValueError("The \"engines\" must be a list or a tuple.")
+
+    # Validate the values.
+    if not (
+        all(isinstance(x, str) and x in ENGINES for x in engines) and
+        0 < len(engines) == len(set(engines))
+    ):
+        raise ValueError(
+            f"The \"engines\" must be a non-empty list or tuple of different "
+            f"linting engines, from {tuple(ENGINES)}: {engines}."
+        )
+
+
+def _parameters_linting(
+    objects: Any,
+    path: Any,
+    recursive: Any,
+    jobs: Any = 1,
+    cache_dir: Any = None
+) -> None:
+    """
+        Validates the parameters for linting. This is useful for both Pylint
+        and Flake8. The recursive parameter will only be considered if there
+        are any directories.
+
+        :param objects: The list or tuple with the objects to be linted; all
+         the objects must be strings, and must represent paths.
+
+        :param path: The path where the results of linting will be saved.
+
+        :param recursive: A boolean flag indicating whether the files must be
+         recursively checked, in the case that a directory is passed. True,
+         if directories must be recursively linted; False, otherwise.
+
+        :param jobs: The number of processes used to lint the files.
+
+        :param cache_dir: The path of the directory of the lint cache.
+
+        :raise ValueError: If any of the parameters are NOT valid; either in
+         type or in value.
+    """
+    # Auxiliary variables.
+    message: str = ""
+
+    # Validate the types.
+    if not isinstance(objects, (list, tuple)):
+        message += "The \"objects\" must be a list or a tuple. "
+
+    if not (path is None or isinstance(path, (Path, str))):
+        message += "The \"path\" must be None, a Path, or a string. "
+
+    if not isinstance(recursive, bool):
+        message += "The \"recursive\" must be a boolean value. "
+
+    if isinstance(jobs, bool) or not isinstance(jobs, int):
+        message += "The \"jobs\" must be an integer. "
+
+    if not (cache_dir is None or isinstance(cache_dir, (Path, str))):
+        message += "The \"cache_dir\" must be None, a Path, or a string. "
+
+    # Raise an error if needed.
+    if message != "":
+        raise ValueError(message.strip())
+
+    # Validate the values.
+    tpath: Union[None, Path] = Path(path) if isinstance(path, str) else path
+
+    if not (len(objects) > 0 and all(isinstance(x, str) for x in objects)):
+        message += (
+            f"The \"objects\" object must be a non-empty list or tuple of "
+            f"strings that represent existing paths of files and/or "
+            f"directories: {objects}. "
+        )
+
+    elif not all(Path(x).is_dir() or Path(x).suffix == ".py" for x in objects):
+        message += (
+            f"The elements of the \"objects\" must be paths of python files "
+            f"or directories: {[f'{Path(x)}' for x in objects]}"
+        )
+
+    if tpath is not None and not (
+        tpath.is_dir() or tpath.suffix in OUTPUTS.values()
+    ):
+        message += (
+            f"The \"path\" {path} must correspond to a results file, i.e., a "
+            f"file with an extension from {tuple(OUTPUTS.values())}, or a "
+            f"directory. "
+        )
+
+    if jobs < 0:
+        message += f"The \"jobs\" must be a non-negative integer: {jobs}. "
+
+    if cache_dir is not None and Path(cache_dir).is_file():
+        message += f"The \"cache_dir\" {cache_dir} must be a directory."
+
+    # Raise an error if needed.
+    if message != "":
+        raise ValueError(message.strip())
+
+
+def _parameters_output(path: Any, output: Any) -> None:
+    """
+        Validates the output format of the results of linting; the path, if
+        it is a file, must have the extension of the format. The path must be
+        validated before; see _parameters_linting.
+
+        :param path: The path where the results of linting will be saved.
+
+        :param output: The output format of the results; see OUTPUTS.
+
+        :raise ValueError: If the output format is NOT valid, or it does NOT
+         match the path.
+    """
+    # Auxiliary variables.
+    message: str = ""
+
+    if not (isinstance(output, str) and output in OUTPUTS):
+        message += (
+            f"The \"output\" must be an output format from "
+            f"{tuple(OUTPUTS)}: {output}. "
+        )
+
+    elif (
+        path is not None and not Path(path).is_dir() and
+        Path(path).suffix != OUTPUTS[output]
+    ):
+        message += (
+            f"The \"path\" {path} must have the {OUTPUTS[output]} extension "
+            f"for the \"{output}\" output."
+        )
+
+    # Raise an error if needed.
+    if message != "":
+        raise ValueError(message.strip())
+
+
+def _parameters_results(file: Any, codes: Any, files: Any) -> None:
+    """
+        Validates the parameters for loading the results of linting.
+
+        :param file: The path of the NDJSON file with the results.
+
+        :param codes: The list or tuple with the prefixes of the codes of the
+         messages to be loaded, or None.
+
+        :param files: The list or tuple with the globs of the files of the
+         messages to be loaded, or None.
+
+        :raise ValueError: If any of the parameters are NOT valid; either in
+         type or in value.
+    """
+    # Auxiliary variables.
+    message: str = ""
+
+    if not (isinstance(file, (Path, str)) and Path(file).is_file()):
+        message += (
+            f"The \"file\" must be the path, a Path or a string, of an "
+            f"existing file: {file}. "
+        )
+
+    for name, value in (("codes", codes), ("files", files)):
+        if not (
+            value is None or isinstance(value, (list, tuple)) and
+            all(isinstance(x, str) for x in value)
+        ):
+            message += (
+                f"The \"{name}\" must be None, or a list or tuple of "
+                f"strings: {value}. "
+            )
+
+    # Raise an error if needed.
+    if message != "":
+        raise ValueError(message.strip())
+
+
+def _scan_directory(
+    directory: str,
+    relative: str,
+    rules: list,
+    exclude: Union[None, re.Pattern]
+) -> tuple:
+    """
+        Scans the directory; the excluded and ignored entries are left out, so
+        the directories are pruned before descending. The type of the entries
+        is taken from the directory listing, without additional calls to stat;
+        the symbolic links to directories are NOT followed.
+
+        :param directory: The path of the directory.
+
+        :param relative: The path of the directory relative to the discovered
+         one, with forward slashes; empty, or ending with a slash.
+
+        :param rules: The list with the 3-tuples of the .gitignore files; see
+         _is_ignored.
+
+        :param exclude: The compiled regular expression of the excluded names;
+         None, if nothing is excluded.
+
+        :return: The 2-tuple with the list of the paths of the python files,
+         and the list of the 2-tuples with the path and the relative path of
+         the subdirectories.
+    """
+    # Auxiliary variables.
+    files: list = []
+    directories: list = []
+
+    try:
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                # Excluded or ignored.
+                path: str = (
+                    entry.name if directory == "." else
+                    os.path.join(directory, entry.name)
+                )
+                isdir: bool = entry.is_dir(follow_symlinks=False)
+
+                if (exclude is not None and exclude.match(entry.name)) or (
+                    _is_ignored(rules, f"{relative}{entry.name}", isdir)
+                ):
+                    continue
+
+                # Descend or append.
+                if isdir:
+                    directories.append((path, f"{relative}{entry.name}/"))
+
+                elif (
+                    os.path.splitext(entry.name)[1] == ".py" and
+                    entry.is_file()
+                ):
+                    files.append(path)
+
+    except OSError:
+        pass
+
+    return files, directories
+
+
+def _write_entries(stream: TextIO, entries: list, output: str) -> None:
+    """
+        Writes the lint entries of the files; their reports, or their records
+        flushed every FLUSH records.
 
-# Third party.
-import flake8.api.legacy as flake8
+        :param stream: The stream where the entries are written.
 
-from pylint.lint import Run
-from pylint.reporters.text import TextReporter
+        :param entries: The list with the entries of the files, in order.
+
+        :param output: The output format of the results; see OUTPUTS.
+    """
+    # The reports.
+    if output == "text":
+        stream.write("".join(x["report"] for x in entries))
+        return
+
+    # The records.
+    count: int = 0
+
+    for record in (x for y in entries for x in y["records"]):
+        stream.write(f"{json.dumps(record)}\n")
+        count += 1
+
+        if count % FLUSH == 0:
+            stream.flush()
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
-# Functions - Auxiliary
+# Classes
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
-def _get_parameters(
-    items: Union[list, tuple],
-    path: Union[None, Path, str],
-    recursive: bool,
-    isflake: Any
-) -> tuple:
+class _FileReporter(TextReporter):
     """
-        From the given parameters, gets the adequated and converted parameters.
+        Pylint text reporter that keeps the messages of each file apart, so
+        they can be cached and merged in order. The reports and the evaluation
+        are not displayed, they must be made from the statistics of all the
+        files.
 
-        :param items: The list or tuple with the objects to be linted; all
-         the objects must be strings, and must represent paths.
+        PARAMETERS:
+        ___________
 
-        :param path: The path where the results of linting will be saved.
+        - self.file: The file of the module being analysed; None, if it is
+          NOT a linted file.
 
-        :param recursive: A boolean flag indicating whether the files must be
-         recursively checked, in the case that a directory is passed. True,
-         if directories must be recursively linted; False, otherwise.
+        - self.modules: The dictionary with the name of the module of each
+          file.
 
-        :param isflake: A boolean flag indicating whether the linting engine is
-         flake8 or Pylint. True, if the linting engine is Flake8; False, if the
-         linting engine is Pylint.
+        - self.paths: The dictionary with the file of each absolute path.
+
+        - self.records: The dictionary with the list of the records of the
+          messages of each file; see _get_pylint_record.
 
-        :return: A tuple with the corrected paths of the directories and files
-         to be linted; in the corresponding order.
+        - self.streams: The dictionary with the stream of the messages of each
+          file.
     """
-    # Set the path.
-    root: Path = Path.cwd()
 
-    if isinstance(path, (Path, str)):
-        root = path if isinstance(path, Path) else Path(path)
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
 
-    # Auxiliary variables.
-    files: set = set()
-    cache: str = "__pycache__"
+    def __init__(self, files: list) -> None:
+        """
+            Constructor of the reporter.
 
-    for item in items:
-        # Append the file.
-        if Path(item).is_file():
-            files.add(item)
-            continue
+            :param files: The list with the paths of the files to be linted.
+        """
+        # Messages out of any file are discarded.
+        super().__init__(io.StringIO())
 
-        # Get the files.
-        function: Callable = Path(item).rglob if recursive else Path(item).glob
-        files = files.union(
-            f"{x}" for x in function("*")
-            if x.is_file() and cache not in f"{x}" and x.suffix == ".py"
-        )
+        # Set the files.
+        self.file: Union[None, str] = None
+        self.modules: dict = {}
+        self.paths: dict = {os.path.abspath(x): x for x in files}
+        self.records: dict = {x: [] for x in files}
+        self.streams: dict = {x: io.StringIO() for x in files}
 
-    # Get the proper file path.
-    file: Path = root
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
 
-    if root.is_dir():
-        counter: int = 0
-        name: str = "results_flake8.txt" if isflake else "results_pylint.txt"
-        file = root / name
+    def display_reports(self, layout: BaseLayout) -> None:
+        """
+            Ignores the reports and the evaluation.
 
-        while file.is_file():
-            tname: str = f"{(root / name).with_suffix('')}"
-            file = Path(f"{tname}({counter}).txt")
-            counter += 1
+            :param layout: The layout with the reports.
+        """
 
-    return f"{file}", sorted(files, key=lambda x: x.lower())
+    def handle_message(self, msg: Message) -> None:
+        """
+            Writes the message to the stream of its file.
 
+            :param msg: The message.
+        """
+        # The message may be from another file; e.g., duplicate-code.
+        file: Union[None, str] = self.paths.get(msg.abspath, self.file)
 
-def _parameters_linting(objects: Any, path: Any, recursive: Any) -> None:
+        if file is not None:
+            self.out = self.streams[file]
+            self.records[file].append(_get_pylint_record(msg))
+
+        super().handle_message(msg)
+
+    def on_set_current_module(
+        self, module: str, filepath: Union[None, str]
+    ) -> None:
+        """
+            Sets the stream of the file of the module being analysed.
+
+            :param module: The name of the module.
+
+            :param filepath: The path of the file of the module.
+        """
+        # Auxiliary variables.
+        self.file = self.paths.get(os.path.abspath(filepath or ""))
+
+        if self.file is not None:
+            self.modules[self.file] = module
+            self.out = self.streams[self.file]
+
+
+class _JSONFormatter(BaseFormatter):
     """
-        Validates the parameters for linting. This is useful for both Pylint
-        and Flake8. The recursive parameter will only be considered if there
-        are any directories.
+        Flake8 formatter that writes a JSON record per message, as it is
+        produced (i.e., NDJSON); the output is flushed every FLUSH records.
 
-        :param objects: The list or tuple with the objects to be linted; all
-         the objects must be strings, and must represent paths.
+        PARAMETERS:
+        ___________
 
-        :param path: The path where the results of linting will be saved.
+        - self.count: The number of records written.
+    """
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, options: Any) -> None:
+        """
+            Constructor of the formatter.
+
+            :param options: The options of Flake8.
+        """
+        super().__init__(options)
+
+        # Set the number of records.
+        self.count: int = 0
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def format(self, error: Violation) -> str:
+        """
+            Gets the record of the message.
+
+            :param error: The message.
+
+            :return: The JSON record; see lint_flake8.
+        """
+        return json.dumps({
+            "engine": "flake8",
+            "file": error.filename,
+            "line": error.line_number,
+            "column": error.column_number,
+            "code": error.code,
+            "message": error.text,
+        })
+
+    def handle(self, error: Violation) -> None:
+        """
+            Writes the record of the message, and flushes the output if
+            needed.
+
+            :param error: The message.
+        """
+        super().handle(error)
+        self.count += 1
+
+        if self.count % FLUSH == 0:
+            (sys.stdout if self.output_fd is None else self.output_fd).flush()
+
+
+class _JSONReporter(BaseReporter):
+    """
+        Pylint reporter that writes a JSON record per message, as it is
+        produced (i.e., NDJSON); the output is flushed every FLUSH records.
+        The reports and the evaluation are not displayed.
+
+        PARAMETERS:
+        ___________
+
+        - self.count: The number of records written.
+    """
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, output: TextIO) -> None:
+        """
+            Constructor of the reporter.
+
+            :param output: The stream where the records are written.
+        """
+        super().__init__(output)
+
+        # Set the number of records.
+        self.count: int = 0
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _display(self, layout: BaseLayout) -> None:
+        """
+            Ignores the reports and the evaluation.
+
+            :param layout: The layout with the reports.
+        """
+
+    def handle_message(self, msg: Message) -> None:
+        """
+            Writes the record of the message, and flushes the output if
+            needed.
+
+            :param msg: The message.
+        """
+        self.writeln(json.dumps(_get_pylint_record(msg)))
+        self.count += 1
+
+        if self.count % FLUSH == 0:
+            self.out.flush()
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def iter_files(
+    items: Union[list, tuple],
+    recursive: bool = False,
+    *,
+    excludes: Union[list, tuple] = EXCLUDES,
+    gitignore: bool = True
+) -> Iterator:
+    """
+        Gets the python files to be linted, lazily; i.e., the given files, and
+        the python files in the given directories. The directories are walked
+        with os.scandir, and the excluded or ignored ones are pruned; i.e.,
+        never walked. The symbolic links to directories are NOT followed.
+
+        :param items: The list or tuple with the objects to be linted; all
+         the objects must be strings, and must represent paths.
 
         :param recursive: A boolean flag indicating whether the files must be
          recursively checked, in the case that a directory is passed. True,
          if directories must be recursively linted; False, otherwise.
 
+        :param excludes: The list or tuple with the globs (see fnmatch) of the
+         names of the files and directories that are NOT discovered; see
+         EXCLUDES. The given files are never excluded.
+
+        :param gitignore: A boolean flag indicating whether the .gitignore
+         files are honored; those in the walked directories, and those of
+         their parents up to the root of the repository. True, if the ignored
+         files are NOT discovered; False, otherwise.
+
+        :return: The iterator over the paths of the files; in no particular
+         order, and possibly repeated if the items overlap.
+
         :raise ValueError: If any of the parameters are NOT valid; either in
          type or in value.
     """
-    # Auxiliary variables.
-    message: str = ""
+    # Validate the parameters.
+    _parameters_linting(items, None, recursive)
+    _parameters_discovery(excludes, gitignore)
 
-    # Validate the types.
-    if not isinstance(objects, (list, tuple)):
-        message += "The \"objects\" must be a list or a tuple. "
+    return _iter_files(items, recursive, excludes, gitignore)
 
-    if not (path is None or isinstance(path, (Path, str))):
-        message += "The \"path\" must be None, a Path, or a string. "
 
-    if not isinstance(recursive, bool):
-        message += "The \"recursive\" must be a boolean value. "
+def iter_results(
+    file: Union[Path, str],
+    codes: Union[None, list, tuple] = None,
+    files: Union[None, list, tuple] = None
+) -> Iterator:
+    """
+        Loads the records of the messages in the NDJSON results of linting,
+        lazily; i.e., the file is read line by line, and only the records that
+        pass the filters are kept. See lint_flake8 and lint_pylint.
 
-    # Raise an error if needed.
-    if message != "":
-        raise ValueError(message.strip())
+        :param file: The path of the NDJSON file with the results.
 
-    # Validate the values.
-    tpath: Union[None, Path] = Path(path) if isinstance(path, str) else path
+        :param codes: The list or tuple with the prefixes of the codes of the
+         messages to be loaded (e.g., ("E5", "W0611")); if None, all of them.
 
-    if not (len(objects) > 0 and all(isinstance(x, str) for x in objects)):
-        message += (
-            f"The \"objects\" object must be a non-empty list or tuple of "
-            f"strings that represent existing paths of files and/or "
-            f"directories: {objects}. "
-        )
+        :param files: The list or tuple with the globs (see fnmatch) of the
+         files of the messages to be loaded; if None, all of them.
 
-    elif not all(Path(x).is_dir() or Path(x).suffix == ".py" for x in objects):
-        message += (
-            f"The elements of the \"objects\" must be paths of python files "
-            f"or directories: {[f'{Path(x)}' for x in objects]}"
+        :return: The iterator over the records; i.e., dictionaries with the
+         engine, file, line, column, code and message.
+
+        :raise ValueError: If any of the parameters are NOT valid; either in
+         type or in value.
+    """
+    # Validate the parameters.
+    _parameters_results(file, codes, files)
+
+    return _iter_results(
+        file,
+        None if codes is None else tuple(codes),
+        None if files is None else re.compile(
+            "|".join(fnmatch.translate(x) for x in files) or "(?!)"
         )
+    )
 
-    if tpath is not None and not (tpath.is_dir() or tpath.suffix == ".txt"):
-        message += (
-            f"The \"path\" {path} must correspond to a text file, i.e., a "
-            f"file with a .txt extension, or a directory."
+
+# pylint: disable-next=too-many-arguments
+def lint_all(
+    items: Union[list, tuple],
+    path: Union[None, Path, str] = None,
+    engines: Union[list, tuple] = tuple(ENGINES),
+    recursive: bool = False,
+    *,
+    jobs: int = 1,
+    cache_dir: Union[None, Path, str] = None,
+    excludes: Union[list, tuple] = (),
+    gitignore: bool = False,
+    output: str = "text"
+) -> None:
+    """
+        Lints the given dictory with several engines, concurrently; one
+        process per engine. The files are discovered once, and, if there is a
+        lint cache, each of them is read once to get the digest of its content
+        for all the engines. The results of each engine are the same as with
+        lint_flake8 and lint_pylint.
+
+        :param items: The list or tuple with the objects to be linted; all
+         the objects must be strings, and must represent paths.
+
+        :param path: The path where the results of linting will be saved; if
+         it is the path of a file, it is suffixed with the name of each engine
+         (e.g., linting.txt becomes linting_flake8.txt).
+
+        :param engines: The list or tuple with the names of the linting
+         engines; see ENGINES.
+
+        :param recursive: A boolean flag indicating whether the files must be
+         recursively checked, in the case that a directory is passed. True,
+         if directories must be recursively linted; False, otherwise.
+
+        :param jobs: The number of processes used by each engine to lint the
+         files; if zero, the number of processors.
+
+        :param cache_dir: The path of the directory of the lint cache; if None,
+         there is no cache. See lint_flake8 and lint_pylint.
+
+        :param excludes: The list or tuple with the globs of the names of the
+         files and directories that are NOT discovered; see iter_files. Empty
+         by default, as with lint_flake8 and lint_pylint.
+
+        :param gitignore: A boolean flag indicating whether the .gitignore
+         files are honored; see iter_files. False by default, as with
+         lint_flake8 and lint_pylint.
+
+        :param output: The output format of the results; see lint_flake8 and
+         lint_pylint.
+    """
+    # Validate the parameters.
+    _parameters_linting(items, path, recursive, jobs, cache_dir)
+    _parameters_discovery(excludes, gitignore)
+    _parameters_engines(engines)
+    _parameters_output(path, output)
+
+    # Auxiliary variables.
+    files: list = _get_files(items, recursive, excludes, gitignore)
+    digests: dict = {} if cache_dir is None else _get_digests(files)
+    results: dict = {
+        x: _get_results(
+            Path(path).with_name(f"{Path(path).stem}_{x}{OUTPUTS[output]}")
+            if path is not None and not Path(path).is_dir() else path,
+            x,
+            output
+        )
+        for x in engines
+    }
+    calls: list = [
+        partial(
+            {"flake8": _lint_flake8, "pylint": _lint_pylint}[x],
+            files, results[x], jobs, cache_dir, digests, output=output
         )
+        for x in engines
+    ]
 
-    # Raise an error if needed.
-    if message != "":
-        raise ValueError(message.strip())
+    # Run the engines.
+    if len(calls) == 1:
+        calls[0]()
 
+    else:
+        with ProcessPoolExecutor(max_workers=len(calls)) as executor:
+            for future in [executor.submit(x) for x in calls]:
+                future.result()
 
-# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
-# Functions
-# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+    # Message to the user.
+    print("\n".join(
+        f"{ENGINES[x]} saved the linting results in the file: {results[x]}"
+        for x in engines
+    ))
 
 
+# pylint: disable-next=too-many-arguments
 def lint_flake8(
     items: Union[list, tuple],
     path: Union[None, Path, str] = None,
     recursive: bool = False,
+    jobs: int = 1,
+    cache_dir: Union[None, Path, str] = None,
+    *,
+    excludes: Union[list, tuple] = (),
+    gitignore: bool = False,
+    output: str = "text"
 ) -> None:
     """
         Lints the given dictory with Flake8.
@@ -172,39 +2062,64 @@ def lint_flake8(
         :param recursive: A boolean flag indicating whether the files must be
          recursively checked, in the case that a directory is passed. True,
          if directories must be recursively linted; False, otherwise.
+
+        :param jobs: The number of processes used to lint the files; if zero,
+         the number of processors. Flake8 shards the files itself, and sorts
+         the results by file; so, the report does not depend on it.
+
+        :param cache_dir: The path of the directory of the lint cache; if None,
+         there is no cache. The messages of each file are cached by its path
+         and content, the versions of the linter and its options; so, only the
+         new or changed files are linted. The cache is bounded in size (see
+         CACHE_SIZE), and can be shared by Flake8 and Pylint.
+
+        :param excludes: The list or tuple with the globs of the names of the
+         files and directories that are NOT discovered; see iter_files. Empty
+         by default, i.e., every python file is discovered; unlike iter_files,
+         whose default is EXCLUDES.
+
+        :param gitignore: A boolean flag indicating whether the .gitignore
+         files are honored; see iter_files. False by default; unlike
+         iter_files.
+
+        :param output: The output format of the results; see OUTPUTS. With
+         "ndjson", a JSON record is written per message as it is produced,
+         i.e., a line with its engine, file, line, column (from 1), code and
+         message; the records can be loaded lazily with iter_results.
     """
     # Validate the parameters.
-    _parameters_linting(items, path, recursive)
+    _parameters_linting(items, path, recursive, jobs, cache_dir)
+    _parameters_discovery(excludes, gitignore)
+    _parameters_output(path, output)
 
     # Get the path where the results must be saved and the files to lint.
-    file, files = _get_parameters(items, path, recursive, True)
+    file: str = _get_results(path, "flake8", output)
+    files: list = _get_files(items, recursive, excludes, gitignore)
 
-    # Set the linter.
-    style_guide: flake8.StyleGuide = flake8.get_style_guide(
-        format="pylint",
-        ignore=[],
-        isolated=True,
-        select=["E", "W", "F", "C"]
+    _lint_flake8(
+        files,
+        file,
+        jobs,
+        cache_dir,
+        {} if cache_dir is None else _get_digests(files),
+        output=output
     )
 
-    # Save the statistics.
-    with open(file, encoding="utf-8", mode="w") as stream:
-        # Check the files or ignore.
-        if len(files) > 0:
-            with redirect_stdout(stream):
-                with redirect_stderr(stream):
-                    style_guide.check_files(files)
-        else:
-            stream.write("NO FILES FOUND TO LINT.\n")
-
     # Message to the user.
     print(f"Flake8 saved the linting results in the file: {file}")
 
 
+# pylint: disable-next=too-many-arguments
 def lint_pylint(
     items: Union[list, tuple],
     path: Union[None, Path, str] = None,
     recursive: bool = False,
+    jobs: int = 1,
+    cache_dir: Union[None, Path, str] = None,
+    *,
+    excludes: Union[list, tuple] = (),
+    gitignore: bool = False,
+    output: str = "text"
 ) -> None:
     """
         Lints the given dictory with Pylint.
@@ -217,27 +2132,250 @@ def lint_pylint(
         :param recursive: A boolean flag indicating whether the files must be
          recursively checked, in the case that a directory is passed. True,
          if directories must be recursively linted; False, otherwise.
+
+        :param jobs: The number of processes used to lint the files; if zero,
+         the number of processors. With more than one, Pylint lints the files
+         in parallel but the checks across files (see CROSS_CHECKS), which are
+         made apart in one process to see all of them; the messages of each
+         file are merged in the order of the files, followed by the evaluation
+         of all the files, and the reports of Pylint (i.e., --reports) are not
+         displayed.
+
+        :param cache_dir: The path of the directory of the lint cache; if None,
+         there is no cache. The messages and statistics of each file are cached
+         by its path and content, those of the linted files it imports
+         (directly or NOT; the inference depends on them), the versions of the
+         linter and its configuration files; so, only the new or changed files,
+         and those that import them, are linted, and the messages are merged
+         as with more than one process; the checks across files are NOT
+         cached, they are made every time. The messages that depend on modules
+         that are NOT linted (e.g., installed packages) are NOT updated when
+         they change. The cache is bounded in size (see CACHE_SIZE), and can be
+         shared by Flake8 and Pylint.
+
+        :param excludes: The list or tuple with the globs of the names of the
+         files and directories that are NOT discovered; see iter_files. Empty
+         by default, i.e., every python file is discovered; unlike iter_files,
+         whose default is EXCLUDES.
+
+        :param gitignore: A boolean flag indicating whether the .gitignore
+         files are honored; see iter_files. False by default; unlike
+         iter_files.
+
+        :param output: The output format of the results; see OUTPUTS. With
+         "ndjson", a JSON record is written per message as it is produced; see
+         lint_flake8. The evaluation is NOT written.
     """
     # Validate the parameters.
-    _parameters_linting(items, path, recursive)
+    _parameters_linting(items, path, recursive, jobs, cache_dir)
+    _parameters_discovery(excludes, gitignore)
+    _parameters_output(path, output)
 
     # Get the path where the results must be saved and the files to lint.
-    file, files = _get_parameters(items, path, recursive, False)
+    file: str = _get_results(path, "pylint", output)
+    files: list = _get_files(items, recursive, excludes, gitignore)
 
-    # Run the linter.
-    with open(file, encoding="utf-8", mode="w") as stream:
-        # Check the files or ignore.
-        if len(files) > 0:
-            reporter: TextReporter = TextReporter(stream)
+    _lint_pylint(
+        files,
+        file,
+        jobs,
+        cache_dir,
+        {} if cache_dir is None else _get_digests(files),
+        output=output
+    )
 
-            Run(
-                sorted(files, key=lambda x: x.lower()),
-                exit=False,
-                reporter=reporter
-            )
+    # Message to the user.
+    print(f"Pylint saved the linting results in the file: {file}")
 
-        else:
-            stream.write("NO FILES FOUND TO LINT.\n")
+
+# pylint: disable-next=too-many-arguments
+def lint_pylint_daemon(
+    items: Union[list, tuple],
+    path: Union[None, Path, str] = None,
+    recursive: bool = False,
+    jobs: int = 1,
+    cache_dir: Union[None, Path, str] = None,
+    *,
+    excludes: Union[list, tuple] = (),
+    gitignore: bool = False,
+    output: str = "text",
+    address: Union[Path, str] = SOCKET
+) -> None:
+    """
+        Lints the given dictory with Pylint, through the Pylint daemon; see
+        serve_pylint. The results are the same as with lint_pylint, but the
+        modules of astroid (e.g., those of the standard library and the third
+        party packages) are NOT inferred again in each call. If the daemon is
+        NOT reachable, or it does NOT reply in time (see TIMEOUT_REPLY), the
+        files are linted with lint_pylint.
+
+        :param items: The list or tuple with the objects to be linted; all
+         the objects must be strings, and must represent paths.
+
+        :param path: The path where the results of linting will be saved.
+
+        :param recursive: A boolean flag indicating whether the files must be
+         recursively checked, in the case that a directory is passed. True,
+         if directories must be recursively linted; False, otherwise.
+
+        :param jobs: The number of processes used to lint the files; see
+         lint_pylint. With more than one, the processes do NOT share the warm
+         modules of the daemon.
+
+        :param cache_dir: The path of the directory of the lint cache; see
+         lint_pylint.
+
+        :param excludes: The list or tuple with the globs of the names of the
+         files and directories that are NOT discovered; see iter_files. Empty
+         by default, i.e., every python file is discovered; unlike iter_files,
+         whose default is EXCLUDES.
+
+        :param gitignore: A boolean flag indicating whether the .gitignore
+         files are honored; see iter_files. False by default; unlike
+         iter_files.
+
+        :param output: The output format of the results; see lint_pylint.
+
+        :param address: The path of the Unix socket of the daemon.
+
+        :raise ValueError: If any of the parameters are NOT valid; either in
+         type or in value.
+
+        :raise RuntimeError: If the daemon fails to lint the files.
+    """
+    # Validate the parameters.
+    _parameters_linting(items, path, recursive, jobs, cache_dir)
+    _parameters_discovery(excludes, gitignore)
+    _parameters_output(path, output)
+    _parameters_daemon(address)
+
+    # Auxiliary variables; the paths are relative to the directory.
+    request: dict = {
+        "cwd": os.getcwd(),
+        "args": [
+            list(items),
+            None if path is None else f"{path}",
+            recursive,
+            jobs,
+            None if cache_dir is None else f"{cache_dir}"
+        ],
+        "kwargs": {
+            "excludes": list(excludes),
+            "gitignore": gitignore,
+            "output": output
+        },
+    }
+
+    try:
+        reply: dict = _daemon_request(f"{address}", request)
+
+    except OSError:
+        lint_pylint(
+            items,
+            path,
+            recursive,
+            jobs,
+            cache_dir,
+            excludes=excludes,
+            gitignore=gitignore,
+            output=output
+        )
+        return
+
+    # Raise an error if needed.
+    if reply.get("type", "") == "ValueError":
+        raise ValueError(reply["error"])
+
+    if reply.get("type", "") != "" or "output" not in reply:
+        raise RuntimeError(
+            f"The Pylint daemon failed to lint the files: "
+            f"{reply.get('type', '')} {reply.get('error', '')}".strip()
+        )
 
     # Message to the user.
-    print(f"Pylint saved the linting results in the file: {file}")
+    print(reply["output"], end="")
+
+
+def serve_pylint(address: Union[Path, str] = SOCKET) -> None:
+    """
+        Serves the Pylint daemon on the given Unix socket, until it is stopped
+        (see stop_pylint_daemon) or interrupted. The requests (see
+        lint_pylint_daemon) are linted one at a time, in this process; so, the
+        modules of astroid stay warm across them, and only the modules whose
+        files changed are inferred again. The clients that do NOT send their
+        request in time (see TIMEOUT) are dropped.
+
+        :param address: The path of the Unix socket of the daemon; a stale
+         socket is replaced, but NOT any other file. Only the user can connect
+         to it, and the clients only send requests to the daemons of the user;
+         the daemon lints in the directory of the client, with its
+         configuration (e.g., its plugins).
+
+        :raise ValueError: If the address is NOT valid, or another daemon is
+         serving on it.
+    """
+    # Validate the parameters.
+    _parameters_daemon(address)
+
+    # Auxiliary variables.
+    stamps: dict = {}
+
+    try:
+        _daemon_request(f"{address}", {})
+        raise ValueError(f"A Pylint daemon is serving on: {address}")
+
+    except OSError:
+        if Path(address).is_socket():
+            Path(address).unlink()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        # Only the user can connect; i.e., the socket is made with 0600.
+        umask: int = os.umask(0o177)
+
+        try:
+            server.bind(f"{address}")
+
+        finally:
+            os.umask(umask)
+
+        server.listen()
+
+        # Message to the user.
+        print(f"The Pylint daemon is serving on: {address}")
+
+        try:
+            while True:
+                connection, _ = server.accept()
+
+                # The wrong requests, or clients, do NOT stop the daemon.
+                try:
+                    if _daemon_serve(connection, stamps):
+                        break
+
+                except (OSError, ValueError):
+                    continue
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            Path(address).unlink(missing_ok=True)
+
+
+def stop_pylint_daemon(address: Union[Path, str] = SOCKET) -> None:
+    """
+        Stops the Pylint daemon served on the given Unix socket, if any; see
+        serve_pylint.
+
+        :param address: The path of the Unix socket of the daemon.
+
+        :raise ValueError: If the address is NOT valid.
+    """
+    # Validate the parameters.
+    _parameters_daemon(address)
+
+    try:
+        _daemon_request(f"{address}", {"stop": True})
+
+    except OSError:
+        pass
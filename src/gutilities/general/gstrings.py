@@ -3,156 +3,817 @@
 """
 
 
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import codecs
+import mmap
+import os
+import unicodedata
+
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, lru_cache, partial
+from itertools import accumulate, chain
+from typing import Callable, Iterable, Iterator, Union
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Minimum number of texts to use a process pool in the *_many functions; the
+# cost of starting the processes is not worth it for fewer texts.
+POOL_MINIMUM: int = 1_000
+
+# Number of bytes decoded at once from a buffer in the *_bytes functions.
+WINDOW: int = 1 << 20
+
+# Ways of measuring the width of the lines; the number of characters, or the
+# number of columns they take in a terminal.
+WIDTHS: tuple = ("chars", "display")
+
+
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Functions - Auxiliary
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
-def _normalize_append(
-    line: str,
-    word: str,
+@cache
+def _get_width(char: str) -> int:
+    """
+        Gets the display width of the character; i.e., the number of columns
+        it takes in a terminal. Looked up in the table of ranges, and cached.
+
+        :param char: The character to be measured.
+
+        :return: The number of columns; zero, one or two.
+    """
+    # Auxiliary variables.
+    starts, widths = _get_width_table()
+
+    return widths[bisect_right(starts, ord(char)) - 1]
+
+
+@cache
+def _get_width_table() -> tuple:
+    """
+        Gets the table of the display widths of the code points, as ranges;
+        i.e., the first code point of each range and the width of its code
+        points. The combining marks and the format characters take zero
+        columns; the wide and full-width characters, two; and the rest, one.
+        Built on the first use, and cached; only the planes with assigned
+        characters (0 to 3, and 14) are scanned, the rest take one column.
+
+        :return: The 2-tuple with the list of the first code points of the
+         ranges, sorted, and the list of their widths.
+    """
+    # Auxiliary variables; the ASCII characters take one column.
+    starts: list = [0]
+    widths: list = [1]
+
+    for point in chain(range(0x80, 0x40000), range(0xE0000, 0xE1000)):
+        # Auxiliary variables.
+        char: str = chr(point)
+        width: int = 1
+
+        if unicodedata.category(char) in ("Mn", "Me", "Cf"):
+            width = 0
+
+        elif unicodedata.east_asian_width(char) in ("W", "F"):
+            width = 2
+
+        # A new range starts.
+        if width != widths[-1]:
+            starts.append(point)
+            widths.append(width)
+
+    # The rest of the code points.
+    starts.append(0xE1000)
+    widths.append(1)
+
+    return starts, widths
+
+
+def _iter_decode(buffer: object, encoding: str, errors: str) -> Iterator:
+    """
+        Gets the decoded chunks of the buffer; the buffer is sliced, without
+        copying, into windows of WINDOW bytes, and each window is decoded
+        incrementally. So a character split between two windows is decoded
+        once complete, and only one window is decoded at a time. The views of
+        each window are released before the chunk is yielded; so the buffer
+        can be closed (e.g., mmap) while the iterator is suspended.
+
+        :param buffer: The bytes-like object; e.g., bytes, bytearray,
+         memoryview or mmap.
+
+        :param encoding: The encoding of the text in the buffer.
+
+        :param errors: The error handling scheme of the decoding; e.g.,
+         strict, replace or ignore.
+
+        :return: The iterator over the decoded chunks.
+    """
+    # Auxiliary variables.
+    decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(
+        encoding
+    )(errors)
+
+    with memoryview(buffer) as view:
+        size: int = view.nbytes
+
+    for start in range(0, size, WINDOW):
+        with (
+            memoryview(buffer) as view,
+            view.cast("B") as octets,
+            octets[start:start + WINDOW] as window
+        ):
+            chunk: str = decoder.decode(window)
+
+        yield chunk
+
+    yield decoder.decode(b"", final=True)
+
+
+def _iter_normalize_lines(chunks: Iterable) -> Iterator:
+    """
+        Gets the lines of the text given in chunks; i.e., the text is the
+        concatenation of the chunks. Only the line being completed is kept in
+        memory. If the text has more than one line, the line break is kept at
+        the end of each line; so the first line is held until a line break, or
+        the end of the text, is found.
+
+        :param chunks: The iterable with the chunks of the text; e.g., a text
+         file.
+
+        :return: The iterator over the lines of the text.
+
+        :raises TypeError: If any of the chunks is not a string.
+    """
+    # Auxiliary variables.
+    broken: bool = False
+    pending: list = []
+
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            raise TypeError("The chunk is not a string.")
+
+        # The line is not complete yet.
+        if "\n" not in chunk:
+            pending.append(chunk)
+            continue
+
+        # Complete the pending line; the last part is incomplete.
+        parts: list = chunk.split("\n")
+        parts[0] = "".join(pending) + parts[0]
+        pending = [parts.pop()]
+        broken = True
+
+        yield from (f"{x}\n" for x in parts)
+
+    # The last line.
+    yield "".join(pending) + ("\n" if broken else "")
+
+
+def _iter_normalize_wrap(
+    chunks: Iterable,
+    base: str,
+    maximum: int,
+    width: str = "chars"
+) -> Iterator:
+    """
+        Gets the normalized lines of the text given in chunks; see normalize.
+
+        :param chunks: The iterable with the chunks of the text.
+
+        :param base: The indentation of the lines.
+
+        :param maximum: The maximum length of the lines, without the
+         indentation.
+
+        :param width: The way of measuring the width of the lines; see
+         WIDTHS.
+
+        :return: The iterator over the normalized lines.
+    """
+    # Auxiliary variables.
+    empty: bool = True
+    tab: str = _sindent()
+    wrap: Callable = (
+        _normalize_wrap_display if width == "display" else _normalize_wrap
+    )
+
+    for line in _iter_normalize_lines(chunks):
+        # No need to inquire further.
+        if line == "\n":
+            empty = False
+            yield base + line.strip()
+            continue
+
+        # The tabs are replaced; the line break counts as a character.
+        for string in wrap(line.replace("\t", tab), maximum):
+            empty = False
+            yield base + string.strip()
+
+    # An empty text is still indented.
+    if empty:
+        yield base
+
+
+def _iter_normalize_wrap_repr(
+    chunks: Iterable,
+    indent: int,
+    maximum: int
+) -> Iterator:
+    """
+        Gets the lines of the normalized representation of the text given in
+        chunks; see normalize_repr.
+
+        :param chunks: The iterable with the chunks of the text.
+
+        :param indent: The number of indentation levels for the parentheses.
+
+        :param maximum: The maximum length of the representation of the
+         strings, without the indentation.
+
+        :return: The iterator over the lines of the normalized representation.
+    """
+    # Auxiliary variables.
+    basi: str = _sindent(indent + 1, 0)
+    empty: bool = True
+
+    yield f"{_sindent(indent, 0)}("
+
+    for line in _iter_normalize_lines(chunks):
+        # The line break counts as a character.
+        for string in (
+            ("\n",) if line == "\n" else _normalize_wrap_repr(line, maximum)
+        ):
+            empty = False
+            yield basi + repr(string)
+
+    # An empty text still has a line between the parentheses.
+    if empty:
+        yield basi
+
+    yield f"{_sindent(indent, 0)})"
+
+
+def _normalize_join(
+    text: str,
+    base: str,
     maximum: int,
-    irepr: bool = False
+    width: str = "chars"
 ) -> str:
     """
-        Appends the word to the given line, if the line with the appended word
-        does not exceed the maximum number of characters.
+        Gets the normalized text, without validating the parameters; see
+        normalize.
 
-        :param line: The line where the word must be appended.
+        :param text: The string to be normalized.
 
-        :param word: The word to be appended to the line.
+        :param base: The indentation of the lines.
 
-        :param maximum: The maximum length of the string.
+        :param maximum: The maximum length of the lines, without the
+         indentation.
 
-        :param irepr: A boolean flag indicating whether the representation is
-         needed or the text string. True, if the representation (repr) is
-         needed; False, if the regular text string is enough. False, by
-         default.
+        :param width: The way of measuring the width of the lines; see
+         WIDTHS.
+
+        :return: The normalized text.
+    """
+    return "\n".join(_iter_normalize_wrap((text,), base, maximum, width))
+
+
+def _normalize_join_repr(text: str, indent: int, maximum: int) -> str:
+    """
+        Gets the normalized string representation of the text, without
+        validating the parameters; see normalize_repr.
+
+        :param text: The string to be normalized.
+
+        :param indent: The number of indentation levels for the parentheses.
+
+        :param maximum: The maximum length of the representation of the
+         strings, without the indentation.
 
-        :return: The string with the word appended, or not.
+        :return: The normalized string representation of the text.
     """
+    return "\n".join(_iter_normalize_wrap_repr((text,), indent, maximum))
+
+
+def _normalize_many(
+    function: Callable,
+    texts: list,
+    workers: int,
+    chunksize: Union[None, int]
+) -> list:
+    """
+        Applies the normalization function to each text; in a process pool,
+        unless there is a single worker or too few texts (see POOL_MINIMUM).
+
+        :param function: The function that normalizes a single text; it must
+         be picklable.
+
+        :param texts: The list with the texts to be normalized.
+
+        :param workers: The number of processes.
+
+        :param chunksize: The number of texts sent to a process at once; if
+         None, the texts are split into four chunks per process.
+
+        :return: The list with the normalized texts, in the same order.
+    """
+    # Not worth it.
+    if workers == 1 or len(texts) < POOL_MINIMUM:
+        return [function(x) for x in texts]
+
     # Auxiliary variables.
-    char: str = " " if irepr else ""
-    newline: str = f"{word}{char}" if line == "" else f"{line} {word}{char}"
-    length: int = len(repr(newline)) if irepr else len(newline)
+    chunksize = chunksize or -(-len(texts) // (4 * workers))
 
-    # Check the line is the correct length.
-    if length > maximum:
-        newline = line
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, texts, chunksize=chunksize))
 
-    return newline
 
+@cache
+def _normalize_repr_char(char: str) -> tuple:
+    """
+        Gets the counts of the character, once escaped by repr; i.e., the
+        number of characters it takes, and whether it is a single or a double
+        quote. A single quote is escaped, and takes an extra character, only if
+        the string also has a double quote.
 
-def _normalize_get_words(line: str, irepr: bool = False) -> list:
+        :param char: The character to be counted.
+
+        :return: The 3-tuple with the number of characters, the number of
+         single quotes and the number of double quotes.
     """
-        From the given line, replaces all the tabs with the spaces and then
-        splits the line into words; i.e., the line split using spaces.
+    return len(repr(char)) - 2, int(char == "'"), int(char == "\"")
 
-        :param line: The line from where the words must be obtained.
 
-        :param irepr: A boolean flag indicating whether the representation is
-         needed or the text string. True, if the representation (repr) is
-         needed; False, if the regular text string is enough. False, by
-         default.
+def _normalize_repr_counts(string: str) -> tuple:
+    """
+        Gets the counts of the string, once escaped by repr; i.e., the number
+        of characters it takes, without the quotes at the ends and the escaped
+        single quotes, and the number of single and double quotes.
+
+        :param string: The string to be counted.
+
+        :return: The 3-tuple with the number of characters, the number of
+         single quotes and the number of double quotes.
     """
-    # If it is a representation.
-    if irepr:
-        return line.split(" ")
+    # Auxiliary variables.
+    squotes: int = string.count("'")
+    dquotes: int = string.count("\"")
+    characters: int = len(repr(string)) - 2 - (squotes if dquotes else 0)
 
-    return line.replace("\t", sindent()).split(" ")
+    return characters, squotes, dquotes
 
 
-def _normalize_string(line: str, word: str, maximum: int) -> tuple:
+def _normalize_repr_width(counts: tuple) -> int:
     """
-        Creates as many strings as needed to fit the word, provided that there
-        is still 20 percent of the string to fill, or the word takes at least
-        20% of the remaining string.
+        Gets the width of the representation (repr) of a string, from its
+        counts; single quotes are escaped only if there are double quotes.
 
-        :param line: The line where the word must be appended.
+        :param counts: The 3-tuple with the number of characters, the number
+         of single quotes and the number of double quotes of the string.
 
-        :param word: The word to be appended to the line.
+        :return: The width of the representation of the string.
+    """
+    return 2 + counts[0] + (counts[1] if counts[2] else 0)
 
-        :param maximum: The maximum length of the string.
 
-        :return: The string with the word appended, or not.
+def _normalize_wrap(line: str, maximum: int) -> list:
+    """
+        Wraps the line into strings of, at most, the maximum number of
+        characters; the words are separated by single spaces. A word that
+        does not fit is split into as many strings as needed; a new string is
+        started first if the word takes, at most, 10 percent of the string, or
+        if there is, at most, 10 percent of the string left to fill. Otherwise,
+        the word is placed right after the string, without a space.
+
+        Each string is sliced from the line, in a single step, at the last
+        space that fits; so the time is linear in the number of characters.
+
+        :param line: The line to be wrapped.
+
+        :param maximum: The maximum length of the strings.
+
+        :return: The list with the wrapped strings.
     """
     # Auxiliary variables.
-    lines: list = []
-    line_: str = line
-    length: int = len(word)
-    remaining: int = maximum - len(line_)
-
-    # Start a new line if needed.
-    if line_ != "" and (length / maximum <= 0.1 or remaining / maximum <= 0.1):
-        lines.append(line_)
-        line_ = ""
-
-    # Place the word in the string.
-    for char in word:
-        # Add the character to the line.
-        if len(f"{line_}{char}") <= maximum:
-            line_ = f"{line_}{char}"
+    strings: list = []
+    length: int = len(line)
+    start: int = 0
+
+    while True:
+        # A new string never starts with the separators of empty words.
+        while start < length and line[start] == " ":
+            start += 1
+
+        # The rest of the line fits.
+        if length - start <= maximum:
+            if start < length:
+                strings.append(line[start:])
+
+            return strings
+
+        # End of the last word that fits; the first word always fits in the
+        # chunks of a word that was split.
+        end: int = line.rfind(" ", start, start + maximum + 1)
+
+        # The first word does not fit; it is split into chunks.
+        if end == -1:
+            start = _normalize_wrap_chunks(line, start, maximum, strings)
             continue
 
-        # Append the line.
-        lines.append(line_)
-        line_ = char
+        # The next word does not fit.
+        following: int = line.find(" ", end + 1)
+        following = length if following == -1 else following
+        size: int = following - end - 1
+        remaining: int = maximum - (end - start)
 
-    # Append the last characters.
-    lines.append(line_)
+        # Start a new string if the word is short, or the string almost full.
+        if size / maximum <= 0.1 or remaining / maximum <= 0.1:
+            strings.append(line[start:end])
+            start = end + 1
+            continue
 
-    return lines[:-1], lines[-1]
+        # Place the word right after the string; without a space.
+        strings.append(line[start:end] + line[end + 1:end + 1 + remaining])
+        start = end + 1 + remaining
 
+        # Split the rest of the word into chunks, if any.
+        if start < following:
+            start = _normalize_wrap_chunks(line, start, maximum, strings)
 
-def _normalize_string_repr(line: str, word: str, maximum: int) -> tuple:
+
+def _normalize_wrap_chunks(
+    line: str,
+    start: int,
+    maximum: int,
+    strings: list
+) -> int:
+    """
+        Splits the word, that starts at the given position of the line, into
+        chunks of the maximum number of characters; all but the last chunk are
+        appended to the strings.
+
+        :param line: The line with the word.
+
+        :param start: The position of the line where the word starts.
+
+        :param maximum: The maximum length of the strings.
+
+        :param strings: The list where the full chunks are appended.
+
+        :return: The position of the line where the last chunk starts.
     """
-        Creates as many strings as needed to fit the word, provided that there
-        is still 20 percent of the string to fill, or the word takes at least
-        20% of the remaining string.
+    # Auxiliary variables.
+    end: int = line.find(" ", start)
+    end = len(line) if end == -1 else end
+    last: int = start + (end - start - 1) // maximum * maximum
+
+    # Full chunks.
+    strings.extend(line[i:i + maximum] for i in range(start, last, maximum))
 
-        :param line: The line where the word must be appended.
+    return last
+
+
+def _normalize_wrap_display(line: str, maximum: int) -> list:
+    """
+        Wraps the line into strings that take, at most, the maximum number of
+        columns in a terminal; as the _normalize_wrap function does with the
+        number of characters. The wide characters take two columns, and the
+        combining marks none; so a mark is kept with its character. The ASCII
+        lines are wrapped by the _normalize_wrap function, directly.
 
-        :param word: The word to be appended to the line.
+        :param line: The line to be wrapped.
 
-        :param maximum: The maximum length of the string.
+        :param maximum: The maximum number of columns of the strings.
 
-        :return: The string with the word appended, or not.
+        :return: The list with the wrapped strings.
     """
+    # Every character takes one column.
+    if line.isascii():
+        return _normalize_wrap(line, maximum)
+
     # Auxiliary variables.
-    lines: list = []
-    line_: str = f"{line} " if line != "" else ""
-    length: int = len(word)
-    remaining: int = maximum - len(repr(line_))
-
-    # Start a new line if needed.
-    if line_ != "" and (length / maximum <= 0.1 or remaining / maximum <= 0.1):
-        lines.append(line_)
-        line_ = ""
-
-    # Place the word in the string.
-    for char in word:
-        # Add the character to the line.
-        if len(repr(f"{line_}{char}")) <= maximum:
-            line_ = f"{line_}{char}"
+    strings: list = []
+    length: int = len(line)
+    widths: list = list(accumulate(map(_get_width, line), initial=0))
+    start: int = 0
+
+    while True:
+        # A new string never starts with the separators of empty words.
+        while start < length and line[start] == " ":
+            start += 1
+
+        # The rest of the line fits.
+        if widths[length] - widths[start] <= maximum:
+            if start < length:
+                strings.append(line[start:])
+
+            return strings
+
+        # End of the last word that fits.
+        end: int = line.rfind(
+            " ", start, bisect_right(widths, widths[start] + maximum)
+        )
+
+        # The first word does not fit; it is split into chunks.
+        if end == -1:
+            start = _normalize_wrap_display_chunks(
+                line, start, widths, maximum, strings
+            )
+            continue
+
+        # The next word does not fit.
+        following: int = line.find(" ", end + 1)
+        following = length if following == -1 else following
+        remaining: int = maximum - (widths[end] - widths[start])
+
+        # Start a new string if the word is short, or the string almost full.
+        if (widths[following] - widths[end + 1]) / maximum <= 0.1 or (
+            remaining / maximum <= 0.1
+        ):
+            strings.append(line[start:end])
+            start = end + 1
             continue
 
-        # Append the line.
-        lines.append(line_)
-        line_ = char
+        # Place the word right after the string; without a space.
+        fill: int = bisect_right(
+            widths, widths[end + 1] + remaining, end + 1, following + 1
+        ) - 1
+        strings.append(line[start:end] + line[end + 1:fill])
+        start = fill
+
+        # Split the rest of the word into chunks, if any.
+        if start < following:
+            start = _normalize_wrap_display_chunks(
+                line, start, widths, maximum, strings
+            )
+
+
+def _normalize_wrap_display_chunks(
+    line: str,
+    start: int,
+    widths: list,
+    maximum: int,
+    strings: list
+) -> int:
+    """
+        Splits the word, that starts at the given position of the line, into
+        chunks of, at most, the maximum number of columns; all but the last
+        chunk are appended to the strings. Each chunk has, at least, one
+        character.
+
+        :param line: The line with the word.
+
+        :param start: The position of the line where the word starts.
+
+        :param widths: The cumulative display widths of the line.
+
+        :param maximum: The maximum number of columns of the strings.
+
+        :param strings: The list where the full chunks are appended.
+
+        :return: The position of the line where the last chunk starts.
+    """
+    # Auxiliary variables.
+    end: int = line.find(" ", start)
+    end = len(line) if end == -1 else end
+
+    while widths[end] - widths[start] > maximum:
+        # The end of the chunk.
+        split: int = max(
+            bisect_right(widths, widths[start] + maximum, start, end) - 1,
+            start + 1
+        )
+        strings.append(line[start:split])
+        start = split
+
+    return start
+
+
+def _normalize_wrap_repr(line: str, maximum: int) -> list:
+    """
+        Wraps the line into strings whose representation (repr) takes, at
+        most, the maximum number of characters, with a trailing space; the
+        words are separated by single spaces. A word that does not fit is split
+        into as many strings as needed; a new string is started first if the
+        word takes, at most, 10 percent of the string, or if there is, at most,
+        10 percent of the string left to fill.
+
+        The width of the representation is tracked incrementally, from the
+        counts of each word; so the representation of the growing strings is
+        never computed while wrapping.
+
+        :param line: The line to be wrapped.
+
+        :param maximum: The maximum length of the representation of the
+         strings.
+
+        :return: The list with the wrapped strings.
+    """
+    # Auxiliary variables; see _normalize_repr_counts for the counts. The
+    # current string starts and ends at the given positions of the line.
+    characters, squotes, dquotes = 0, 0, 0
+    strings: list = []
+    start, end, first = 0, 0, 0
+
+    for word in line.split(" "):
+        # Auxiliary variables; the word is separated from a non-empty string.
+        wcharacters, wsquotes, wdquotes = _normalize_repr_counts(word)
+        separator: int = int(start != end)
+        last: int = first + len(word)
+
+        # The word fits in the current string, with a trailing space.
+        if 3 + characters + separator + wcharacters + (
+            squotes + wsquotes if dquotes + wdquotes else 0
+        ) <= maximum:
+            start = start if separator else first
+            characters += separator + wcharacters
+            squotes += wsquotes
+            dquotes += wdquotes
+
+        # The word does not fit; split it into chunks.
+        else:
+            start, (characters, squotes, dquotes) = (
+                _normalize_wrap_repr_chunks(
+                    line,
+                    (start, end, first, last),
+                    (characters, squotes, dquotes),
+                    maximum,
+                    strings
+                )
+            )
+
+        # Move to the next word.
+        end, first = last, last + 1
+
+    # Add the last string.
+    if start != end:
+        strings.append(line[start:end])
+
+    return strings
 
-    # Append the last characters.
-    lines.append(line_)
 
-    # Set the last character.
-    if len(repr(lines[-1])) == maximum:
-        char = lines[-1][-1]
-        lines[-1] = lines[-1][:-1]
-        lines.append(f"{char} ")
+def _normalize_wrap_repr_chunks(
+    line: str,
+    bounds: tuple,
+    counts: tuple,
+    maximum: int,
+    strings: list
+) -> tuple:
+    """
+        Places the word that does not fit into the current string; the word is
+        split into as many strings as needed. If the representation of the last
+        string is full, its last character is moved to a new string.
+
+        :param line: The line with the current string and the word.
+
+        :param bounds: The 4-tuple with the positions, in the line, where the
+         current string starts and ends, and where the word starts and ends.
+
+        :param counts: The 3-tuple with the counts of the current string; see
+         _normalize_repr_counts.
+
+        :param maximum: The maximum length of the representation of the
+         strings.
+
+        :param strings: The list where the complete strings are appended.
+
+        :return: The 2-tuple with the position, in the line, where the new
+         current string starts; and its counts. The new current string ends
+         where the word ends.
+    """
+    # Auxiliary variables; the end of the current string is not needed.
+    start, first, last = bounds[0], bounds[2], bounds[3]
+    counts = (counts[0] + 1, counts[1], counts[2])
+
+    # Start a new string if needed; the string keeps the trailing space.
+    if start == bounds[1] or (last - first) / maximum <= 0.1 or (
+        maximum - _normalize_repr_width(counts)
+    ) / maximum <= 0.1:
+        if start != bounds[1]:
+            strings.append(line[start:first])
+
+        start, counts = first, (0, 0, 0)
+
+    # Place the word in the strings; all the characters take one place, or
+    # each character is counted.
+    if maximum > 2 and _normalize_repr_counts(line[first:last]) == (
+        last - first, 0, 0
+    ):
+        start, counts = _normalize_wrap_repr_plain(
+            line, (start, first, last), counts, maximum, strings
+        )
 
     else:
-        lines[-1] = f"{lines[-1]} "
+        for index in range(first, last):
+            # Counts of the string, with the character.
+            char: tuple = _normalize_repr_char(line[index])
+            ncounts: tuple = (
+                counts[0] + char[0], counts[1] + char[1], counts[2] + char[2]
+            )
+
+            # Add the character to the string, or start a new string.
+            if _normalize_repr_width(ncounts) <= maximum:
+                counts = ncounts
+                continue
+
+            strings.append(line[start:index])
+            start, counts = index, char
+
+    # The last character is moved to a new string, if the string is full.
+    if start < last and _normalize_repr_width(counts) == maximum:
+        strings.append(line[start:last - 1])
+
+        return last - 1, _normalize_repr_char(line[last - 1])
+
+    return start, counts
+
+
+def _normalize_wrap_repr_plain(
+    line: str,
+    bounds: tuple,
+    counts: tuple,
+    maximum: int,
+    strings: list
+) -> tuple:
+    """
+        Places the word, whose characters all take one place in the
+        representation, into the current string; the word is sliced into
+        whole chunks.
+
+        :param line: The line with the current string and the word.
+
+        :param bounds: The 3-tuple with the positions, in the line, where the
+         current string starts, and where the word starts and ends.
+
+        :param counts: The 3-tuple with the counts of the current string; see
+         _normalize_repr_counts.
+
+        :param maximum: The maximum length of the representation of the
+         strings; at least 3, so each string has, at least, one character.
 
-    return lines[:-1], lines[-1]
+        :param strings: The list where the complete strings are appended.
+
+        :return: The 2-tuple with the position, in the line, where the new
+         current string starts; and its counts.
+    """
+    # Auxiliary variables.
+    start, first, last = bounds
+    fits: int = max(maximum - _normalize_repr_width(counts), 0)
+
+    # The whole word fits.
+    if last - first <= fits:
+        return start, (counts[0] + last - first, counts[1], counts[2])
+
+    # Fill the current string, and slice the rest of the word.
+    strings.append(line[start:first + fits])
+    first += fits
+    start = first + (last - first - 1) // (maximum - 2) * (maximum - 2)
+
+    strings.extend(
+        line[i:i + maximum - 2] for i in range(first, start, maximum - 2)
+    )
+
+    return start, (last - start, 0, 0)
+
+
+def _parameters_iter_normalize(
+    chunks: Iterable,
+    indent: int = 0,
+    chars: int = 60,
+    include: bool = False,
+    width: str = "chars"
+) -> None:
+    """
+        Validates the parameters for the iter_normalize function are of the
+        correct type; the chunks are validated while they are consumed.
+
+        :param chunks: The iterable with the chunks of the text.
+
+        :param indent: The number of indentation levels for the string.
+
+        :param chars: The maximum number of characters per line.
+
+        :param include: A boolean flag that indicates if the indentation level
+         is included in the character count.
+
+        :param width: The way of measuring the width of the lines.
+
+        :raises TypeError: If the parameters are not of the correct type.
+    """
+    if not isinstance(chunks, Iterable):
+        raise TypeError("The chunks is not an iterable.")
+
+    _parameters_normalize("", indent, chars, include, width)
 
 
 def _parameters_messages_concat(base: str, message: str) -> None:
@@ -178,7 +839,8 @@ def _parameters_normalize(
     string: str,
     indent: int = 0,
     chars: int = 60,
-    include: bool = False
+    include: bool = False,
+    width: str = "chars"
 ) -> None:
     """
         Validates the parameters for the normalize function are of the correct
@@ -196,6 +858,9 @@ def _parameters_normalize(
          is included in the character count. True if the indentation level is
          included; False otherwise.
 
+        :param width: The way of measuring the width of the lines; see
+         WIDTHS.
+
         :raises TypeError: If the parameters are not of the correct type.
     """
     # Auxiliary variables.
@@ -215,11 +880,14 @@ def _parameters_normalize(
     if not isinstance(include, bool):
         message += "The include is not a boolean. "
 
+    if not (isinstance(width, str) and width in WIDTHS):
+        message += f"The width is not one of {WIDTHS}. "
+
     if message != "":
         raise TypeError(message.strip())
 
     # Finish validating.
-    if include and len(sindent(indent + 1, base=0)) >= chars:
+    if include and len(_sindent(indent + 1, 0)) >= chars:
         message += (
             "The indentation level exceeds the maximum number of characters "
             "per line."
@@ -229,6 +897,90 @@ def _parameters_normalize(
         raise TypeError(message.strip())
 
 
+def _parameters_normalize_bytes(
+    buffer: object,
+    encoding: str,
+    errors: str
+) -> None:
+    """
+        Validates the parameters, particular to the normalize_bytes and
+        iter_normalize_bytes functions, are of the correct type.
+
+        :param buffer: The bytes-like object to be normalized.
+
+        :param encoding: The encoding of the text in the buffer.
+
+        :param errors: The error handling scheme of the decoding.
+
+        :raises TypeError: If the parameters are not of the correct type.
+    """
+    # Auxiliary variables.
+    message: str = ""
+
+    if not isinstance(buffer, (bytes, bytearray, memoryview, mmap.mmap)):
+        message += (
+            "The buffer is not a bytes, bytearray, memoryview or mmap object. "
+        )
+
+    elif isinstance(buffer, memoryview) and not buffer.c_contiguous:
+        message += "The buffer is not a contiguous memoryview. "
+
+    try:
+        codecs.lookup(encoding)
+
+    except (LookupError, TypeError):
+        message += "The encoding is not a known encoding. "
+
+    if not isinstance(errors, str):
+        message += "The errors is not a string. "
+
+    if message != "":
+        raise TypeError(message.strip())
+
+
+def _parameters_normalize_many(
+    texts: list,
+    workers: Union[None, int],
+    chunksize: Union[None, int]
+) -> None:
+    """
+        Validates the parameters, particular to the normalize_many and
+        normalize_repr_many functions, are of the correct type.
+
+        :param texts: The list with the texts to be normalized.
+
+        :param workers: The number of processes; None, for the number of
+         processors.
+
+        :param chunksize: The number of texts sent to a process at once; None,
+         to split the texts evenly.
+
+        :raises TypeError: If the parameters are not of the correct type.
+    """
+    # Auxiliary variables.
+    message: str = ""
+
+    if not all(isinstance(x, str) for x in texts):
+        message += "The texts are not all strings. "
+
+    if not (workers is None or isinstance(workers, int) and workers >= 1):
+        message += (
+            "The workers is not None or an integer greater than or equal to "
+            "one. "
+        )
+
+    if not (
+        chunksize is None or isinstance(chunksize, int) and chunksize >= 1
+    ):
+        message += (
+            "The chunksize is not None or an integer greater than or equal to "
+            "one. "
+        )
+
+    if message != "":
+        raise TypeError(message.strip())
+
+
 def _parameters_sindent(
     level: int = 0,
     base: int = 1,
@@ -278,11 +1030,287 @@ def _parameters_sindent(
         raise ValueError(message)
 
 
+@lru_cache(maxsize=256)
+def _sindent(
+    level: int = 0,
+    base: int = 1,
+    spaces: int = 4,
+    istab: bool = False
+) -> str:
+    """
+        Gets the indentation string, without validating the parameters; see
+        sindent. The strings are cached in a bounded table, keyed by the
+        parameters; so each indentation is built only once.
+
+        :param level: The requested indentation level; zero by default.
+
+        :param base: The base indentation level.
+
+        :param spaces: The number of spaces for each indentation level.
+
+        :param istab: A boolean flag that indicates if the indentation is done
+         using tabs or spaces.
+
+        :return: The indentation string.
+    """
+    return ("\t" if istab else " " * spaces) * (base + level)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class MessageBuilder:
+    """
+        Builder of a message from its parts; the parts are concatenated as
+        the messages_concat function would, one after another, but they are
+        joined only once, when the message is built. So long messages, e.g.,
+        error reports with many entries, are built in linear time.
+
+        PARAMETERS:
+        ___________
+
+        - self._last: The last character of the message; empty, if the
+          message is empty.
+
+        - self._parts: The list with the parts of the message, and the
+          separators between them.
+
+        - self._tail: The last non-blank character of the message; empty, if
+          the message is blank.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Dunder
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __str__(self) -> str:
+        """
+            Gets the string representation of the builder.
+
+            :return: The built message.
+        """
+        return self.build()
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, base: str = "") -> None:
+        """
+            Constructor for the builder.
+
+            :param base: The base message to which the parts will be appended;
+             empty, by default.
+
+            :raises TypeError: If the base message is not a string.
+        """
+        # Validate the parameters.
+        _parameters_messages_concat(base, "")
+
+        # Set the attributes.
+        self._last: str = base[-1:]
+        self._parts: list = [base]
+        self._tail: str = base.rstrip()[-1:]
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def append(self, message: str) -> "MessageBuilder":
+        """
+            Appends the message; with the same period and spacing rules as
+            the messages_concat function. An empty message is ignored, and a
+            blank message is replaced.
+
+            :param message: The message to be appended.
+
+            :return: The builder itself; so the calls can be chained.
+
+            :raises TypeError: If the message is not a string.
+        """
+        # Validate the parameters.
+        _parameters_messages_concat("", message)
+
+        # No need to append.
+        if message == "":
+            return self
+
+        # A blank message is replaced; otherwise, the separator depends on
+        # how the message ends.
+        if self._tail == "":
+            self._parts = [message]
+
+        else:
+            separator: str = " " if self._last == "." else (
+                "" if self._tail == "." else ". "
+            )
+            self._parts.extend((separator, message))
+            self._tail = "." if separator == ". " else self._tail
+
+        # Update the ends of the message.
+        self._last = message[-1]
+        self._tail = message.rstrip()[-1:] or self._tail
+
+        return self
+
+    def build(self) -> str:
+        """
+            Builds the message; the parts are joined, and kept joined for any
+            further appended message.
+
+            :return: The built message.
+        """
+        # Auxiliary variables.
+        message: str = "".join(self._parts)
+
+        # Keep the message joined.
+        self._parts = [message]
+
+        return message
+
+
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Functions
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def iter_normalize(
+    chunks: Iterable,
+    indent: int = 0,
+    chars: int = 60,
+    include: bool = False,
+    *,
+    width: str = "chars"
+) -> Iterator:
+    """
+        Gets the normalized lines of the text given in chunks; i.e., the text
+        is the concatenation of the chunks, e.g., the lines of a file, and it
+        is wrapped as in the normalize function. Only the line being read is
+        kept in memory; so large texts can be streamed. Once joined with line
+        breaks, the lines are the same as the normalized text.
+
+        :param chunks: The iterable with the chunks of the text.
+
+        :param indent: The number of indentation levels for the lines.
+
+        :param chars: The maximum number of characters per line.
+
+        :param include: A boolean flag that indicates if the indentation level
+         is included in the character count. True if the indentation level is
+         included; False otherwise.
+
+        :param width: The way of measuring the width of the lines; the
+         number of characters, chars, by default, or the number of columns
+         they take in a terminal, display; see normalize.
+
+        :return: The iterator over the normalized lines.
+
+        :raises TypeError: If the parameters are not of the correct type; the
+         chunks are validated while the lines are consumed.
+    """
+    # Validate the parameters.
+    _parameters_iter_normalize(chunks, indent, chars, include, width)
+
+    # Auxiliary variables.
+    base: str = _sindent(indent, 0)
+    maximum: int = chars - (len(base) if include else 0)
+
+    return _iter_normalize_wrap(chunks, base, maximum, width)
+
+
+# pylint: disable-next=too-many-arguments
+def iter_normalize_bytes(
+    buffer: object,
+    indent: int = 0,
+    chars: int = 60,
+    include: bool = False,
+    *,
+    encoding: str = "utf-8",
+    errors: str = "strict"
+) -> Iterator:
+    """
+        Gets the normalized lines of the text in the bytes-like object; i.e.,
+        the text is decoded and wrapped as in the normalize function. The
+        buffer is decoded window by window (see WINDOW), and only the line
+        being read is kept in memory; so files larger than the memory can be
+        normalized through mmap. Once joined with line breaks, the lines are
+        the same as the normalized text.
+
+        :param buffer: The bytes-like object; i.e., bytes, bytearray, a
+         contiguous memoryview or mmap.
+
+        :param indent: The number of indentation levels for the lines.
+
+        :param chars: The maximum number of characters per line.
+
+        :param include: A boolean flag that indicates if the indentation level
+         is included in the character count. True if the indentation level is
+         included; False otherwise.
+
+        :param encoding: The encoding of the text; UTF-8, by default.
+
+        :param errors: The error handling scheme of the decoding; strict, by
+         default.
+
+        :return: The iterator over the normalized lines.
+
+        :raises TypeError: If the parameters are not of the correct type.
+
+        :raises UnicodeDecodeError: If the text cannot be decoded, with the
+         strict error handling scheme; while the lines are consumed.
+    """
+    # Validate the parameters.
+    _parameters_normalize("", indent, chars, include)
+    _parameters_normalize_bytes(buffer, encoding, errors)
+
+    # Auxiliary variables.
+    base: str = _sindent(indent, 0)
+    maximum: int = chars - (len(base) if include else 0)
+
+    return _iter_normalize_wrap(
+        _iter_decode(buffer, encoding, errors), base, maximum
+    )
+
+
+def iter_normalize_repr(
+    chunks: Iterable,
+    indent: int = 0,
+    chars: int = 60,
+    include: bool = False
+) -> Iterator:
+    """
+        Gets the lines of the normalized string representation of the text
+        given in chunks; i.e., the text is the concatenation of the chunks,
+        e.g., the lines of a file, and it is represented as in the
+        normalize_repr function. Only the line being read is kept in memory;
+        so large texts can be streamed. Once joined with line breaks, the lines
+        are the same as the normalized representation.
+
+        :param chunks: The iterable with the chunks of the text.
+
+        :param indent: The number of indentation levels for the parentheses.
+
+        :param chars: The maximum number of characters per line.
+
+        :param include: A boolean flag that indicates if the indentation level
+         is included in the character count. True if the indentation level is
+         included; False otherwise.
+
+        :return: The iterator over the lines of the normalized representation.
+
+        :raises TypeError: If the parameters are not of the correct type; the
+         chunks are validated while the lines are consumed.
+    """
+    # Validate the parameters.
+    _parameters_iter_normalize(chunks, indent, chars, include)
+
+    # Auxiliary variables.
+    maximum: int = chars - (len(_sindent(indent + 1, 0)) if include else 0)
+
+    return _iter_normalize_wrap_repr(chunks, indent, maximum)
+
+
 def messages_concat(base: str, message: str) -> str:
     """
         Concatenates the message to the base message.
@@ -316,7 +1344,9 @@ def normalize(
     text: str,
     indent: int = 0,
     chars: int = 60,
-    include: bool = False
+    include: bool = False,
+    *,
+    width: str = "chars"
 ) -> str:
     """
         Gets the normalized string of the string; i.e., the string indented by
@@ -325,6 +1355,11 @@ def normalize(
         indentation level must be included in the character count, set the
         include flag to True. Uses the number of characters for a tab as 4.
 
+        With the display width, the lines cannot exceed the given number of
+        columns in a terminal instead; the wide (e.g., CJK) characters take
+        two columns, and the combining marks and format characters none. The
+        ASCII lines are wrapped as with the number of characters, as fast.
+
         :param text: The string to be normalized.
 
         :param indent: The number of indentation levels for the string; and
@@ -337,53 +1372,121 @@ def normalize(
          is included in the character count. True if the indentation level is
          included; False otherwise.
 
+        :param width: The way of measuring the width of the lines; the
+         number of characters, chars, by default, or the number of columns
+         they take in a terminal, display.
+
         :return: The string representation of the object.
     """
     # Validate the parameters.
-    _parameters_normalize(text, indent, chars, include)
+    _parameters_normalize(text, indent, chars, include, width)
 
     # Auxiliary variables.
-    fixed: list = []
-    base: str = f"{sindent(indent, base=0)}"
+    base: str = _sindent(indent, 0)
     maximum: int = chars - (len(base) if include else 0)
-    lines: list = text.split("\n")
 
-    # For each line.
-    for line in lines:
-        # No need to inquire further.
-        if line == "" and len(lines) > 1:
-            fixed.append("\n")
-            continue
+    return _normalize_join(text, base, maximum, width)
+
+
+# pylint: disable-next=too-many-arguments
+def normalize_bytes(
+    buffer: object,
+    indent: int = 0,
+    chars: int = 60,
+    include: bool = False,
+    *,
+    encoding: str = "utf-8",
+    errors: str = "strict"
+) -> str:
+    """
+        Gets the normalized string of the text in the bytes-like object; i.e.,
+        the text is decoded and wrapped as in the normalize function. The
+        buffer is decoded window by window, without copying it first; see
+        iter_normalize_bytes.
 
-        # Auxiliary variables for storing strings temporarily.
-        string: str = ""
-        strings: list = []
+        :param buffer: The bytes-like object; i.e., bytes, bytearray, a
+         contiguous memoryview or mmap.
 
-        words: list = _normalize_get_words(line)
-        words[-1] += "\n" if len(lines) > 1 else ""
+        :param indent: The number of indentation levels for the lines.
 
-        for word in words:
-            # Get the new string
-            newstring: str = _normalize_append(string, word, maximum)
+        :param chars: The maximum number of characters per line.
 
-            # String doesn't fit anymore.
-            if string == newstring:
-                more_strings, newstring = _normalize_string(
-                    string, word, maximum
-                )
-                strings.extend(more_strings)
+        :param include: A boolean flag that indicates if the indentation level
+         is included in the character count. True if the indentation level is
+         included; False otherwise.
+
+        :param encoding: The encoding of the text; UTF-8, by default.
+
+        :param errors: The error handling scheme of the decoding; strict, by
+         default.
+
+        :return: The normalized string.
+
+        :raises TypeError: If the parameters are not of the correct type.
+
+        :raises UnicodeDecodeError: If the text cannot be decoded, with the
+         strict error handling scheme.
+    """
+    return "\n".join(
+        iter_normalize_bytes(
+            buffer, indent, chars, include, encoding=encoding, errors=errors
+        )
+    )
+
+
+# pylint: disable-next=too-many-arguments
+def normalize_many(
+    texts: Iterable,
+    indent: int = 0,
+    chars: int = 60,
+    include: bool = False,
+    *,
+    workers: Union[None, int] = None,
+    chunksize: Union[None, int] = None
+) -> list:
+    """
+        Gets the normalized strings of many independent strings; i.e., each
+        string is normalized as in the normalize function. The strings are
+        spread over a pool of processes, in chunks, unless there are too few
+        of them (see POOL_MINIMUM), or a single worker; the order is kept.
+
+        :param texts: The iterable with the strings to be normalized.
+
+        :param indent: The number of indentation levels for the strings.
+
+        :param chars: The maximum number of characters per line.
+
+        :param include: A boolean flag that indicates if the indentation level
+         is included in the character count. True if the indentation level is
+         included; False otherwise.
 
-            # Update the string.
-            string = newstring
+        :param workers: The number of processes; None, by default, for the
+         number of processors.
 
-        # Add the new line.
-        if string != "":
-            strings.append(string)
+        :param chunksize: The number of strings sent to a process at once;
+         None, by default, to send four chunks to each process.
 
-        # Append the new strings.
-        fixed.extend(strings)
+        :return: The list with the normalized strings, in the same order.
 
-    return base + f"\n{base}".join(x.strip() for x in fixed)
+        :raises TypeError: If the parameters are not of the correct type.
+    """
+    # Auxiliary variables.
+    texts = list(texts)
+
+    # Validate the parameters.
+    _parameters_normalize("", indent, chars, include)
+    _parameters_normalize_many(texts, workers, chunksize)
+
+    # Auxiliary variables.
+    base: str = _sindent(indent, 0)
+    maximum: int = chars - (len(base) if include else 0)
+
+    return _normalize_many(
+        partial(_normalize_join, base=base, maximum=maximum),
+        texts,
+        workers or os.cpu_count() or 1,
+        chunksize
+    )
 
 
 def normalize_repr(
@@ -422,51 +1525,65 @@ def normalize_repr(
     _parameters_normalize(text, indent, chars, include)
 
     # Auxiliary variables.
-    fixed: list = []
-    basi: str = f"{sindent(indent + 1, base=0)}"
-    maximum: int = chars - (len(basi) if include else 0)
-    lines: list = text.split("\n")
+    maximum: int = chars - (len(_sindent(indent + 1, 0)) if include else 0)
 
-    # For each line.
-    for line in lines:
-        # No need to inquire further.
-        if line == "" and len(lines) > 1:
-            fixed.append("\n")
-            continue
+    return _normalize_join_repr(text, indent, maximum)
 
-        # Auxiliary variables for storing strings temporarily.
-        string: str = ""
-        strings: list = []
 
-        words: list = _normalize_get_words(line, True)
-        words[-1] += "\n" if len(lines) > 1 else ""
+# pylint: disable-next=too-many-arguments
+def normalize_repr_many(
+    texts: Iterable,
+    indent: int = 0,
+    chars: int = 60,
+    include: bool = False,
+    *,
+    workers: Union[None, int] = None,
+    chunksize: Union[None, int] = None
+) -> list:
+    """
+        Gets the normalized string representations of many independent
+        strings; i.e., each string is represented as in the normalize_repr
+        function. The strings are spread over a pool of processes, in chunks,
+        unless there are too few of them (see POOL_MINIMUM), or a single
+        worker; the order is kept.
 
-        for word in words:
-            # Get the new string
-            newstring: str = _normalize_append(string, word, maximum, True)
+        :param texts: The iterable with the strings to be normalized.
 
-            # String doesn't fit anymore.
-            if string == newstring:
-                more_strings, newstring = _normalize_string_repr(
-                    string, word, maximum
-                )
-                strings.extend(more_strings)
+        :param indent: The number of indentation levels for the strings.
 
-            # Update the string.
-            string = newstring[:-1]
+        :param chars: The maximum number of characters per line.
+
+        :param include: A boolean flag that indicates if the indentation level
+         is included in the character count. True if the indentation level is
+         included; False otherwise.
+
+        :param workers: The number of processes; None, by default, for the
+         number of processors.
+
+        :param chunksize: The number of strings sent to a process at once;
+         None, by default, to send four chunks to each process.
 
-        # Add the new line.
-        if string != "":
-            strings.append(string)
+        :return: The list with the normalized string representations, in the
+         same order.
 
-        # Append the new strings.
-        fixed.extend(strings)
+        :raises TypeError: If the parameters are not of the correct type.
+    """
+    # Auxiliary variables.
+    texts = list(texts)
 
-    # Finalize joining the strings.
-    string = f"{sindent(indent, base=0)}(\n"
-    string += basi + f"\n{basi}".join(repr(x) for x in fixed)
+    # Validate the parameters.
+    _parameters_normalize("", indent, chars, include)
+    _parameters_normalize_many(texts, workers, chunksize)
 
-    return string + f"\n{sindent(indent, base=0)})"
+    # Auxiliary variables.
+    maximum: int = chars - (len(_sindent(indent + 1, 0)) if include else 0)
+
+    return _normalize_many(
+        partial(_normalize_join_repr, indent=indent, maximum=maximum),
+        texts,
+        workers or os.cpu_count() or 1,
+        chunksize
+    )
 
 
 def sindent(
@@ -497,7 +1614,4 @@ def sindent(
     # Validate the parameters.
     _parameters_sindent(level, base, spaces, istab)
 
-    # Set the indentation character.
-    character: str = "\t" if istab else " " * spaces
-
-    return character * (base + level)
+    return _sindent(level, base, spaces, istab)
@@ -9,10 +9,12 @@
 
 
 # Standard Library.
-from typing import Any, Collection
+from bisect import bisect_left
+from typing import Any, Callable, Collection, Iterable, Iterator, Union
 
 # User.
 from gutilities.exceptions.ecollections import NotInCollectionError
+from gutilities.validation.vtrusted import TRUSTED
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -20,6 +22,84 @@ from gutilities.exceptions.ecollections import NotInCollectionError
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def _index_collection(collection: Collection) -> tuple:
+    """
+        Gets the best representation of the collection for membership tests;
+        a hash set if all the items are hashable, a sorted list if all the
+        items are totally ordered (see _is_totally_ordered), or the
+        collection itself, otherwise.
+
+        :param collection: The collection to be indexed.
+
+        :return: The 2-tuple with the kind of representation ("hash",
+         "sorted" or "scan") and the representation.
+    """
+    # Strings and bytes test for substrings, not for items.
+    if isinstance(collection, (str, bytes, bytearray)):
+        return "scan", collection
+
+    # Hashable items.
+    try:
+        return "hash", frozenset(collection)
+
+    except TypeError:
+        pass
+
+    # Unhashable, but totally ordered, items.
+    try:
+        items: list = sorted(collection)
+
+    except TypeError:
+        return "scan", tuple(collection)
+
+    if _is_totally_ordered(items):
+        return "sorted", items
+
+    return "scan", tuple(collection)
+
+
+def _is_totally_ordered(items: list) -> bool:
+    """
+        Determines whether the sorted items are totally ordered, so a binary
+        search finds them; i.e., they are of the same type, they are NOT sets
+        (i.e., ordered by inclusion), and each one is less than or equal to
+        the next one (e.g., NaN is NOT).
+
+        :param items: The sorted list with the items.
+
+        :return: A boolean value indicating if the items are totally ordered.
+         True, if they are totally ordered; False, otherwise.
+    """
+    # Auxiliary variables.
+    kind: type = type(items[0]) if len(items) > 0 else list
+
+    if issubclass(kind, (set, frozenset)):
+        return False
+
+    try:
+        return {type(x) for x in items} <= {kind} and all(
+            bool(x <= y) for x, y in zip(items, items[1:])
+        )
+
+    except (TypeError, ValueError):
+        return False
+
+
+def _parameters_membership_index(collection: Any) -> None:
+    """
+        Validates the parameters for the MembershipIndex class are of the
+        correct type.
+
+        :param collection: The collection to be indexed.
+
+        :raise ValueError: If any of the parameters do not have the proper type
+         or value.
+    """
+    # Validate the parameters.
+    if not isinstance(collection, Collection):
+        raise ValueError("The \"collection\" must be a collection.")
+
+
 def _parameters_validate_in(collection: Collection, exception: bool) -> None:
     """
         Validates the parameters for the validate_in function are of the
@@ -49,6 +129,153 @@ def _parameters_validate_in(collection: Collection, exception: bool) -> None:
         raise ValueError(message.strip())
 
 
+def _parameters_validate_in_many(
+    values: Any,
+    index: Any,
+    exception: Any
+) -> None:
+    """
+        Validates the parameters for the validate_in_many function are of the
+        correct type.
+
+        :param values: The iterable with the objects to be validated.
+
+        :param index: The membership index, or the collection, in which the
+         objects should be found.
+
+        :param exception: A boolean flag indicating if an exception should be
+         raised if validation fails. True, if the exception must be thrown;
+         False, otherwise. False by default.
+
+        :raise ValueError: If any of the parameters do not have the proper type
+         or value.
+    """
+    # Auxiliary variables.
+    message: str = ""
+
+    # Validate the parameters.
+    if not isinstance(values, Iterable):
+        message += "The \"values\" must be an iterable. "
+
+    if not isinstance(index, Collection):
+        message += "The \"index\" must be a membership index or collection. "
+
+    if not isinstance(exception, bool):
+        message += "The \"exception\" must be a boolean value."
+
+    # Raise the error as needed.
+    if message != "":
+        raise ValueError(message.strip())
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class MembershipIndex:
+    """
+        Membership index of a collection, built once; the collection is kept
+        in the representation with the fastest membership test. Integer
+        ranges are tested arithmetically, hashable items with a hash set, and
+        unhashable, but totally ordered, items with a binary search over a
+        sorted list; any other collection is scanned. The collection must NOT
+        be modified after indexing.
+
+        PARAMETERS:
+        ___________
+
+        - self.collection: The indexed collection.
+
+        - self.kind: The kind of representation; one of the kinds in KINDS.
+
+        - self._index: The representation of the collection.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Class Variables
+    # /////////////////////////////////////////////////////////////////////////
+
+    KINDS: tuple = ("hash", "range", "scan", "sorted")
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Dunder
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __contains__(self, item: Any) -> bool:
+        """
+            Determines whether the item is in the collection; with the same
+            result as testing the collection itself.
+
+            :param item: The item to be found.
+
+            :return: A boolean value indicating if the item is in the
+             collection. True, if it is in the collection; False, otherwise.
+        """
+        # Hash set; unhashable items are compared one by one.
+        if self.kind == "hash":
+            try:
+                return item in self._index
+
+            except TypeError:
+                return item in self.collection
+
+        # Sorted list; unorderable items are compared one by one.
+        if self.kind == "sorted":
+            try:
+                position: int = bisect_left(self._index, item)
+
+            except TypeError:
+                return item in self.collection
+
+            return (
+                position < len(self._index) and self._index[position] == item
+            )
+
+        # Ranges only test integers without iterating.
+        if self.kind == "range" and isinstance(item, float):
+            return item.is_integer() and int(item) in self._index
+
+        return item in self._index
+
+    def __iter__(self) -> Iterator:
+        """
+            Iterates over the items of the indexed collection.
+
+            :return: The iterator over the items of the indexed collection.
+        """
+        return iter(self.collection)
+
+    def __len__(self) -> int:
+        """
+            Gets the number of items of the indexed collection.
+
+            :return: The number of items of the indexed collection.
+        """
+        return len(self.collection)
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, collection: Collection) -> None:
+        """
+            Indexes the collection.
+
+            :param collection: The collection to be indexed.
+        """
+        # Validate the parameters.
+        _parameters_membership_index(collection)
+
+        # Set the attributes.
+        self.collection: Collection = collection
+        self.kind: str = "range"
+        self._index: Any = collection
+
+        # Ranges are already tested arithmetically.
+        if not isinstance(collection, range):
+            self.kind, self._index = _index_collection(collection)
+
+
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Functions
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -56,7 +283,7 @@ def _parameters_validate_in(collection: Collection, exception: bool) -> None:
 
 def validate_in(
     vobject: Any,
-    collection: Collection,
+    collection: Union[Collection, MembershipIndex],
     exception: bool = False
 ) -> bool:
     """
@@ -64,7 +291,8 @@ def validate_in(
 
         :param vobject: The object to be validated.
 
-        :param collection: The collection in which the object should be found.
+        :param collection: The collection in which the object should be found;
+         or its membership index, for repeated validations.
 
         :param exception: A boolean flag indicating if an exception should be
          raised if validation fails. True, if the exception must be thrown;
@@ -75,14 +303,70 @@ def validate_in(
         :raise NotInCollectionError: If the object is not in the collection and
          the "exception" flag is set to True.
     """
-    # Validate the parameters.
-    _parameters_validate_in(collection, exception)
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_in(collection, exception)
 
     # Get the result.
     result: bool = vobject in collection
 
-    # Raise an exception if necessary.
+    # Raise an exception if necessary; with the original collection.
     if not result and exception:
+        if isinstance(collection, MembershipIndex):
+            collection = collection.collection
+
         raise NotInCollectionError(None, vobject, collection)
 
     return result
+
+
+def validate_in_many(
+    values: Iterable,
+    index: Union[Collection, MembershipIndex],
+    exception: bool = False
+) -> list:
+    """
+        Validates that each of the given items is in the collection; the
+        collection is indexed only once.
+
+        :param values: The iterable with the objects to be validated.
+
+        :param index: The membership index of the collection in which the
+         objects should be found; or the collection itself, which is then
+         indexed.
+
+        :param exception: A boolean flag indicating if an exception should be
+         raised if validation fails. True, if the exception must be thrown
+         for the first object that is not in the collection; False,
+         otherwise. False by default.
+
+        :return: The list with the boolean values indicating if each object
+         is in the collection, in the same order as the objects.
+
+        :raise NotInCollectionError: If an object is not in the collection and
+         the "exception" flag is set to True.
+    """
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_in_many(values, index, exception)
+
+    # Index the collection, only once.
+    if not isinstance(index, MembershipIndex):
+        index = MembershipIndex(index)
+
+    # Get the results.
+    contains: Callable = index.__contains__
+
+    if not exception:
+        return [contains(x) for x in values]
+
+    # Raise an exception for the first object not in the collection.
+    results: list = []
+
+    for value in values:
+        if not contains(value):
+            raise NotInCollectionError(None, value, index.collection)
+
+        results.append(True)
+
+    return results
@@ -9,12 +9,13 @@
 
 
 # Standard Library.
-from typing import Any, Callable, Type
+from typing import Any, Callable, Iterator, Type, Union
 
 # User.
 from gutilities.validation.vgeneral import (
-    validate_type
+    compile_type_check
 )
+from gutilities.validation.vtrusted import TRUSTED
 from gutilities.exceptions.edicts import (
     WrongKeysError,
     WrongKeysAndTypeError,
@@ -28,11 +29,147 @@ from gutilities.exceptions.edicts import (
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def _compile_plan(
+    base: dict,
+    depth_max: int,
+    typed: bool,
+    extract: bool
+) -> dict:
+    """
+        Compiles the base dictionary into a validation plan; i.e., a
+        dictionary with the same structure as the base dictionary, down to the
+        maximum validation depth, where the ends are replaced by the tuples of
+        types that the dictionary must have at that point, if the types are
+        validated, or None, otherwise.
+
+        :param base: The base dictionary.
+
+        :param depth_max: The maximum validation depth; -1 if the validation
+         must be performed to the deepest level of the base dictionary.
+
+        :param typed: A boolean flag indicating whether the types at the ends
+         of the base dictionary must be compiled. True, if the types must be
+         compiled; False, otherwise.
+
+        :param extract: A boolean flag indicating whether the data type of
+         the base dictionary must be extracted rather than directly used.
+         True, if the data type must be extracted; False, otherwise.
+
+        :return: The compiled validation plan.
+    """
+    # Auxiliary variables.
+    plan: dict = {}
+    stack: list = [(base, plan, 0)]
+
+    # Compile the levels of the base dictionary.
+    while stack:
+        node, pnode, depth = stack.pop()
+
+        for key, value in node.items():
+            # Nested dictionaries are only needed up to the maximum depth.
+            flag: bool = typed or depth_max < 0 or depth < depth_max
+
+            if isinstance(value, dict) and flag:
+                pnode[key] = {}
+                stack.append((value, pnode[key], depth + 1))
+                continue
+
+            # The ends of the dictionary.
+            pnode[key] = None
+
+            if typed:
+                pnode[key] = _compile_types(type(value) if extract else value)
+
+    return plan
+
+
+def _compile_types(dtype: Any) -> tuple:
+    """
+        Compiles the given data type(s) into a tuple of types that can be
+        directly used with isinstance; None is replaced by its type.
+
+        :param dtype: The data type, or tuple of data types; it can be None.
+
+        :return: The tuple with the compiled data types.
+
+        :raise ValueError: If the data type is not a type, None or a non-empty
+         tuple of types and/or None.
+    """
+    # Auxiliary variables.
+    dtypes: tuple = dtype if isinstance(dtype, tuple) else (dtype,)
+
+    # All entries must be valid types.
+    flag: bool = all(x is None or isinstance(x, Type) for x in dtypes)
+
+    if not (len(dtypes) > 0 and flag):
+        raise ValueError(
+            f"The types at the ends of the base dictionary must be a type, "
+            f"None, or a non-empty tuple of types and/or None; current type: "
+            f"{type(dtype).__name__}."
+        )
+
+    return tuple(type(None) if x is None else x for x in dtypes)
+
+
+def _parameters_compile_schema(
+    base: Any,
+    mode: Any,
+    depth: Any,
+    extract: Any
+) -> None:
+    """
+        Validates the parameters for the compile_schema function are of the
+        correct type.
+
+        :param base: The base dictionary to be compiled.
+
+        :param mode: The validation mode; one of the modes in
+         CompiledSchema.MODES.
+
+        :param depth: The depth to which the validation should be performed;
+         only used by the modes that do not validate the types.
+
+        :param extract: A boolean flag indicating whether the data type of
+         the base dictionary must be extracted rather than directly used;
+         only used by the modes that validate the types.
+
+        :raise ValueError: If any of the parameters do not have the proper type
+         or value.
+    """
+    # Auxiliary variables.
+    message: str = ""
+    string: Callable = lambda x, y, z: (
+        f"The \"{x}\" parameter must be a {y}; current type: "
+        f"{type(z).__name__}."
+    )
+
+    # Validate the different quantities.
+    if not isinstance(base, dict):
+        message += string("base", "dictionary", base)
+
+    if not (isinstance(mode, str) and mode in CompiledSchema.MODES):
+        message += (
+            f"The \"mode\" parameter must be one of {CompiledSchema.MODES}; "
+            f"current value: {mode}."
+        )
+
+    if not (isinstance(depth, int) and depth >= -1):
+        message += string("depth", "positive integer or -1", depth)
+
+    if not isinstance(extract, bool):
+        message += string("extract", "boolean value", extract)
+
+    # Raise the error as needed.
+    if message != "":
+        raise ValueError(message.strip())
+
+
 def _parameters_validate_keys(
     base: Any,
     dictionary: Any,
     depth: Any,
-    exception: Any
+    exception: Any,
+    failfast: Any
 ) -> None:
     """
         Validates the parameters for the validate_keys_equal function are of
@@ -49,6 +186,12 @@ def _parameters_validate_keys(
         :param exception: A boolean flag indicating if an exception must be
          raised if validation fails. True, if the exception must be raised;
          False, otherwise. False by default.
+
+        :param failfast: A boolean flag indicating whether the validation must
+         stop at the first mismatch. True, if the validation must stop at the
+         first mismatch; False, if every mismatch must be gathered, only if
+         the exception must be raised. None, to stop at the first mismatch
+         only if the exception must not be raised.
     """
     # Auxiliary variables.
     message: str = ""
@@ -70,6 +213,15 @@ def _parameters_validate_keys(
     if not isinstance(exception, bool):
         message += string("exception", "boolean value", exception)
 
+    if not (failfast is None or isinstance(failfast, bool)):
+        message += string("failfast", "boolean value or None", failfast)
+
+    if failfast is False and exception is False:
+        message += (
+            "The \"failfast\" parameter can only be False if the exception "
+            "must be raised; the mismatches are discarded, otherwise."
+        )
+
     # Raise the error as needed.
     if message != "":
         raise ValueError(message.strip())
@@ -79,7 +231,8 @@ def _parameters_validate_keys_and_types(
     base: Any,
     dictionary: Any,
     extract: Any,
-    exception: Any
+    exception: Any,
+    failfast: Any
 ) -> None:
     """
         Validates the parameters for the validate_keys_equal function are of
@@ -96,6 +249,12 @@ def _parameters_validate_keys_and_types(
         :param exception: A boolean flag indicating if an exception must be
          raised if validation fails. True, if the exception must be raised;
          False, otherwise. False by default.
+
+        :param failfast: A boolean flag indicating whether the validation must
+         stop at the first mismatch. True, if the validation must stop at the
+         first mismatch; False, if every mismatch must be gathered, only if
+         the exception must be raised. None, to stop at the first mismatch
+         only if the exception must not be raised.
     """
     # Auxiliary variables.
     message: str = ""
@@ -117,196 +276,503 @@ def _parameters_validate_keys_and_types(
     if not isinstance(exception, bool):
         message += string("exception", "boolean value", exception)
 
+    if not (failfast is None or isinstance(failfast, bool)):
+        message += string("failfast", "boolean value or None", failfast)
+
+    if failfast is False and exception is False:
+        message += (
+            "The \"failfast\" parameter can only be False if the exception "
+            "must be raised; the mismatches are discarded, otherwise."
+        )
+
     # Raise the error as needed.
     if message != "":
         raise ValueError(message.strip())
 
 
-def _validate_keys_equal(
-    object_0: Any,
-    object_1: Any,
-    depth_max: int,
-    depth: int = 0
-) -> bool:
+def _traverse(
+    dictionary: dict,
+    base: dict,
+    rules: tuple,
+    failfast: bool = True
+) -> list:
     """
-        Recursively validates the keys of both dictionaries are exactly the
-        same.
+        Traverses the dictionary and the base dictionary simultaneously, depth
+        first, with an explicit stack rather than recursion; the stack only
+        holds one entry per level, so the memory used is proportional to the
+        depth of the dictionaries and there is no recursion limit. This is the
+        traversal shared by the validation functions and the exceptions.
+
+        :param dictionary: The dictionary to be validated.
+
+        :param base: The base dictionary, or a compiled validation plan.
+
+        :param rules: A 3-tuple with the rules of the traversal. The first
+         entry is the maximum validation depth; -1 if the validation must be
+         performed to the deepest level of the base dictionary. The second
+         entry is the number of levels, starting from the root, at which the
+         dictionary is only required to be a subset of the base dictionary;
+         deeper levels must have exactly the same keys. Zero, if the keys must
+         be the same at every level; -1, if a subset is allowed at every
+         level. The third entry is the function used to validate the values
+         at the ends of the base dictionary, called with the value and the
+         end of the base dictionary; None, if only the keys are validated.
+
+        :param failfast: A boolean flag indicating whether the traversal must
+         stop at the first mismatch. True, if the traversal must stop at the
+         first mismatch; False, if all the mismatches must be found. True by
+         default.
+
+        :return: The list with the mismatches, in depth-first order; empty if
+         the dictionary is valid. Each mismatch is a tuple with the kind of
+         mismatch ("dict", "notdict", "keys" or "type"), the depth, the path
+         and the details of the mismatch. The path is None for the root, or a
+         tuple with the path of the parent and the key, otherwise.
+    """
+    # Auxiliary variables.
+    mismatches: list = []
+    stack: list = []
+
+    # The root of the dictionaries.
+    keys: Union[None, tuple] = _traverse_keys(dictionary, base, rules[1] != 0)
+
+    if keys is not None:
+        mismatches.append(("keys", 0, None, keys))
+
+        if failfast:
+            return mismatches
 
-        :param object_0: The dictionary to be validated.
+    if not -1 < rules[0] < 1:
+        stack.append((
+            iter(dictionary.items()) if failfast else
+            _traverse_items(dictionary, base), base, 1, None
+        ))
 
-        :param object_1: The keys that the dictionary must have.
+    _traverse_stack(stack, rules, mismatches, failfast)
 
-        :param depth_max: The maximum validation depth.
+    return mismatches
 
-        :param depth: The current depth of the validation. The user must NOT
-         tamper with this parameter.
 
-        :return: A boolean value indicating if the dictionary has the same
-         keys as the base dictionary, to the given depth. True if the
-         dictionary has the same keys as the base dictionary; False, otherwise.
+def _traverse_get(base: dict, path: tuple) -> Any:
     """
-    # No need to continue.
-    flag: bool = depth_max > -1
+        Gets the entry of the base dictionary at the given path.
 
-    if flag and depth > depth_max:
-        return True
+        :param base: The base dictionary.
 
-    # Check if the end has been reached.
-    if not (isinstance(object_0, dict) or isinstance(object_1, dict)):
-        return True
+        :param path: The tuple with the path of the parent and the key, as
+         found by the traversal.
 
-    # Both must be dictionaries.
-    flag = isinstance(object_0, dict) and isinstance(object_1, dict)
+        :return: The entry of the base dictionary at the given path.
+    """
+    # Auxiliary variables.
+    keys: list = []
 
-    if not (flag and set(object_0.keys()) == set(object_1.keys())):
-        return False
+    # Walk back to the root.
+    while path is not None:
+        path, key = path
+        keys.append(key)
 
-    # Recursive step.
-    for key, value in object_0.items():
-        flag = flag and _validate_keys_equal(
-            value, object_1[key], depth_max, depth + 1
-        )
+    for key in reversed(keys):
+        base = base[key]
 
-    return flag
+    return base
 
 
-def _validate_keys_equal_and_type(
-    object_0: Any,
-    object_1: Any,
-    extract: bool,
-) -> bool:
+def _traverse_items(dictionary: dict, base: dict) -> Iterator:
     """
-        Recursively validates the keys of both dictionaries are exactly the
-        same keys, and the type of the entry of the dictionaries are the same
-        as those at the end of the base dictionary.
+        Gets the iterator over the keys and values of the dictionary that are
+        also in the base dictionary, following the order of the base
+        dictionary; used when all the mismatches must be found, so they are
+        reported in a predictable order.
+
+        :param dictionary: The dictionary to be validated, at a single level.
 
-        :param object_0: The dictionary to be validated.
+        :param base: The base dictionary, at the same level.
 
-        :param object_1: The base dictionary to be used as the comparison
+        :return: The iterator over the common keys and the values of the
          dictionary.
+    """
+    return ((x, dictionary[x]) for x in base if x in dictionary)
 
-        :param extract: A boolean flag indicating whether the data type of
-         the base dictionary must be extracted rather than directly used.
-         True, if the data type must be extracted; False, otherwise.
 
-        :return: A boolean value indicating if the dictionary has the same
-         keys as the base dictionary, to the given depth. True if the
-         dictionary has the same keys as the base dictionary; False, otherwise.
+def _traverse_keys(
+    dictionary: dict,
+    base: dict,
+    subset: bool
+) -> Union[None, tuple]:
     """
-    # Check the type when the end has been reached.
-    if not isinstance(object_1, dict):
-        dtype: Type = type(object_1) if extract else object_1
-        return validate_type(object_0, dtype, exception=False)
+        Compares the keys of the dictionary with the keys of the base
+        dictionary, at a single level.
 
-    # Both must be dictionaries.
-    flag: bool = isinstance(object_0, dict)
+        :param dictionary: The dictionary to be validated.
 
-    if not (flag and set(object_0.keys()) == set(object_1.keys())):
-        return False
+        :param base: The base dictionary.
 
-    # Recursive step.
-    for key, value in object_0.items():
-        flag = flag and _validate_keys_equal_and_type(
-            value,
-            object_1[key],
-            extract
-        )
+        :param subset: A boolean flag indicating whether the keys of the
+         dictionary are only required to be a subset of the keys of the base
+         dictionary. True, if the keys must be a subset; False, if the keys
+         must be the same.
 
-    return flag
+        :return: None, if the keys are valid; otherwise, a 2-tuple with the
+         sets of missing and excess keys.
+    """
+    # Auxiliary variables.
+    keys = dictionary.keys()
 
+    # The keys are valid.
+    if keys <= base.keys() if subset else keys == base.keys():
+        return None
 
-def _validate_keys_subset(
-    object_0: Any,
-    object_1: Any,
-    depth_max: int,
-    depth: int = 0
-) -> bool:
+    # Missing and excess keys.
+    excess: set = set(keys) - set(base.keys())
+    missing: set = set() if subset else set(base.keys()) - set(keys)
+
+    return missing, excess
+
+
+def _traverse_stack(
+    stack: list,
+    rules: tuple,
+    mismatches: list,
+    failfast: bool
+) -> None:
+    """
+        Validates the entries of the levels in the stack, always continuing
+        with the deepest level that has not been exhausted; the iterator of
+        each level keeps track of its progress.
+
+        :param stack: The list with the levels being traversed; each level is
+         a 4-tuple with the iterator over the keys and values, the base
+         dictionary, the depth and the path of the level.
+
+        :param rules: The 3-tuple with the rules of the traversal; see the
+         _traverse function.
+
+        :param mismatches: The list where the mismatches are appended.
+
+        :param failfast: A boolean flag indicating whether the traversal stops
+         at the first mismatch. True, if the traversal stops at the first
+         mismatch; False, if all the mismatches must be found.
     """
-        Recursively validates the first dictionary is a subset, or a proper
-        subset, of the the second dictionary.
+    # Auxiliary variables.
+    depth_max, subset, check = rules
+
+    while stack and not (failfast and mismatches):
+        items, node, depth, path = stack[-1]
+
+        for key, item in items:
+            child: Any = node[key]
+
+            # The end of the base dictionary has been reached.
+            if not isinstance(child, dict):
+                if (
+                    not isinstance(item, dict) if check is None else
+                    check(item, child)
+                ):
+                    continue
+
+                mismatches.append(
+                    ("dict", depth, (path, key), item) if check is None else
+                    ("type", depth, (path, key), (child, item))
+                )
+
+            # Both must be dictionaries.
+            elif not isinstance(item, dict):
+                mismatches.append(("notdict", depth, (path, key), item))
+
+            # The keys must be a subset of, or the same as, the base keys.
+            else:
+                keys: Union[None, tuple] = _traverse_keys(
+                    item, child, subset < 0 or depth < subset
+                )
 
-        :param object_0: The dictionary that must be a subset of the other one.
+                if keys is not None:
+                    mismatches.append(("keys", depth, (path, key), keys))
 
-        :param object_1: The dictionary with the keys.
+                # Next depth level; the current level is resumed afterwards.
+                if not -1 < depth_max <= depth:
+                    stack.append((
+                        iter(item.items()) if failfast else
+                        _traverse_items(item, child), child, depth + 1,
+                        (path, key)
+                    ))
+                    break
 
-        :param depth_max: The maximum validation depth.
+                if keys is None:
+                    continue
 
-        :param depth: The current depth of the validation. The user must NOT
-         tamper with this parameter.
+            if failfast:
+                break
 
-        :return: A boolean value indicating if the first dictionary is a
-         subset, or a proper subset, of the second one, to the given depth.
-         True if the first dictionary is a subset, or a proper subset, of the
-         second one; False, otherwise.
+        else:
+            stack.pop()
+
+
+def _validate_type_extract(value: Any, base: Any) -> bool:
     """
-    # No need to continue.
-    flag: bool = depth_max > -1
+        Validates the value has the same type as the end of the base
+        dictionary; i.e., the data type is extracted from the base dictionary.
 
-    if flag and depth > depth_max:
-        return True
+        :param value: The value to be validated.
 
-    # Check if the end has been reached.
-    if not (isinstance(object_0, dict) or isinstance(object_1, dict)):
-        return True
+        :param base: The end of the base dictionary.
 
-    # Both must be dictionaries.
-    flag = isinstance(object_0, dict) and isinstance(object_1, dict)
+        :return: A boolean value indicating if the value has the same type as
+         the end of the base dictionary. True, if it has the same type; False,
+         otherwise.
+    """
+    return compile_type_check(type(base))(value)
 
-    if not (flag and set(object_0.keys()).issubset(set(object_1.keys()))):
-        return False
 
-    # Recursive step.
-    for key, value in object_0.items():
-        flag = flag and _validate_keys_equal(
-            value, object_1[key], depth_max, depth + 1
-        )
+def _validate_type_leaf(value: Any, base: Any) -> bool:
+    """
+        Validates the value is of the type(s) at the end of the base
+        dictionary; the type check is compiled once, and cached, for each
+        distinct end.
 
-    return flag
+        :param value: The value to be validated.
 
+        :param base: The end of the base dictionary; a type, None or a tuple
+         of types and/or None.
 
-def _validate_keys_subset_and_type(
-    object_0: Any,
-    object_1: Any,
-    extract: bool,
-) -> bool:
+        :return: A boolean value indicating if the value is of the type(s) at
+         the end of the base dictionary. True, if it is; False, otherwise.
+
+        :raises ValueError: If the end of the base dictionary is not a type,
+         None or a non-empty tuple of types and/or None.
     """
-        Recursively validates the first dictionary is a subset, or a proper
-        subset, of the the second dictionary, and the type of the entry of
-        the dictionaries are the same as those at the end of the base
-        dictionary.
+    return compile_type_check(base)(value)
 
-        :param object_0: The dictionary that must be a subset of the other one.
 
-        :param object_1: The dictionary with the keys.
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
-        :param extract: A boolean flag indicating whether the data type of
-         the base dictionary must be extracted rather than directly used.
-         True, if the data type must be extracted; False, otherwise.
 
-        :return: A boolean value indicating if the dictionary has the same
-         keys as the base dictionary, to the given depth. True if the
-         dictionary has the same keys as the base dictionary; False, otherwise.
+class CompiledSchema:
     """
-    # Check the type when the end has been reached.
-    if not isinstance(object_1, dict):
-        dtype: Type = type(object_1) if extract else object_1
-        return validate_type(object_0, dtype, exception=False)
+        Reusable dictionary validator, compiled once from a base dictionary.
+        The structure of the base dictionary, and the types at its ends, are
+        resolved when compiling; so calling the validator only walks the
+        dictionary being validated. Must be created with compile_schema; the
+        base dictionary must NOT be modified after compiling.
+
+        PARAMETERS:
+        ___________
+
+        - self.base: The base dictionary the validator was compiled from.
+
+        - self.depth: The depth to which the validation is performed; only
+          used by the modes that do not validate the types.
+
+        - self.extract: A boolean flag indicating whether the data type of the
+          base dictionary is extracted rather than directly used; only used by
+          the modes that validate the types.
 
-    # Both must be dictionaries.
-    flag: bool = isinstance(object_0, dict)
+        - self.mode: The validation mode; one of the modes in MODES.
 
-    if not (flag and set(object_0.keys()).issubset(set(object_1.keys()))):
-        return False
+        - self._plan: The compiled validation plan.
+
+        - self._rules: The 3-tuple with the rules of the traversal.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Class Variables
+    # /////////////////////////////////////////////////////////////////////////
+
+    MODES: tuple = ("equal", "equal_and_type", "subset", "subset_and_type")
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Dunder
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __call__(
+        self,
+        dictionary: dict,
+        exception: bool = False,
+        failfast: Union[None, bool] = None
+    ) -> bool:
+        """
+            Validates the given dictionary; see the validate method.
+
+            :param dictionary: The dictionary to be validated.
+
+            :param exception: A boolean flag indicating if an exception must be
+             raised if validation fails. True, if the exception must be raised;
+             False, otherwise. False by default.
+
+            :param failfast: A boolean flag indicating whether the validation
+             must stop at the first mismatch. True, if the validation must stop
+             at the first mismatch, and the exception only reports it; False,
+             if every mismatch must be gathered in a single pass over the
+             dictionary, and the exception reports all of them; only valid if
+             the exception must be raised, since the mismatches are not
+             returned otherwise. None, to stop at the first mismatch only if
+             the exception must not be raised. None by default.
+
+            :return: A boolean value indicating if the dictionary is valid.
+        """
+        return self.validate(dictionary, exception, failfast)
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Auxiliary
+    # /////////////////////////////////////////////////////////////////////////
+
+    def _raise(self, dictionary: Any, mismatches: list) -> None:
+        """
+            Raises the exception that corresponds to the validation mode.
+
+            :param dictionary: The dictionary that failed the validation.
+
+            :param mismatches: The list with the mismatches found with the
+             compiled plan.
+        """
+        # Keys only.
+        if self.mode == "equal":
+            raise WrongKeysError(
+                None, self.base, dictionary, self.depth, mismatches=mismatches
+            )
+
+        if self.mode == "subset":
+            raise WrongKeysSubsetError(
+                None, self.base, dictionary, self.depth, mismatches=mismatches
+            )
+
+        # The compiled types must be reported as in the base dictionary.
+        mismatches = [
+            (x[0], x[1], x[2], (_traverse_get(self.base, x[2]), x[3][1]))
+            if x[0] == "type" else x for x in mismatches
+        ]
+
+        # Keys and types.
+        if self.mode == "equal_and_type":
+            raise WrongKeysAndTypeError(
+                None, self.base, dictionary, self.extract,
+                mismatches=mismatches
+            )
+
+        raise WrongKeysSubsetAndTypeError(
+            None, self.base, dictionary, self.extract, mismatches=mismatches
+        )
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        base: dict,
+        mode: str = "equal",
+        depth: int = 0,
+        extract: bool = False
+    ) -> None:
+        """
+            Compiles the validator.
+
+            :param base: The base dictionary to be compiled.
+
+            :param mode: The validation mode; one of the modes in MODES.
+
+            :param depth: The depth to which the validation should be
+             performed; only used by the modes that do not validate the types.
+
+            :param extract: A boolean flag indicating whether the data type of
+             the base dictionary must be extracted rather than directly used;
+             only used by the modes that validate the types.
+        """
+        # Validate the parameters.
+        _parameters_compile_schema(base, mode, depth, extract)
+
+        # Set the attributes.
+        self.base: dict = base
+        self.depth: int = depth
+        self.extract: bool = extract
+        self.mode: str = mode
+
+        # Set the traversal rules.
+        typed: bool = mode.endswith("_and_type")
+        subset: int = 0
+
+        if mode.startswith("subset"):
+            subset = -1 if typed else 1
+
+        self._rules: tuple = (
+            -1 if typed else depth, subset, isinstance if typed else None
+        )
 
-    # Recursive step.
-    for key, value in object_0.items():
-        flag = flag and _validate_keys_subset_and_type(
-            value,
-            object_1[key],
-            extract
+        # Compile the plan.
+        self._plan: dict = _compile_plan(base, self._rules[0], typed, extract)
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def validate(
+        self,
+        dictionary: dict,
+        exception: bool = False,
+        failfast: Union[None, bool] = None
+    ) -> bool:
+        """
+            Validates the given dictionary against the compiled base
+            dictionary; equivalent to calling the validate_keys_* function
+            that corresponds to the validation mode.
+
+            :param dictionary: The dictionary to be validated.
+
+            :param exception: A boolean flag indicating if an exception must be
+             raised if validation fails. True, if the exception must be raised;
+             False, otherwise. False by default.
+
+            :param failfast: A boolean flag indicating whether the validation
+             must stop at the first mismatch. True, if the validation must stop
+             at the first mismatch, and the exception only reports it; False,
+             if every mismatch must be gathered in a single pass over the
+             dictionary, and the exception reports all of them; only valid if
+             the exception must be raised, since the mismatches are not
+             returned otherwise. None, to stop at the first mismatch only if
+             the exception must not be raised. None by default.
+
+            :return: A boolean value indicating if the dictionary is valid,
+             according to the validation mode. True, if the dictionary is
+             valid; False, otherwise.
+        """
+        # Validate the parameters.
+        if not isinstance(dictionary, dict):
+            raise ValueError(
+                f"The \"dictionary\" parameter must be a dictionary; current "
+                f"type: {type(dictionary).__name__}."
+            )
+
+        if not (
+            isinstance(exception, bool) and
+            (failfast is None or isinstance(failfast, bool))
+        ):
+            raise ValueError(
+                f"The \"exception\" and \"failfast\" parameters must be a "
+                f"boolean value, and a boolean value or None, respectively; "
+                f"current types: {type(exception).__name__} and "
+                f"{type(failfast).__name__}."
+            )
+
+        if failfast is False and exception is False:
+            raise ValueError(
+                "The \"failfast\" parameter can only be False if the "
+                "exception must be raised; the mismatches are discarded, "
+                "otherwise."
+            )
+
+        # Compare the dictionaries; every mismatch is gathered for the
+        # exception, unless requested otherwise.
+        mismatches: list = _traverse(
+            dictionary, self._plan, self._rules,
+            not exception if failfast is None else failfast
         )
 
-    return flag
+        # Raise an exception if necessary; with the mismatches already found.
+        if mismatches and exception:
+            self._raise(dictionary, mismatches)
+
+        return not mismatches
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -314,11 +780,51 @@ def _validate_keys_subset_and_type(
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def compile_schema(
+    base: dict,
+    mode: str = "equal",
+    depth: int = 0,
+    extract: bool = False
+) -> CompiledSchema:
+    """
+        Compiles the base dictionary into a reusable validator; useful when
+        the same base dictionary is used to validate many dictionaries, since
+        the base dictionary is only walked once.
+
+        :param base: The base dictionary; where the final elements must be the
+         intended data type(s) of the dictionary at that level, if the types
+         are validated.
+
+        :param mode: The validation mode; "equal", "equal_and_type", "subset"
+         or "subset_and_type", equivalent to the validate_keys_equal,
+         validate_keys_equal_and_type, validate_keys_subset and
+         validate_keys_subset_and_type functions, respectively. "equal" by
+         default.
+
+        :param depth: The depth to which the validation should be performed;
+         only used by the "equal" and "subset" modes.
+
+        :param extract: A boolean flag indicating whether the data type of
+         the base dictionary must be extracted rather than directly used; only
+         used by the "equal_and_type" and "subset_and_type" modes. True, if
+         the data type must be extracted; False, otherwise.
+
+        :return: The compiled validator; calling it with a dictionary returns
+         the validation result.
+
+        :raise ValueError: If any of the parameters do not have the proper type
+         or value, or if the types at the ends of the base dictionary are not
+         valid types.
+    """
+    return CompiledSchema(base, mode, depth, extract)
+
+
 def validate_keys_equal(
     base: dict,
     dictionary: dict,
     depth: int = 0,
-    exception: bool = False
+    exception: bool = False,
+    failfast: Union[None, bool] = None
 ) -> bool:
     """
         Validates that the given dictionary is an exact subset of the base
@@ -335,28 +841,47 @@ def validate_keys_equal(
          raised if validation fails. True, if the exception must be raised;
          False, otherwise. False by default.
 
+        :param failfast: A boolean flag indicating whether the validation must
+         stop at the first mismatch. True, if the validation must stop at the
+         first mismatch, and the exception only reports it; False, if every
+         mismatch must be gathered in a single pass over the dictionary, and
+         the exception reports all of them; only valid if the exception must
+         be raised, since the mismatches are not returned otherwise. None, to
+         stop at the first mismatch only if the exception must not be raised.
+         None by default.
+
         :return: A boolean value indicating if the dictionary has the same keys
          as the base dictionary. True if the dictionary has the same keys as
          the base dictionary, False otherwise.
     """
-    # Validate the parameters.
-    _parameters_validate_keys(base, dictionary, depth, exception)
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_keys(
+            base, dictionary, depth, exception, failfast
+        )
 
-    # Compare the dictionaries.
-    result: bool = _validate_keys_equal(dictionary, base, depth)
+    # Compare the dictionaries; every mismatch is gathered for the
+    # exception, unless requested otherwise.
+    mismatches: list = _traverse(
+        dictionary, base, (depth, 0, None),
+        not exception if failfast is None else failfast
+    )
 
-    # Raise an exception if necessary.
-    if not result and exception:
-        raise WrongKeysError(None, base, dictionary, depth)
+    # Raise an exception if necessary; with the mismatches already found.
+    if mismatches and exception:
+        raise WrongKeysError(
+            None, base, dictionary, depth, mismatches=mismatches
+        )
 
-    return result
+    return not mismatches
 
 
 def validate_keys_equal_and_type(
     base: dict,
     dictionary: dict,
     extract: bool = False,
-    exception: bool = False
+    exception: bool = False,
+    failfast: Union[None, bool] = None
 ) -> bool:
     """
         Validates that the given dictionary has the same structure as the base
@@ -377,28 +902,50 @@ def validate_keys_equal_and_type(
          raised if validation fails. True, if the exception must be raised;
          False, otherwise. False by default.
 
+        :param failfast: A boolean flag indicating whether the validation must
+         stop at the first mismatch. True, if the validation must stop at the
+         first mismatch, and the exception only reports it; False, if every
+         mismatch must be gathered in a single pass over the dictionary, and
+         the exception reports all of them; only valid if the exception must
+         be raised, since the mismatches are not returned otherwise. None, to
+         stop at the first mismatch only if the exception must not be raised.
+         None by default.
+
         :return: A boolean value indicating if the dictionary has the same keys
          as the base dictionary. True if the dictionary has the same keys as
          the base dictionary, False otherwise.
     """
-    # Validate the parameters.
-    _parameters_validate_keys_and_types(base, dictionary, extract, exception)
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_keys_and_types(
+            base, dictionary, extract, exception, failfast
+        )
 
-    # # Compare the dictionaries.
-    result: bool = _validate_keys_equal_and_type(dictionary, base, extract)
+    # Compare the dictionaries; every mismatch is gathered for the
+    # exception, unless requested otherwise.
+    check: Callable = (
+        _validate_type_extract if extract else _validate_type_leaf
+    )
+    mismatches: list = _traverse(
+        dictionary, base, (-1, 0, check),
+        not exception if failfast is None else failfast
+    )
 
-    # Raise an exception if necessary.
-    if not result and exception:
-        raise WrongKeysAndTypeError(None, base, dictionary, extract)
+    # Raise an exception if necessary; with the mismatches already found.
+    if mismatches and exception:
+        raise WrongKeysAndTypeError(
+            None, base, dictionary, extract, mismatches=mismatches
+        )
 
-    return result
+    return not mismatches
 
 
 def validate_keys_subset(
     base: dict,
     dictionary: dict,
     depth: int = 0,
-    exception: bool = False
+    exception: bool = False,
+    failfast: Union[None, bool] = None
 ) -> bool:
     """
         Validates that the given dictionary is a subset of the base dictionary,
@@ -416,29 +963,48 @@ def validate_keys_subset(
          raised if validation fails. True, if the exception must be raised;
          False, otherwise. False by default.
 
+        :param failfast: A boolean flag indicating whether the validation must
+         stop at the first mismatch. True, if the validation must stop at the
+         first mismatch, and the exception only reports it; False, if every
+         mismatch must be gathered in a single pass over the dictionary, and
+         the exception reports all of them; only valid if the exception must
+         be raised, since the mismatches are not returned otherwise. None, to
+         stop at the first mismatch only if the exception must not be raised.
+         None by default.
+
         :return: A boolean value indicating if the dictionary is a subset, or
          a proper subset, of  the base dictionary, in terms of the keys. True
          if the dictionary has the same keys as the base dictionary, False
          otherwise.
     """
-    # Validate the parameters.
-    _parameters_validate_keys(base, dictionary, depth, exception)
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_keys(
+            base, dictionary, depth, exception, failfast
+        )
 
-    # Compare the dictionaries.
-    result: bool = _validate_keys_subset(dictionary, base, depth)
+    # Compare the dictionaries; every mismatch is gathered for the
+    # exception, unless requested otherwise.
+    mismatches: list = _traverse(
+        dictionary, base, (depth, 1, None),
+        not exception if failfast is None else failfast
+    )
 
-    # Raise an exception if necessary.
-    if not result and exception:
-        raise WrongKeysSubsetError(None, base, dictionary, depth)
+    # Raise an exception if necessary; with the mismatches already found.
+    if mismatches and exception:
+        raise WrongKeysSubsetError(
+            None, base, dictionary, depth, mismatches=mismatches
+        )
 
-    return result
+    return not mismatches
 
 
 def validate_keys_subset_and_type(
     base: dict,
     dictionary: dict,
     extract: bool = False,
-    exception: bool = False
+    exception: bool = False,
+    failfast: Union[None, bool] = None
 ) -> bool:
     """
         Validates that the given dictionary is a subset of the base dictionary,
@@ -458,18 +1024,39 @@ def validate_keys_subset_and_type(
          raised if validation fails. True, if the exception must be raised;
          False, otherwise. False by default.
 
+        :param failfast: A boolean flag indicating whether the validation must
+         stop at the first mismatch. True, if the validation must stop at the
+         first mismatch, and the exception only reports it; False, if every
+         mismatch must be gathered in a single pass over the dictionary, and
+         the exception reports all of them; only valid if the exception must
+         be raised, since the mismatches are not returned otherwise. None, to
+         stop at the first mismatch only if the exception must not be raised.
+         None by default.
+
         :return: A boolean value indicating if the dictionary has the same keys
          as the base dictionary. True if the dictionary has the same keys as
          the base dictionary, False otherwise.
     """
-    # Validate the parameters.
-    _parameters_validate_keys_and_types(base, dictionary, extract, exception)
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_keys_and_types(
+            base, dictionary, extract, exception, failfast
+        )
 
-    # # Compare the dictionaries.
-    result: bool = _validate_keys_subset_and_type(dictionary, base, extract)
+    # Compare the dictionaries; every mismatch is gathered for the
+    # exception, unless requested otherwise.
+    check: Callable = (
+        _validate_type_extract if extract else _validate_type_leaf
+    )
+    mismatches: list = _traverse(
+        dictionary, base, (-1, -1, check),
+        not exception if failfast is None else failfast
+    )
 
-    # Raise an exception if necessary.
-    if not result and exception:
-        raise WrongKeysSubsetAndTypeError(None, base, dictionary, extract)
+    # Raise an exception if necessary; with the mismatches already found.
+    if mismatches and exception:
+        raise WrongKeysSubsetAndTypeError(
+            None, base, dictionary, extract, mismatches=mismatches
+        )
 
-    return result
+    return not mismatches
@@ -9,11 +9,14 @@
 
 
 # Standard Library.
-from typing import Any, Collection, Type, Union
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterable, Iterator, Sized, Type, Union
 
 # User.
 from gutilities.exceptions.ecollections import WrongLengthError
 from gutilities.exceptions.etypes import WrongTypeError
+from gutilities.validation.vtrusted import TRUSTED
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -24,13 +27,15 @@ from gutilities.exceptions.etypes import WrongTypeError
 def _parameters_validate_length(
     value: Any,
     length: Any,
-    exception: Any
+    exception: Any,
+    consume: Any
 ) -> None:
     """
         Validates the parameters for the validate_length function are of the
         correct type.
 
-        :param value: A collection with the items to be validated.
+        :param value: A collection, or iterable, with the items to be
+         validated.
 
         :param length: The expected length of the collection
 
@@ -38,6 +43,9 @@ def _parameters_validate_length(
          raised if validation fails. True, if the exception must be thrown;
          False, otherwise. False by default.
 
+        :param consume: A boolean flag indicating if a one-shot iterator can
+         be consumed to count its items.
+
         :raises ValueError: If any of the values does not have the correct
          type or takes an invalid value.
     """
@@ -45,8 +53,8 @@ def _parameters_validate_length(
     message: str = ""
 
     # Check the parameters are of the correct type.
-    if not isinstance(value, Collection):
-        message += "The expected type of \"value\" must be a \"Collection\". "
+    if not isinstance(value, Iterable):
+        message += "The expected type of \"value\" must be an \"Iterable\". "
 
     if not (isinstance(length, int) and length >= 0):
         message += (
@@ -54,23 +62,39 @@ def _parameters_validate_length(
         )
 
     if not isinstance(exception, bool):
-        message += "The value is not of the correct type; must be a boolean."
+        message += "The value is not of the correct type; must be a boolean. "
+
+    if not isinstance(consume, bool):
+        message += "The expected type of \"consume\" must be a boolean."
 
     # Raise an exception if needed.
     if message != "":
         raise ValueError(message.strip())
 
 
-def _parameters_validate_type(vtype: Any, exception: Any) -> None:
+@lru_cache(maxsize=1024)
+def _compile_type_check(vtype: Any) -> "TypeCheck":
     """
-        Validates the parameters for the validate_type function are of the
-        correct type.
+        Compiles the type check for the given type(s); cached, so each type,
+        or tuple of types, is validated and compiled only once.
 
         :param vtype: The expected type of the value; it can be None.
 
-        :param exception: A boolean flag indicating if an exception should be
-         raised if validation fails. True, if the exception must be thrown;
-         False, otherwise. False by default.
+        :return: The type check for the given type(s).
+
+        :raises ValueError: If the type is not a type, None or a non-empty
+         tuple of types and/or None.
+    """
+    # The cache is bounded, since the types can be created dynamically.
+    return TypeCheck(vtype)
+
+
+def _parameters_type_check(vtype: Any) -> None:
+    """
+        Validates the parameters for the TypeCheck class are of the correct
+        type.
+
+        :param vtype: The expected type of the value; it can be None.
 
         :raises ValueError: If any of the values does not have the correct
          type or takes an invalid value.
@@ -104,29 +128,162 @@ def _parameters_validate_type(vtype: Any, exception: Any) -> None:
                 f"type; current types {[type(x).__name__ for x in vtype]}. "
             )
 
-    # Check the exception flag is a boolean value.
-    if not isinstance(exception, bool):
-        message += "The value is not of the correct type; must be a boolean."
-
     # Raise an exception if needed.
     if message != "":
         raise ValueError(message.strip())
 
 
+def _parameters_validate_type(exception: Any) -> None:
+    """
+        Validates the parameters for the validate_type function are of the
+        correct type; the expected type is validated when the type check is
+        compiled.
+
+        :param exception: A boolean flag indicating if an exception should be
+         raised if validation fails. True, if the exception must be thrown;
+         False, otherwise. False by default.
+
+        :raises ValueError: If any of the values does not have the correct
+         type or takes an invalid value.
+    """
+    # Check the exception flag is a boolean value.
+    if not isinstance(exception, bool):
+        raise ValueError(
+            "The value is not of the correct type; must be a boolean."
+        )
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Classes
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class TypeCheck:
+    """
+        Pre-resolved type check; None is split out and replaced by its type,
+        so the expected type(s) collapse into a single tuple that is directly
+        used with isinstance. Use compile_type_check to get the cached
+        instances.
+
+        PARAMETERS:
+        ___________
+
+        - self.none: A boolean flag indicating if None is an expected value.
+
+        - self.types: The tuple with the types to be used with isinstance;
+          NoneType is included if None is an expected value.
+
+        - self.vtype: The expected type of the value, as given; it can be None.
+    """
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods - Dunder
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __call__(self, value: Any) -> bool:
+        """
+            Checks if the given value is of the expected type.
+
+            :param value: The value to be checked.
+
+            :return: True, if the value is of the expected type; False,
+             otherwise.
+        """
+        return isinstance(value, self.types)
+
+    def __repr__(self) -> str:
+        """
+            Gets the representation of the type check.
+
+            :return: The representation of the type check, with the expected
+             type(s).
+        """
+        return f"{type(self).__name__}({self.vtype!r})"
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Constructor
+    # /////////////////////////////////////////////////////////////////////////
+
+    def __init__(self, vtype: Union[None, tuple, Type]) -> None:
+        """
+            Compiles the type check.
+
+            :param vtype: The expected type of the value; it can be None.
+
+            :raises ValueError: If the type is not a type, None or a non-empty
+             tuple of types and/or None.
+        """
+        # Validate the parameters.
+        _parameters_type_check(vtype)
+
+        # Auxiliary variables.
+        vtypes: tuple = vtype if isinstance(vtype, tuple) else (vtype,)
+
+        # Set the attributes.
+        self.none: bool = None in vtypes
+        self.types: tuple = tuple(x for x in vtypes if x is not None)
+        self.types += (type(None),) if self.none else ()
+        self.vtype: Union[None, tuple, Type] = vtype
+
+    # /////////////////////////////////////////////////////////////////////////
+    # Methods
+    # /////////////////////////////////////////////////////////////////////////
+
+    def check_many(self, values: Iterable) -> list:
+        """
+            Checks if each of the given values is of the expected type.
+
+            :param values: The iterable with the values to be checked.
+
+            :return: The list with the boolean values indicating if each value
+             is of the expected type, in the same order as the values.
+        """
+        # Auxiliary variables.
+        types: tuple = self.types
+
+        return [isinstance(value, types) for value in values]
+
+
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Functions
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def compile_type_check(vtype: Union[None, tuple, Type]) -> TypeCheck:
+    """
+        Compiles the type check for the given type(s); the type checks are
+        cached, so the type(s) are validated and compiled only once.
+
+        :param vtype: The expected type of the value; it can be None, or a
+         tuple of types and/or None.
+
+        :return: The type check for the given type(s).
+
+        :raises ValueError: If the type is not a type, None or a non-empty
+         tuple of types and/or None.
+    """
+    try:
+        return _compile_type_check(vtype)
+
+    # Unhashable types are never valid.
+    except TypeError:
+        _parameters_type_check(vtype)
+        raise
+
+
 def validate_length(
-    value: Collection,
+    value: Iterable,
     length: int,
-    exception: bool = False
+    exception: bool = False,
+    consume: bool = False
 ) -> bool:
     """
         Validates if the given collection of elements has the given length.
+        The length of sized objects (e.g., lists, dictionaries, strings or
+        memoryviews) is taken directly; other iterables are counted, but only
+        until the expected length is exceeded.
 
-        :param value: A collection with the items to be validated.
+        :param value: A collection, or iterable, with the items to be
+         validated.
 
         :param length: The expected length of the collection
 
@@ -134,18 +291,42 @@ def validate_length(
          raised if validation fails. True, if the exception must be thrown;
          False, otherwise. False by default.
 
-        :raises WrongTypeError: If the value is not of the expected type.
+        :param consume: A boolean flag indicating if a one-shot iterator
+         (e.g., a generator) can be consumed to count its items; at most
+         length + 1 items are consumed. True, if it can be consumed; False,
+         otherwise. False by default.
+
+        :raises ValueError: If the value is a one-shot iterator and it can
+         NOT be consumed; even if trusted.
+
+        :raises WrongLengthError: If the value is not of the expected length.
     """
-    # Validate parameters.
-    _parameters_validate_length(value, length, exception)
+    # Validate parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_length(value, length, exception, consume)
+
+    # One-shot iterators are only consumed on request; always.
+    bounded: bool = not isinstance(value, Sized)
+
+    if bounded and isinstance(value, Iterator) and consume is not True:
+        raise ValueError(
+            "The \"value\" is a one-shot iterator; it can only be counted if "
+            "\"consume\" is set to True."
+        )
 
-    # Length of the collection.
-    clength: int = sum(1 for _ in value)
+    # Length of the collection; counting stops after the expected length.
+    clength: int = (
+        sum(1 for _ in islice(value, length + 1)) if bounded else len(value)
+    )
     result: bool = clength == length
 
     # Raise the exception if needed.
     if not result and exception:
-        raise WrongLengthError(clength=clength, elength=length)
+        raise WrongLengthError(
+            clength=clength,
+            elength=length,
+            bounded=bounded and clength > length
+        )
 
     return result
 
@@ -168,20 +349,12 @@ def validate_type(
 
         :raises WrongTypeError: If the value is not of the expected type.
     """
-    # Validate parameters.
-    _parameters_validate_type(vtype, exception)
-
-    # Validate the type.
-    flag: bool = vtype is not None
-    result: bool = flag if flag else value is None
-
-    if flag and isinstance(vtype, tuple):
-        result = any(
-            value is x if x is None else isinstance(value, x) for x in vtype
-        )
+    # Validate the type; the expected type is validated once, when compiled.
+    result: bool = isinstance(value, compile_type_check(vtype).types)
 
-    elif flag:
-        result = isinstance(value, vtype)
+    # Validate parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_type(exception)
 
     # Raise the exception if needed.
     if not result and exception:
@@ -9,13 +9,18 @@
 
 
 # Standard Library.
+import operator
+
+from collections.abc import Sequence
+from functools import cache
 from numbers import Real
-from typing import Any
+from typing import Any, Union
 
 # User.
 from gutilities.exceptions.enumbers import (
     AboveBelowBoundError, NotInRangeError
 )
+from gutilities.validation.vtrusted import TRUSTED
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -23,6 +28,285 @@ from gutilities.exceptions.enumbers import (
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def _get_array(values: Any) -> Any:
+    """
+        Gets the values as an array of real numbers; a NumPy array, if NumPy
+        is installed, or a list, otherwise. Objects supporting the buffer
+        protocol (e.g., array.array or memoryview) are NOT copied when NumPy
+        is installed.
+
+        :param values: The array, buffer-protocol object or sequence with the
+         values.
+
+        :return: The NumPy array, or list, with the values; None, if the
+         values are not real numbers.
+    """
+    # Auxiliary variables.
+    numpy: Any = _get_numpy()
+
+    # Pure Python.
+    if numpy is None:
+        return _get_array_list(values)
+
+    # Non-sequences are never converted; the buffer-protocol objects are
+    # converted through their buffer, as without NumPy (e.g., bytes are
+    # integers, NOT a string).
+    if not isinstance(values, numpy.ndarray):
+        try:
+            values = memoryview(values)
+
+        except TypeError:
+            if isinstance(values, str) or not isinstance(values, Sequence):
+                return None
+
+    # NumPy.
+    try:
+        array: Any = numpy.asarray(values)
+
+    except (TypeError, ValueError):
+        return None
+
+    # Only real numbers.
+    if array.ndim == 0 or array.dtype.kind not in "biufO":
+        return None
+
+    if array.dtype.kind == "O":
+        if not all(isinstance(value, Real) for value in array.flat):
+            return None
+
+    return array
+
+
+def _get_array_list(values: Any) -> Union[None, list]:
+    """
+        Gets the values as a list of real numbers; used when NumPy is not
+        installed.
+
+        :param values: The buffer-protocol object or sequence with the values.
+
+        :return: The list with the values; None, if the values are not real
+         numbers.
+    """
+    # Auxiliary variables.
+    array: Union[None, list] = None
+
+    # Buffer-protocol objects and sequences.
+    try:
+        array = memoryview(values).tolist()
+
+    except (NotImplementedError, TypeError):
+        if isinstance(values, Sequence) and not isinstance(values, str):
+            array = list(values)
+
+    # Only real numbers.
+    if array is None or not all(isinstance(value, Real) for value in array):
+        return None
+
+    return array
+
+
+def _get_mask(array: Any, checks: tuple) -> Any:
+    """
+        Gets the mask with the values that pass all the comparisons. NaN
+        values never pass a comparison.
+
+        :param array: The NumPy array, or list, with the values.
+
+        :param checks: The tuple with 2-tuples, each with the comparison
+         function, from the operator module, and the bound to compare with.
+
+        :return: The mask; a NumPy boolean array, or a list of booleans,
+         according to the type of the given array.
+    """
+    # Pure Python.
+    if isinstance(array, list):
+        return [
+            all(compare(value, bound) for compare, bound in checks)
+            for value in array
+        ]
+
+    # Auxiliary variables.
+    mask: Any = True
+
+    # NumPy; one vectorized comparison per bound.
+    for compare, bound in checks:
+        mask = mask & compare(array, bound).astype(bool, copy=False)
+
+    return mask
+
+
+def _get_message_array(array: Any, mode: Any) -> str:
+    """
+        Gets the error message for the parameters of the array validation
+        functions.
+
+        :param array: The NumPy array, or list, with the values; None, if the
+         values are not real numbers.
+
+        :param mode: The result to be given; "mask", "all" or "any".
+
+        :return: The error message; an empty string if there are no errors.
+    """
+    # Auxiliary variables.
+    message: str = ""
+
+    # Validate the quantities.
+    if array is None:
+        message += (
+            "The \"values\" must be an array, buffer-protocol object or "
+            "sequence with Real numbers. "
+        )
+
+    if mode not in ("all", "any", "mask"):
+        message += "The \"mode\" must be \"mask\", \"all\" or \"any\". "
+
+    return message
+
+
+def _get_message_comparison(bound: Any, include: Any, exception: Any) -> str:
+    """
+        Gets the error message for the bound parameters of the comparison
+        functions.
+
+        :param bound: The bound of the value.
+
+        :param include: A boolean flag indicating if the bound is inclusive.
+
+        :param exception: A boolean flag indicating if an exception should be
+         raised if validation fails.
+
+        :return: The error message; an empty string if there are no errors.
+    """
+    # Auxiliary variables.
+    message: str = ""
+
+    # Validate the quantities.
+    if not isinstance(bound, Real):
+        message += "The \"bound\" parameter is not a Real number. "
+
+    if not isinstance(include, bool):
+        message += "The \"include\" parameter must be a boolean flag. "
+
+    if not isinstance(exception, bool):
+        message += "The \"exception\" must be a boolean value."
+
+    return message
+
+
+def _get_message_in_range(crange: Any, include: Any, exception: Any) -> str:
+    """
+        Gets the error message for the range parameters of the in-range
+        functions.
+
+        :param crange: A 2-tuple with real numbers, where the first number
+         represents the lower bound of the range and the second number
+         represents the upper bound of the range.
+
+        :param include: A 2-tuple with boolean flags, where each boolean flag
+         indicates whether the lower value (first value) and the upper value
+         (second value) are included in the range.
+
+        :param exception: A boolean flag indicating if an exception should be
+         raised if validation fails.
+
+        :return: The error message; an empty string if there are no errors.
+    """
+    # Auxiliary variables.
+    message: str = ""
+
+    # Validate the quantities.
+    if not isinstance(crange, tuple):
+        message += "The \"crange\" must be a tuple with two Real numbers. "
+
+    elif not len(crange) == 2:
+        message += "The \"crange\" must be a tuple with two Real numbers. "
+
+    elif not all(isinstance(x, Real) for x in crange):
+        message += "The \"crange\" must be a tuple with two Real numbers. "
+
+    elif not crange[0] < crange[1]:
+        message = (
+            "The \"crange\" must be a tuple with two Real numbers, where the "
+            "first number is strictly less than the second one. "
+        )
+
+    if not isinstance(include, tuple):
+        message += "The \"include\" must be a tuple with two boolean values. "
+
+    elif not len(include) == 2:
+        message += "The \"crange\" must be a tuple with two Real numbers. "
+
+    elif not all(isinstance(val, bool) for val in include):
+        message += "The \"include\" must be a tuple with two boolean values. "
+
+    if not isinstance(exception, bool):
+        message += "The \"exception\" must be a boolean value. "
+
+    return message
+
+
+@cache
+def _get_numpy() -> Any:
+    """
+        Gets the NumPy module; it is an optional dependency, imported only
+        when an array is first validated.
+
+        :return: The NumPy module; None, if it is not installed.
+    """
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        import numpy
+
+    except ImportError:
+        return None
+
+    return numpy
+
+
+def _get_result(array: Any, mask: Any, mode: str) -> tuple:
+    """
+        Gets the result of the validation, for the given mode, and the
+        indices of the offending values if the validation failed.
+
+        :param array: The NumPy array, or list, with the values.
+
+        :param mask: The mask with the values that passed the validation; a
+         NumPy boolean array, or a list of booleans.
+
+        :param mode: The result to be given; "mask", for the mask itself,
+         "all", if all the values must pass, or "any", if at least one value
+         must pass.
+
+        :return: A 3-tuple with the result, the sequence with the (flat)
+         indices of the offending values and the first offending value; the
+         last two are None, if the validation passed. The first offending
+         value is None, if there are no values (i.e., "any" of none fails).
+    """
+    # Auxiliary variables.
+    vector: bool = not isinstance(mask, list)
+    passed: bool = bool(
+        (mask.any() if vector else any(mask)) if mode == "any" else
+        (mask.all() if vector else all(mask))
+    )
+    result: Any = mask if mode == "mask" else passed
+
+    # The validation passed.
+    if passed:
+        return result, None, None
+
+    # Flat indices of the offending values.
+    if vector:
+        indices: Any = _get_numpy().flatnonzero(~mask)
+
+        return result, indices, (
+            array.flat[indices[0]] if len(indices) > 0 else None
+        )
+
+    indices = [i for i, valid in enumerate(mask) if not valid]
+
+    return result, indices, array[indices[0]] if len(indices) > 0 else None
+
+
 def _parameters_validate_comparison(
     value: Any,
     bound: Any,
@@ -55,14 +339,44 @@ def _parameters_validate_comparison(
     if not isinstance(value, Real):
         message += "The \"value\" parameter is not a Real number. "
 
-    if not isinstance(bound, Real):
-        message += "The \"bound\" parameter is not a Real number. "
+    message += _get_message_comparison(bound, include, exception)
 
-    if not isinstance(include, bool):
-        message += "The \"include\" parameter must be a boolean flag. "
+    #  Raise an error if needed.
+    if message != "":
+        raise ValueError(message.strip())
 
-    if not isinstance(exception, bool):
-        message += "The \"exception\" must be a boolean value."
+
+def _parameters_validate_comparison_array(
+    array: Any,
+    bound: Any,
+    include: Any,
+    mode: Any,
+    exception: Any
+) -> None:
+    """
+        Validates the parameters for the array comparison functions are of
+        the correct type.
+
+        :param array: The NumPy array, or list, with the values; None, if the
+         values are not real numbers.
+
+        :param bound: The bound of the values.
+
+        :param include: A boolean flag indicating if the bound is inclusive.
+
+        :param mode: The result to be given; "mask", "all" or "any".
+
+        :param exception: A boolean flag indicating if an exception should be
+         raised if validation fails.
+
+        :raise ValueError: If any of the types or values of the variables are
+         not the expected ones.
+    """
+    # Auxiliary variables.
+    message: str = _get_message_array(array, mode)
+
+    # Validate the quantities.
+    message += _get_message_comparison(bound, include, exception)
 
     #  Raise an error if needed.
     if message != "":
@@ -104,32 +418,48 @@ def _parameters_validate_in_range(
     if not isinstance(value, Real):
         message += "The \"value\" is not a Real number. "
 
-    if not isinstance(crange, tuple):
-        message += "The \"crange\" must be a tuple with two Real numbers. "
+    message += _get_message_in_range(crange, include, exception)
 
-    elif not len(crange) == 2:
-        message += "The \"crange\" must be a tuple with two Real numbers. "
+    # Raise an exception if needed.
+    if message != "":
+        raise ValueError(message.strip())
 
-    elif not all(isinstance(x, Real) for x in crange):
-        message += "The \"crange\" must be a tuple with two Real numbers. "
 
-    elif not crange[0] < crange[1]:
-        message = (
-            "The \"crange\" must be a tuple with two Real numbers, where the "
-            "first number is strictly less than the second one. "
-        )
+def _parameters_validate_in_range_array(
+    array: Any,
+    crange: Any,
+    include: Any,
+    mode: Any,
+    exception: Any
+) -> None:
+    """
+        Validates the parameters for the validate_in_range_array function are
+        of the correct type.
 
-    if not isinstance(include, tuple):
-        message += "The \"include\" must be a tuple with two boolean values. "
+        :param array: The NumPy array, or list, with the values; None, if the
+         values are not real numbers.
 
-    elif not len(include) == 2:
-        message += "The \"crange\" must be a tuple with two Real numbers. "
+        :param crange: A 2-tuple with real numbers, where the first number
+         represents the lower bound of the range and the second number
+         represents the upper bound of the range.
 
-    elif not all(isinstance(val, bool) for val in include):
-        message += "The \"include\" must be a tuple with two boolean values. "
+        :param include: A 2-tuple with boolean flags, where each boolean flag
+         indicates whether the lower value (first value) and the upper value
+         (second value) are included in the range.
 
-    if not isinstance(exception, bool):
-        message += "The \"exception\" must be a boolean value. "
+        :param mode: The result to be given; "mask", "all" or "any".
+
+        :param exception: A boolean flag indicating if an exception should be
+         raised if validation fails.
+
+        :raise ValueError: If any of the types or values of the variables are
+         not the expected ones.
+    """
+    # Auxiliary variables.
+    message: str = _get_message_array(array, mode)
+
+    # Validate the quantities.
+    message += _get_message_in_range(crange, include, exception)
 
     # Raise an exception if needed.
     if message != "":
@@ -166,8 +496,9 @@ def validate_greater_than(
         :raises AboveBelowBoundError: If the number is not correctly ordered
          with respect to the bound.
     """
-    # Validate the parameters.
-    _parameters_validate_comparison(value, bound, include, exception)
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_comparison(value, bound, include, exception)
 
     # Adjust the range and the include tuple.
     result: bool = value > bound if not include else value >= bound
@@ -183,6 +514,71 @@ def validate_greater_than(
     return result
 
 
+def validate_greater_than_array(
+    values: Any,
+    bound: Real,
+    include: bool = False,
+    mode: str = "mask",
+    exception: bool = False
+) -> Any:
+    """
+        Validates if the values are greater than the bound, with a single
+        vectorized comparison when NumPy is installed; non-inclusive by
+        default. NaN values are never greater than the bound.
+
+        :param values: The NumPy array, buffer-protocol object (e.g.,
+         array.array or memoryview) or sequence with the values to be
+         validated.
+
+        :param bound: The lower bound of the values; non-inclusive by default.
+
+        :param include: A boolean flag indicating if the lower bound is
+         inclusive. True, if inclusive; False, if non-inclusive. False by
+         default.
+
+        :param mode: The result to be given; "mask", for the mask with the
+         valid values, "all", if all the values must be valid, or "any", if
+         at least one value must be valid. "mask" by default.
+
+        :param exception: A boolean flag indicating if an exception should be
+         raised if validation fails. True, if the exception must be thrown;
+         False, otherwise. False by default. In the "mask" mode, validation
+         fails if any value is not valid.
+
+        :return: The mask, as a NumPy boolean array (a list of booleans, if
+         NumPy is not installed), in the "mask" mode; the boolean result, in
+         the "all" or "any" modes.
+
+        :raises AboveBelowBoundError: If the values are not correctly ordered
+         with respect to the bound; with the indices of the offending values.
+    """
+    # Auxiliary variables.
+    array: Any = _get_array(values)
+
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_comparison_array(
+            array, bound, include, mode, exception
+        )
+
+    # Compare all the values at once.
+    compare: Any = operator.ge if include else operator.gt
+    result, indices, first = _get_result(
+        array, _get_mask(array, ((compare, bound),)), mode
+    )
+
+    # Raise an error if needed.
+    if indices is not None and exception:
+        raise AboveBelowBoundError(
+            value=first,
+            bound=bound,
+            include_greater=(include, True),
+            indices=indices
+        )
+
+    return result
+
+
 def validate_in_range(
     value: Real,
     crange: tuple[Real, Real],
@@ -205,8 +601,9 @@ def validate_in_range(
 
         :raises IsNotInError: If the number is not of the expected sign.
     """
-    # Validate the parameters.
-    _parameters_validate_in_range(value, crange, include, exception)
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_in_range(value, crange, include, exception)
 
     # Adjust the range and the include tuple.
     left: bool = crange[0] <= value if include[0] else crange[0] < value
@@ -220,6 +617,72 @@ def validate_in_range(
     return result
 
 
+def validate_in_range_array(
+    values: Any,
+    crange: tuple[Real, Real],
+    include: tuple[bool, bool] = (True, True),
+    mode: str = "mask",
+    exception: bool = False
+) -> Any:
+    """
+        Validates if the values are in the range, with vectorized comparisons
+        when NumPy is installed. NaN values are never in the range.
+
+        :param values: The NumPy array, buffer-protocol object (e.g.,
+         array.array or memoryview) or sequence with the values to be
+         validated.
+
+        :param crange: The range of the values; inclusive.
+
+        :param include: A tuple that indicates if the lower and upper bounds
+         are included in the range; both bounds ARE included, by default.
+
+        :param mode: The result to be given; "mask", for the mask with the
+         valid values, "all", if all the values must be valid, or "any", if
+         at least one value must be valid. "mask" by default.
+
+        :param exception: A boolean flag indicating if an exception should be
+         raised if validation fails. True, if the exception must be thrown;
+         False, otherwise. False by default. In the "mask" mode, validation
+         fails if any value is not valid.
+
+        :return: The mask, as a NumPy boolean array (a list of booleans, if
+         NumPy is not installed), in the "mask" mode; the boolean result, in
+         the "all" or "any" modes.
+
+        :raises NotInRangeError: If the values are not in the range; with the
+         indices of the offending values.
+    """
+    # Auxiliary variables.
+    array: Any = _get_array(values)
+
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_in_range_array(
+            array, crange, include, mode, exception
+        )
+
+    # Compare all the values at once.
+    checks: tuple = (
+        (operator.ge if include[0] else operator.gt, crange[0]),
+        (operator.le if include[1] else operator.lt, crange[1]),
+    )
+    result, indices, first = _get_result(
+        array, _get_mask(array, checks), mode
+    )
+
+    # Raise an error if needed.
+    if indices is not None and exception:
+        raise NotInRangeError(
+            value=first,
+            vrange=crange,
+            include=include,
+            indices=indices
+        )
+
+    return result
+
+
 def validate_less_than(
     value: Real,
     bound: Real,
@@ -245,8 +708,9 @@ def validate_less_than(
         :raises AboveBelowBoundError: If the number is not correctly ordered
          with respect to the bound.
     """
-    # Validate the parameters.
-    _parameters_validate_comparison(value, bound, include, exception)
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_comparison(value, bound, include, exception)
 
     # Adjust the range and the include tuple.
     result: bool = value < bound if not include else value <= bound
@@ -260,3 +724,68 @@ def validate_less_than(
         )
 
     return result
+
+
+def validate_less_than_array(
+    values: Any,
+    bound: Real,
+    include: bool = False,
+    mode: str = "mask",
+    exception: bool = False
+) -> Any:
+    """
+        Validates if the values are less than the bound, with a single
+        vectorized comparison when NumPy is installed; non-inclusive by
+        default. NaN values are never less than the bound.
+
+        :param values: The NumPy array, buffer-protocol object (e.g.,
+         array.array or memoryview) or sequence with the values to be
+         validated.
+
+        :param bound: The upper bound of the values; non-inclusive by default.
+
+        :param include: A boolean flag indicating if the upper bound is
+         inclusive. True, if inclusive; False, if non-inclusive. False by
+         default.
+
+        :param mode: The result to be given; "mask", for the mask with the
+         valid values, "all", if all the values must be valid, or "any", if
+         at least one value must be valid. "mask" by default.
+
+        :param exception: A boolean flag indicating if an exception should be
+         raised if validation fails. True, if the exception must be thrown;
+         False, otherwise. False by default. In the "mask" mode, validation
+         fails if any value is not valid.
+
+        :return: The mask, as a NumPy boolean array (a list of booleans, if
+         NumPy is not installed), in the "mask" mode; the boolean result, in
+         the "all" or "any" modes.
+
+        :raises AboveBelowBoundError: If the values are not correctly ordered
+         with respect to the bound; with the indices of the offending values.
+    """
+    # Auxiliary variables.
+    array: Any = _get_array(values)
+
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_comparison_array(
+            array, bound, include, mode, exception
+        )
+
+    # Compare all the values at once.
+    compare: Any = operator.le if include else operator.lt
+    result, indices, first = _get_result(
+        array, _get_mask(array, ((compare, bound),)), mode
+    )
+
+    # Raise an error if needed.
+    if indices is not None and exception:
+        raise AboveBelowBoundError(
+            value=first,
+            bound=bound,
+            include_greater=(include, False),
+            indices=indices
+        )
+
+    return result
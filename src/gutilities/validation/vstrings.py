@@ -13,6 +13,7 @@ from typing import Any
 
 # User.
 from gutilities.validation.vgeneral import validate_type
+from gutilities.validation.vtrusted import TRUSTED
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -92,8 +93,9 @@ def validate_string_empty(
         :raises ValueError: If the validation fails and the exception flag is
          True.
     """
-    # Validate the parameters.
-    _parameters_validate_string_empty(notempty, sstrip, exception)
+    # Validate the parameters, unless trusted.
+    if not TRUSTED.get():
+        _parameters_validate_string_empty(notempty, sstrip, exception)
 
     # Check that the object to validate is a string.
     validate_type(value, str, False)
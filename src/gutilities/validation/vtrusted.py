@@ -0,0 +1,58 @@
+"""
+    Contains the switch for the trusted mode of the validation functions.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+from contextvars import ContextVar
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# True, if the validation functions must skip the validation of their own
+# parameters; i.e., the caller guarantees the parameters are valid. It is a
+# context variable, so each thread, or asynchronous task, has its own value.
+TRUSTED: ContextVar = ContextVar("trusted", default=False)
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def is_trusted() -> bool:
+    """
+        Gets whether the trusted mode is on, in the current context.
+
+        :return: True, if the validation functions skip the validation of
+         their own parameters; False, otherwise.
+    """
+    return TRUSTED.get()
+
+
+def set_trusted(trusted: bool) -> None:
+    """
+        Sets the trusted mode, in the current context. In the trusted mode, the
+        validation functions do NOT validate their own parameters; the results
+        are the same for valid parameters, but invalid parameters are no longer
+        reported with a ValueError. Prefer the TrustedValidation context
+        manager, which restores the previous mode on exit.
+
+        :param trusted: A boolean flag indicating if the trusted mode must be
+         on. True, if the parameters must NOT be validated; False, otherwise.
+
+        :raise ValueError: If the flag is not a boolean value.
+    """
+    # Validate the parameters.
+    if not isinstance(trusted, bool):
+        raise ValueError("The \"trusted\" flag must be a boolean value.")
+
+    TRUSTED.set(trusted)
@@ -0,0 +1,92 @@
+"""
+    Contains the unit tests for the context manager TrustedValidation.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# User.
+from gutilities.context_managers.ctrusted import TrustedValidation
+from gutilities.validation.vnumbers import validate_in_range
+from gutilities.validation.vtrusted import is_trusted
+
+from tests.auxiliary.genutils import RaisesException
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Test
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def test_cm_trusted_validation() -> None:
+    """
+        Tests the context manager TrustedValidation.
+    """
+    # Auxiliary variables.
+    kwargs: dict = {
+        "value": 1.5,
+        "crange": [0, 3],
+        "include": (True, True),
+        "exception": False,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The parameters are validated outside the context.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = (
+        "Test 1: The range is not a tuple; an exception must be raised."
+    )
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        validate_in_range(**kwargs)
+
+    with TrustedValidation() as trusted:
+        # ---------------------------------------------------------------------
+        # Test 2: The parameters are NOT validated inside the context.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 2: The parameters must NOT be validated."
+
+        assert trusted and is_trusted(), message
+        assert validate_in_range(**kwargs), message
+
+        # ---------------------------------------------------------------------
+        # Test 3: The validation can be re-enabled in a nested context.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 3: The parameters must be validated again."
+
+        with TrustedValidation(trusted=False):
+            # Must throw a ValueError.
+            with RaisesException(ValueError, message=message):
+                validate_in_range(**kwargs)
+
+        assert is_trusted(), message
+
+    # -------------------------------------------------------------------------
+    # Test 4: The previous mode is restored.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 4: The previous mode must be restored."
+
+    assert not is_trusted(), message
+
+    # -------------------------------------------------------------------------
+    # Test 5: The flag must be a boolean value.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 5: The flag must be a boolean value."
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        TrustedValidation(trusted=1)
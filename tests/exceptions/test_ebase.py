@@ -0,0 +1,97 @@
+"""
+    Contains the tests for the base class of the errors/exceptions.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import pickle
+
+from unittest.mock import MagicMock
+
+# User.
+from gutilities.exceptions.ecollections import NotInCollectionError
+from gutilities.exceptions.etypes import WrongTypeError
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Test
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def test_base_errors_lazymessageerror() -> None:
+    """
+        Tests the message of the LazyMessageError subclasses is rendered
+        lazily.
+    """
+    # Auxiliary variables.
+    expected: str = (
+        "The value is not of the expected type. Current type value: \"int\". "
+        "Expected type: \"str\"."
+    )
+
+    # -------------------------------------------------------------------------
+    # Test 1: The message must NOT be rendered when the error is created.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = "Test 1: The message must be rendered only once."
+
+    # Object that counts how many times it is formatted.
+    counted: MagicMock = MagicMock()
+    formatter: MagicMock = MagicMock(return_value="counted")
+    counted.__str__ = formatter
+
+    # Error class.
+    lazy: NotInCollectionError = NotInCollectionError(None, counted, ())
+
+    assert formatter.call_count == 0, message
+
+    # Render the message several times.
+    for _ in range(3):
+        assert "counted" in str(lazy), message
+
+    assert formatter.call_count == 1, message
+
+    # -------------------------------------------------------------------------
+    # Test 2: The message, string representation and arguments must be the
+    # rendered message.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: The rendered message is not the expected one."
+
+    # Error class.
+    error: WrongTypeError = WrongTypeError(None, 6, str)
+
+    assert str(error) == expected, message
+    assert error.message == expected, message
+    assert error.args == (expected,), message
+    assert repr(error) == f"WrongTypeError({expected!r})", message
+
+    # -------------------------------------------------------------------------
+    # Test 3: The message must survive pickling.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 3: The message must be the same after pickling."
+
+    # Pickle the error before rendering the message.
+    error = pickle.loads(pickle.dumps(WrongTypeError(None, 6, str)))
+
+    assert str(error) == expected, message
+
+    # -------------------------------------------------------------------------
+    # Test 4: The message can be replaced through the arguments.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 4: The message must be replaced."
+
+    error.args = ("Replaced.",)
+
+    assert str(error) == "Replaced.", message
@@ -10,12 +10,15 @@
 
 # Standard Library.
 from typing import Any
+from unittest.mock import MagicMock
 
 # User.
 from gutilities.exceptions.ecollections import (
     NotInCollectionError, WrongLengthError
 )
 
+from tests.auxiliary.genutils import RaisesException
+
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 # Functions - Test
@@ -70,6 +73,96 @@ def test_collection_errors_notincollectionerror() -> None:
     assert expected == error.message, message
 
 
+def test_collection_errors_notincollectionerror_budget() -> None:
+    """
+        Tests the NotInCollectionError exception only renders a sample of
+        large collections.
+    """
+    # Auxiliary variables.
+    items: list = list(range(1_000_000))
+
+    # -------------------------------------------------------------------------
+    #  Test 1: Only the items within the budget, and the number of items,
+    #  must be rendered.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = "Test 1: The error message is not the expected one."
+
+    # Expected message.
+    expected: str = (
+        "The given item is not in the collection. Object being validated: "
+        "-1. Collection of possible objects: [0, 1, 2, ...] (1000000 items)."
+    )
+
+    # Error class.
+    error: NotInCollectionError = NotInCollectionError(
+        None, -1, items, (3, 200)
+    )
+
+    assert expected == error.message, message
+
+    # -------------------------------------------------------------------------
+    #  Test 2: The character budget must also bound the message.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: The error message must be bounded."
+
+    # Error class.
+    error = NotInCollectionError(None, -1, [str(x) * 50 for x in items[:10]])
+
+    assert len(error.message) < 400, message
+
+    # -------------------------------------------------------------------------
+    #  Test 3: Iterators must only be iterated up to the sample.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 3: The iterator must not be exhausted."
+
+    # Error class.
+    generator: Any = iter(items)
+    error = NotInCollectionError(None, -1, generator, (3, 200))
+
+    assert error.message.endswith("([0, 1, 2, ...])."), message
+    assert next(generator) == 4, message
+
+    # -------------------------------------------------------------------------
+    #  Test 4: The full representation of the items must never be built;
+    #  neither of the nested collections, nor of the long strings.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 4: The representation of the items must be bounded."
+
+    # Auxiliary variables.
+    nested: MagicMock = MagicMock()
+    nested.__repr__ = MagicMock(return_value="nested")
+
+    for collection in (
+        [[[nested]], "x" * 1_000_000, items],
+        [[[[nested]] * 1_000] * 1_000] * 10,
+        {"key": [[[nested]]], "long": "x" * 1_000_000},
+    ):
+        # Error class.
+        error = NotInCollectionError(None, -1, collection)
+
+        assert len(error.message) < 500, message
+        assert not nested.__repr__.called, message
+
+    # -------------------------------------------------------------------------
+    #  Test 5: The budget must be a 2-tuple of positive integers.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 5: The budget must be a 2-tuple of positive integers."
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        raise NotInCollectionError(None, -1, items, (0, 200))
+
+
 def test_collection_errors_wronglengtherror() -> None:
     """
         Tests the WrongLengthError exception.
@@ -97,3 +190,15 @@ def test_collection_errors_wronglengtherror() -> None:
     error: WrongLengthError = WrongLengthError(None, lcurrent, lexpected)
 
     assert expected == error.message, message
+
+    # -------------------------------------------------------------------------
+    #  Test 2: The counting stopped before the end of the collection.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: The current length must be a lower bound."
+
+    # Error class.
+    error = WrongLengthError(None, lcurrent, lcurrent - 1, bounded=True)
+
+    assert f"collection: at least {lcurrent}." in error.message, message
@@ -12,7 +12,16 @@
 import copy as cp
 
 # User.
-from gutilities.exceptions.edicts import WrongKeysError
+from gutilities.exceptions.edicts import (
+    WrongKeysAndTypeError, WrongKeysError, WrongKeysSubsetAndTypeError,
+    WrongKeysSubsetError
+)
+from gutilities.validation.vdicts import (
+    validate_keys_equal, validate_keys_equal_and_type, validate_keys_subset,
+    validate_keys_subset_and_type
+)
+
+from tests.auxiliary.genutils import RaisesException
 
 
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
@@ -88,3 +97,45 @@ def test_dictionary_errors_wrongkeyserror() -> None:
     )
 
     assert expected == error.message, message
+
+
+def test_dictionary_errors_same_as_validation() -> None:
+    """
+        Tests the messages of the exceptions built directly are the same as
+        those of the exceptions raised by the validation functions.
+    """
+    # Auxiliary variables.
+    base: dict = {"x": {"y": 1, "z": 2}, "w": 3}
+    original: dict = {"x": {"z": 2}}
+    types: dict = {"x": {"y": int, "z": str}, "w": int}
+
+    # -------------------------------------------------------------------------
+    # Test 1: The mismatches must be found with the same rules; e.g., the keys
+    # are only required to be a subset at the root.
+    # -------------------------------------------------------------------------
+
+    for error, function, args in (
+        (WrongKeysError, validate_keys_equal, (base, original, 1)),
+        (WrongKeysSubsetError, validate_keys_subset, (base, original, 1)),
+        (
+            WrongKeysAndTypeError, validate_keys_equal_and_type,
+            (types, original, False)
+        ),
+        (
+            WrongKeysSubsetAndTypeError, validate_keys_subset_and_type,
+            (types, original, False)
+        ),
+    ):
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The messages of {error.__name__} must be the same."
+        )
+
+        # Auxiliary variables.
+        expected: str = f"{error(None, *args)}"
+
+        assert "\n- Depth" in expected or "\n- Key" in expected, message
+
+        # Must throw the same exception.
+        with RaisesException(error, expected, message=message):
+            function(*args, exception=True)
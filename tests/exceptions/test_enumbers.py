@@ -163,3 +163,59 @@ def test_number_errors_notinrangeerror() -> None:
     error: NotInRangeError = NotInRangeError(**kwargs)
 
     assert error.message == expected, message
+
+
+def test_number_errors_notinrangeerror_indices() -> None:
+    """
+        Tests the NotInRangeError exception, with the indices of the
+        offending values.
+    """
+    # Auxiliary variables.
+    kwargs: dict = {
+        "message": None,
+        "value": 7.6,
+        "vrange": (8, 12),
+        "include": (False, True),
+        "indices": list(range(3, 30, 2)),
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The count and indices must be kept.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = "Test 1: The count and indices must be kept."
+
+    # Error class.
+    error: NotInRangeError = NotInRangeError(**kwargs)
+
+    assert error.count == 14, message
+    assert error.indices is kwargs["indices"], message
+
+    # -------------------------------------------------------------------------
+    # Test 2: Only the first indices must be shown.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: Only the first indices must be shown."
+
+    assert str(error).endswith(
+        "Offending values: 14, at the indices: [3, 5, 7, 9, 11, 13, 15, 17, "
+        "19, 21, ...]."
+    ), message
+
+    # -------------------------------------------------------------------------
+    # Test 3: Scalar values have no count.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 3: Scalar values must have no count."
+
+    # Set the values.
+    kwargs.pop("indices")
+
+    # Error class.
+    error = NotInRangeError(**kwargs)
+
+    assert error.count is None and error.indices is None, message
+    assert "Offending" not in str(error), message
@@ -0,0 +1,915 @@
+"""
+    Contains the tests for the linting functions.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Standard Library.
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+from importlib.metadata import entry_points, version
+from itertools import product
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Third party.
+from astroid import MANAGER
+
+# User.
+from gutilities.context_managers.cworking import WorkingDirectory
+from gutilities.general.glinting import (
+    EXCLUDES, _daemon_lint, _get_files, _get_fingerprint, _lint_flake8_files,
+    _lint_pylint_files, iter_files, iter_results, lint_all, lint_flake8,
+    lint_pylint, lint_pylint_daemon, serve_pylint, stop_pylint_daemon
+)
+
+from tests.auxiliary.genutils import RaisesException
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Global Variables
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# Modules to be linted; with messages of both linters.
+MODULES: dict = {
+    "a.py": "import os\nx=1\n",
+    "B.py": "\"\"\"B.\"\"\"\nimport sys\n",
+    "package/c.py": "\"\"\"C.\"\"\"\n\n\ndef f(a):\n    return a+1\n",
+    "package/d.py": "\"\"\"D.\"\"\"\nVALUE = 1\n",
+}
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Test
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def test_iter_files_correct_values() -> None:
+    """
+        Tests the iter_files function prunes the excluded and ignored files
+        and directories.
+    """
+    # Auxiliary variables.
+    tree: dict = {
+        ".gitignore": "*_pb2.py\n!keep_pb2.py\n/top.py\nbuild/\n",
+        ".venv/lib/a.py": "",
+        "node_modules/b.py": "",
+        "build/c.py": "",
+        "top.py": "",
+        "src/top.py": "",
+        "src/data_pb2.py": "",
+        "src/keep_pb2.py": "",
+        "src/notes.txt": "",
+        "src/package/.gitignore": "# Generated.\n/generated.py\n",
+        "src/package/generated.py": "",
+        "src/package/module.py": "",
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Make the repository.
+        root: Path = Path(directory)
+        (root / ".git").mkdir()
+
+        for name, text in tree.items():
+            (root / name).parent.mkdir(parents=True, exist_ok=True)
+            (root / name).write_text(text, encoding="utf-8")
+
+        # ---------------------------------------------------------------------
+        # Test 1: The excluded and ignored files must NOT be discovered.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message: str = "Test 1: The files are not the expected ones."
+
+        files: set = set(iter_files([directory], True))
+
+        assert files == {
+            f"{root / x}" for x in (
+                "src/top.py", "src/keep_pb2.py", "src/package/module.py"
+            )
+        }, message
+
+        # ---------------------------------------------------------------------
+        # Test 2: The .gitignore files of the parents must be honored, and the
+        # given files are always discovered.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 2: The files are not the expected ones."
+
+        files = set(
+            iter_files([f"{root / 'src'}", f"{root / 'top.py'}"], True)
+        )
+
+        assert files == {
+            f"{root / x}" for x in (
+                "top.py", "src/top.py", "src/keep_pb2.py",
+                "src/package/module.py"
+            )
+        }, message
+
+        assert set(iter_files([f"{root / 'src'}"])) == {
+            f"{root / x}" for x in ("src/top.py", "src/keep_pb2.py")
+        }, message
+
+        # ---------------------------------------------------------------------
+        # Test 3: Without excludes and .gitignore, every file is discovered.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 3: Every python file must be discovered."
+
+        files = set(
+            iter_files([directory], True, excludes=(), gitignore=False)
+        )
+
+        assert files == {
+            f"{root / x}" for x in tree if x.endswith(".py")
+        }, message
+
+        # ---------------------------------------------------------------------
+        # Test 4: The lint_* functions discover every file by default; they
+        # prune the excluded and ignored ones only if requested.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 4: The linted files are not the expected ones."
+
+        # The discovered files are recorded, but NOT linted.
+        found: list = []
+
+        for function, kwargs in product(
+            (lint_flake8, lint_pylint, lint_pylint_daemon, lint_all),
+            ({}, {"excludes": EXCLUDES, "gitignore": True})
+        ):
+            with patch(
+                "gutilities.general.glinting._get_files",
+                side_effect=lambda *x: found.append(set(_get_files(*x))) or []
+            ):
+                function(
+                    [directory], root / "results.txt", recursive=True,
+                    **kwargs
+                )
+
+            assert found.pop() == (
+                {
+                    f"{root / x}" for x in (
+                        "src/top.py", "src/keep_pb2.py",
+                        "src/package/module.py"
+                    )
+                }
+                if kwargs else
+                {f"{root / x}" for x in tree if x.endswith(".py")}
+            ), message
+
+
+def test_lint_all_correct_values() -> None:
+    """
+        Tests the lint_all function saves the same results as the lint_flake8
+        and lint_pylint functions.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Auxiliary variables.
+        root: Path = Path(directory)
+        results: Path = root / "results"
+        results.mkdir()
+
+        for name, text in MODULES.items():
+            (root / name).parent.mkdir(exist_ok=True)
+            (root / name).write_text(text, encoding="utf-8")
+
+        lint_flake8([directory], root / "flake8.txt", True)
+        lint_pylint([directory], root / "pylint.txt", True)
+
+        # ---------------------------------------------------------------------
+        # Test 1: The path of a text file is suffixed with the engine.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message: str = "Test 1: The results must be the same."
+
+        lint_all([directory], root / "all.txt", recursive=True)
+
+        for engine in ("flake8", "pylint"):
+            expected: str = (root / f"{engine}.txt").read_text("utf-8")
+            report: str = (root / f"all_{engine}.txt").read_text("utf-8")
+
+            assert report.split("\n---")[0] == expected.split("\n---")[0], (
+                message
+            )
+
+        # ---------------------------------------------------------------------
+        # Test 2: A directory gets the usual file names; with each engine, and
+        # with the cache.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 2: The results must be the same."
+
+        lint_all([directory], results, ["pylint"], True)
+        lint_all([directory], results, ("pylint", "flake8"), True, jobs=2)
+        lint_all(
+            [directory], results, recursive=True, cache_dir=root / "cache"
+        )
+
+        for name in ("results_pylint", "results_pylint(0)"):
+            assert (
+                (results / f"{name}.txt").read_text("utf-8").split("\n---")[0]
+                == (root / "pylint.txt").read_text("utf-8").split("\n---")[0]
+            ), message
+
+        for name in ("results_flake8", "results_flake8(0)"):
+            assert (
+                (results / f"{name}.txt").read_text("utf-8") ==
+                (root / "flake8.txt").read_text("utf-8")
+            ), message
+
+
+def test_lint_cache_checks_across_files() -> None:
+    """
+        Tests the lint_pylint function does NOT cache the messages of the
+        checks across files; i.e., they are NOT stale when other files change.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Auxiliary variables.
+        root: Path = Path(directory)
+        cache: Path = root / "cache"
+        text: str = (
+            "\"\"\"M.\"\"\"\n\n\ndef g(a):\n    \"\"\"G.\"\"\"\n"
+            "    b = a + 1\n    c = b * 2\n    d = c - 3\n    h = d // 4\n"
+            "    return h\n"
+        )
+
+        for name in ("m.py", "n.py"):
+            (root / name).write_text(text, encoding="utf-8")
+
+        # ---------------------------------------------------------------------
+        # Test 1: The duplicate code must be found, and then NOT when the
+        # other file changes; as without cache.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message: str = "Test 1: The checks across files must NOT be cached."
+
+        # Without the configuration of the repository.
+        with WorkingDirectory(root):
+            for count in (1, 0):
+                # The first run is compared with the run of the other code.
+                for _ in range(2):
+                    lint_pylint([directory], root / "expected.txt")
+
+                lint_pylint([directory], root / "warm.txt", cache_dir=cache)
+                report: str = (root / "warm.txt").read_text(encoding="utf-8")
+
+                assert report.count("(duplicate-code)") == count, message
+                assert (
+                    report == (root / "expected.txt").read_text("utf-8")
+                ), message
+
+                # The messages are in the last file, NOT in the changed one.
+                (root / "m.py").write_text("\"\"\"M.\"\"\"\n", "utf-8")
+
+
+def test_lint_cache_correct_values() -> None:
+    """
+        Tests the lint_flake8 and lint_pylint functions save the same report
+        with the lint cache, cold or warm, and only lint the changed files.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Auxiliary variables.
+        root: Path = Path(directory)
+        cache: Path = root / "cache"
+
+        for name, text in MODULES.items():
+            (root / name).parent.mkdir(exist_ok=True)
+            (root / name).write_text(text, encoding="utf-8")
+
+        # ---------------------------------------------------------------------
+        # Test 1: The cold and warm reports must be the same as without cache;
+        # also the evaluation of Pylint, compared with the previous run.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message: str = "Test 1: The reports with cache must be the same."
+
+        for function in (lint_flake8, lint_pylint):
+            # The first run is compared with the run of another test.
+            for _ in range(2):
+                function([directory], root / "expected.txt", True, 1)
+
+            expected: str = (root / "expected.txt").read_text(encoding="utf-8")
+
+            for name in ("cold.txt", "warm.txt"):
+                function([directory], root / name, True, 1, cache)
+                report: str = (root / name).read_text(encoding="utf-8")
+
+                assert report == expected, message
+
+        assert "/10 (previous run: " in report, message
+
+        # ---------------------------------------------------------------------
+        # Test 2: Only the changed files must be linted.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 2: Only the changed files must be linted."
+
+        (root / "a.py").write_text("import os\ny=1\n", encoding="utf-8")
+
+        # Count the calls.
+        module: str = "gutilities.general.glinting"
+        flake: MagicMock = MagicMock(side_effect=_lint_flake8_files)
+        pylint: MagicMock = MagicMock(side_effect=_lint_pylint_files)
+
+        with patch(f"{module}._lint_flake8_files", flake):
+            with patch(f"{module}._lint_pylint_files", pylint):
+                for _ in range(2):
+                    lint_flake8([directory], root / "f.txt", True, 1, cache)
+                    lint_pylint([directory], root / "p.txt", True, 1, cache)
+
+        # The checks across files are made every time.
+        for calls in (
+            flake.call_args_list,
+            [
+                x for x in pylint.call_args_list
+                if "--disable=all" not in x.kwargs["arguments"]
+            ]
+        ):
+            assert len(calls) == 1, message
+            assert calls[0].args[0] == [f"{root / 'a.py'}"], message
+
+        # ---------------------------------------------------------------------
+        # Test 3: The cache must be bounded in size.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 3: The cache must be bounded in size."
+
+        (root / "a.py").write_text("import os\nz=1\n", encoding="utf-8")
+
+        with patch("gutilities.general.glinting.CACHE_SIZE", 0):
+            lint_pylint([directory], root / "bounded.txt", True, 1, cache)
+
+        assert not any(cache.glob("*.json")), message
+
+        # ---------------------------------------------------------------------
+        # Test 4: The files must be linted again when the files they import
+        # change; also indirectly.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 4: The files importing a changed file must be linted."
+
+        (root / "package" / "__init__.py").write_text("", encoding="utf-8")
+        (root / "e.py").write_text(
+            "\"\"\"E.\"\"\"\nfrom package.d import f\n\nVALUE = f(1)\n",
+            encoding="utf-8"
+        )
+        (root / "package" / "d.py").write_text(
+            "\"\"\"D.\"\"\"\nfrom package.c import f\n", encoding="utf-8"
+        )
+
+        for text in ("def f(a):", "def f(a, b):"):
+            (root / "package" / "c.py").write_text(
+                MODULES["package/c.py"].replace("def f(a):", text),
+                encoding="utf-8"
+            )
+
+            # As new processes; astroid keeps the modules it parsed. The
+            # first run is compared with the run of the previous code.
+            for _ in range(2):
+                MANAGER.clear_cache()
+                lint_pylint([directory], root / "expected.txt", True, 1)
+
+            MANAGER.clear_cache()
+            lint_pylint([directory], root / "warm.txt", True, 1, cache)
+
+            assert (
+                (root / "warm.txt").read_text("utf-8") ==
+                (root / "expected.txt").read_text("utf-8")
+            ), message
+
+        assert "E1120" in (root / "warm.txt").read_text("utf-8"), message
+
+
+def test_lint_cache_plugins() -> None:
+    """
+        Tests the lint cache is NOT used when the plugins of the linters
+        change; i.e., the plugins are part of the fingerprint.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Auxiliary variables.
+        root: Path = Path(directory)
+        cache: Path = root / "cache"
+        module: str = "gutilities.general.glinting"
+        plugin: MagicMock = MagicMock(group="flake8.extension", value="x:X")
+        plugin.name = "X1"
+        plugin.dist.name = "flake8-x"
+        plugin.dist.version = "1.0"
+
+        (root / "a.py").write_text(MODULES["a.py"], encoding="utf-8")
+
+        # ---------------------------------------------------------------------
+        # Test 1: A new plugin of Flake8 must invalidate the cache.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message: str = "Test 1: The files must be linted again."
+
+        lint_flake8([directory], root / "f.txt", True, 1, cache)
+
+        with (
+            patch(
+                f"{module}.entry_points",
+                side_effect=lambda group: [*entry_points(group=group), plugin]
+            ),
+            patch(
+                f"{module}._lint_flake8_files",
+                MagicMock(side_effect=_lint_flake8_files)
+            ) as flake
+        ):
+            lint_flake8([directory], root / "f.txt", True, 1, cache)
+
+        assert flake.call_count == 1, message
+
+        # ---------------------------------------------------------------------
+        # Test 2: The plugins of Pylint must be in the fingerprint; with the
+        # version of their package, or the content of their module.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 2: The plugins of Pylint must be in the fingerprint."
+
+        (root / ".pylintrc").write_text(
+            "[MAIN]\nload-plugins=pylint.extensions.docparams, plugin\n",
+            encoding="utf-8"
+        )
+        (root / "plugin.py").write_text("X = 1\n", encoding="utf-8")
+
+        with WorkingDirectory(root), patch.object(
+            sys, "path", [directory, *sys.path]
+        ):
+            fingerprint: str = _get_fingerprint(False)
+
+            assert (
+                f"pylint.extensions.docparams pylint {version('pylint')}"
+                in fingerprint
+            ), message
+
+            (root / "plugin.py").write_text("X = 2\n", encoding="utf-8")
+
+            assert _get_fingerprint(False) != fingerprint, message
+
+
+def test_lint_jobs_correct_values() -> None:
+    """
+        Tests the lint_flake8 and lint_pylint functions save the same report
+        whatever the number of processes.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Auxiliary variables.
+        root: Path = Path(directory)
+
+        for name, text in MODULES.items():
+            (root / name).parent.mkdir(exist_ok=True)
+            (root / name).write_text(text, encoding="utf-8")
+
+        # ---------------------------------------------------------------------
+        # Test 1: The report of Flake8 must be the same.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message: str = "Test 1: The Flake8 reports must be the same."
+
+        for jobs in (1, 2, 0):
+            lint_flake8([directory], root / f"flake8_{jobs}.txt", True, jobs)
+
+        expected: str = (root / "flake8_1.txt").read_text(encoding="utf-8")
+
+        assert "[E225]" in expected, message
+
+        for jobs in (2, 0):
+            file: Path = root / f"flake8_{jobs}.txt"
+            assert file.read_text(encoding="utf-8") == expected, message
+
+        # ---------------------------------------------------------------------
+        # Test 2: The report of Pylint must be the same; also the messages of
+        # the checks across files, and the evaluation of all the files.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 2: The Pylint reports must be the same."
+
+        (root / "package" / "__init__.py").write_text("", encoding="utf-8")
+
+        for name, other in (("e", "f"), ("f", "e")):
+            (root / "package" / f"{name}.py").write_text(
+                f"\"\"\"{name}.\"\"\"\nfrom package import {other}\n\n\n"
+                f"def g(a):\n    \"\"\"G.\"\"\"\n    b = a + 1\n"
+                f"    c = b * 2\n    d = c - 3\n    h = d // 4\n"
+                f"    return h\n\n\nVALUE = {other}\n",
+                encoding="utf-8"
+            )
+
+        # Without the configuration of the repository; the first run is
+        # compared with the run of another test.
+        with WorkingDirectory(root):
+            for jobs in (1, 1, 2, 3):
+                lint_pylint(
+                    [directory], root / f"pylint_{jobs}.txt", True, jobs
+                )
+
+        expected = (root / "pylint_1.txt").read_text(encoding="utf-8")
+
+        assert expected.index("Module a") < expected.index("Module B"), message
+        assert "(duplicate-code)" in expected, message
+        assert "(cyclic-import)" in expected, message
+
+        for jobs in (2, 3):
+            file = root / f"pylint_{jobs}.txt"
+            assert file.read_text(encoding="utf-8") == expected, message
+
+        # ---------------------------------------------------------------------
+        # Test 3: The checks across files disabled by the configuration must
+        # NOT be made.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 3: The disabled checks must NOT be made."
+
+        (root / ".pylintrc").write_text(
+            "[MESSAGES CONTROL]\ndisable=cyclic-import\n", encoding="utf-8"
+        )
+
+        with WorkingDirectory(root):
+            lint_pylint([directory], root / "pylint_2.txt", True, 2)
+
+        report: str = (root / "pylint_2.txt").read_text(encoding="utf-8")
+
+        assert "(duplicate-code)" in report, message
+        assert "(cyclic-import)" not in report, message
+
+
+def test_lint_ndjson_correct_values() -> None:
+    """
+        Tests the lint_flake8 and lint_pylint functions save a record per
+        message with the NDJSON output, the same as the text messages; and the
+        iter_results function filters them.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Auxiliary variables.
+        root: Path = Path(directory)
+        formats: dict = {
+            "flake8": "{file}:{line}: [{code}] {message}",
+            "pylint": "{file}:{line}:{offset}: {code}: {message}",
+        }
+
+        for name, text in MODULES.items():
+            (root / name).parent.mkdir(exist_ok=True)
+            (root / name).write_text(text, encoding="utf-8")
+
+        # ---------------------------------------------------------------------
+        # Test 1: The records must be the text messages; serially, in
+        # parallel, and with the cache.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message: str = "Test 1: The records must be the same messages."
+
+        for function in (lint_flake8, lint_pylint):
+            engine: str = function.__name__.split("_")[1]
+            function([directory], root / f"{engine}.txt", True)
+
+            expected: list = [
+                x for x in (root / f"{engine}.txt").read_text("utf-8")
+                .splitlines() if x.startswith(directory)
+            ]
+
+            for jobs, cache_dir in ((1, None), (2, None), (1, root / "c")):
+                file: Path = root / f"{engine}.ndjson"
+                function(
+                    [directory], file, True, jobs, cache_dir, output="ndjson"
+                )
+
+                records: list = list(iter_results(file))
+
+                assert len(records) == len(expected) > 0, message
+                assert all(x["engine"] == engine for x in records), message
+                assert all(
+                    y.startswith(
+                        formats[engine].format(offset=x["column"] - 1, **x)
+                    )
+                    for x, y in zip(records, expected)
+                ), message
+
+        # ---------------------------------------------------------------------
+        # Test 2: The records must be filtered by code and file.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 2: The records must be filtered."
+
+        lint_all(
+            [directory], root / "all.ndjson", recursive=True, output="ndjson"
+        )
+
+        file = root / "all_flake8.ndjson"
+        records = list(iter_results(file, codes=["F4"], files=["*/a.py"]))
+
+        assert [(x["file"], x["code"]) for x in records] == [
+            (f"{root / 'a.py'}", "F401")
+        ], message
+        assert not list(iter_results(file, codes=[])), message
+        assert len(list(iter_results(file, files=["*/package/*"]))) == 1, (
+            message
+        )
+
+
+def test_lint_pylint_daemon_correct_values() -> None:
+    """
+        Tests the lint_pylint_daemon function saves the same report as the
+        lint_pylint function, and sees the changes of the modules.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Auxiliary variables.
+        root: Path = Path(directory)
+        address: Path = root / "pylint.sock"
+        modules: dict = {
+            "m1.py": "\"\"\"M1.\"\"\"\n\n\ndef f(a):\n    \"\"\"F.\"\"\"\n"
+                     "    return a\n",
+            "m2.py": "\"\"\"M2.\"\"\"\nfrom m1 import f\n\nVALUE = f(1, 2)\n",
+        }
+        items: list = [f"{root / x}" for x in modules]
+        server: threading.Thread = threading.Thread(
+            target=serve_pylint, args=(address,), daemon=True
+        )
+
+        for name, text in modules.items():
+            (root / name).write_text(text, encoding="utf-8")
+
+        server.start()
+
+        while not address.is_socket():
+            time.sleep(0.01)
+
+        # ---------------------------------------------------------------------
+        # Test 1: The report must be the same as without the daemon; cold and
+        # warm.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message: str = "Test 1: The report must be the same."
+
+        lint_pylint(items, root / "expected.txt")
+        expected: str = (root / "expected.txt").read_text("utf-8")
+
+        for _ in range(2):
+            lint_pylint_daemon(items, root / "daemon.txt", address=address)
+            report: str = (root / "daemon.txt").read_text("utf-8")
+
+            assert "E1121" in report, message
+            assert report.split("\n---")[0] == expected.split("\n---")[0], (
+                message
+            )
+
+        # ---------------------------------------------------------------------
+        # Test 2: The changed modules must be inferred again; also those that
+        # are NOT linted.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 2: The changes must be seen."
+
+        (root / "m1.py").write_text(
+            modules["m1.py"].replace("f(a)", "f(a, b=0)"), encoding="utf-8"
+        )
+        lint_pylint_daemon(items[1:], root / "daemon.txt", address=address)
+
+        assert "E1121" not in (root / "daemon.txt").read_text("utf-8"), (
+            message
+        )
+
+        # ---------------------------------------------------------------------
+        # Test 3: The wrong requests, and the clients that are gone, must NOT
+        # stop the daemon; only the user can connect to it.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 3: The daemon must keep serving."
+
+        for data in (b"not json\n", b"[1]\n", b""):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(f"{address}")
+                client.sendall(data)
+
+        lint_pylint_daemon(items, root / "daemon.txt", address=address)
+
+        assert server.is_alive(), message
+        assert address.stat().st_mode & 0o777 == 0o600, message
+
+        # ---------------------------------------------------------------------
+        # Test 4: Without the private caches of astroid, all the modules must
+        # be evicted.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 4: The changes must be seen."
+
+        (root / "m1.py").write_text(modules["m1.py"], encoding="utf-8")
+
+        with (
+            patch.dict(sys.modules, {"astroid.context": None}),
+            patch.object(
+                MANAGER, "clear_cache", wraps=MANAGER.clear_cache
+            ) as mock
+        ):
+            lint_pylint_daemon(items[1:], root / "daemon.txt", address=address)
+
+            assert mock.called, message
+
+        assert "E1121" in (root / "daemon.txt").read_text("utf-8"), message
+
+        # ---------------------------------------------------------------------
+        # Test 5: The daemon must stop, and the files must be linted without
+        # it.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 5: The daemon must stop."
+
+        stop_pylint_daemon(address)
+        server.join()
+
+        assert not address.exists(), message
+
+        lint_pylint_daemon(items, root / "daemon.txt", address=address)
+
+        assert "E1121" in (root / "daemon.txt").read_text("utf-8"), message
+
+
+def test_lint_pylint_daemon_timeouts() -> None:
+    """
+        Tests the idle clients do NOT block the Pylint daemon, and the
+        lint_pylint_daemon function does NOT wait for a daemon that does NOT
+        reply.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Auxiliary variables.
+        root: Path = Path(directory)
+        address: Path = root / "pylint.sock"
+        items: list = [f"{root / 'a.py'}"]
+        server: threading.Thread = threading.Thread(
+            target=serve_pylint, args=(address,), daemon=True
+        )
+
+        (root / "a.py").write_text(MODULES["a.py"], encoding="utf-8")
+
+        server.start()
+
+        while not address.is_socket():
+            time.sleep(0.01)
+
+        # ---------------------------------------------------------------------
+        # Test 1: The idle clients must NOT block the daemon.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message: str = "Test 1: The daemon must serve after an idle client."
+
+        with (
+            patch("gutilities.general.glinting.TIMEOUT", 0.2),
+            patch(
+                "gutilities.general.glinting._daemon_lint",
+                wraps=_daemon_lint
+            ) as mock,
+            socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client
+        ):
+            client.connect(f"{address}")
+            lint_pylint_daemon(items, root / "daemon.txt", address=address)
+
+            assert mock.call_count == 1, message
+
+        # ---------------------------------------------------------------------
+        # Test 2: The files must be linted without the daemon, if it does NOT
+        # reply in time.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = "Test 2: The files must be linted without the daemon."
+
+        with (
+            patch("gutilities.general.glinting.TIMEOUT_REPLY", 0.2),
+            socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle
+        ):
+            idle.bind(f"{root / 'idle.sock'}")
+            idle.listen()
+
+            lint_pylint(items, root / "expected.txt")
+            lint_pylint_daemon(
+                items, root / "daemon.txt", address=root / "idle.sock"
+            )
+
+        assert (
+            (root / "daemon.txt").read_text("utf-8") ==
+            (root / "expected.txt").read_text("utf-8")
+        ), message
+
+        stop_pylint_daemon(address)
+        server.join()
+
+
+def test_lint_wrong_values() -> None:
+    """
+        Tests the lint_flake8 and lint_pylint functions raise an error when
+        the parameters are NOT valid.
+    """
+    # -------------------------------------------------------------------------
+    # Test 1: The number of processes must be a non-negative integer.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = "Test 1: A ValueError must be raised."
+
+    # Must raise a ValueError.
+    for function in (lint_flake8, lint_pylint):
+        for jobs in (-1, 1.0, True, None):
+            with RaisesException(ValueError, message=message):
+                function(["."], None, False, jobs)
+
+    # -------------------------------------------------------------------------
+    # Test 2: The directory of the cache must be a directory.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: A ValueError must be raised."
+
+    # Must raise a ValueError.
+    for function in (lint_flake8, lint_pylint):
+        for cache_dir in (1, __file__):
+            with RaisesException(ValueError, message=message):
+                function(["."], None, False, 1, cache_dir)
+
+    # -------------------------------------------------------------------------
+    # Test 3: The engines must be different, known engines.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 3: A ValueError must be raised."
+
+    # Must raise a ValueError.
+    for engines in ("flake8", (), ("flake8", "flake8"), ("mypy",), ([],)):
+        with RaisesException(ValueError, message=message):
+            lint_all(["."], None, engines)
+
+    # -------------------------------------------------------------------------
+    # Test 4: The excludes must be globs, and gitignore a boolean value.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 4: A ValueError must be raised."
+
+    # Must raise a ValueError.
+    for excludes, gitignore in (("*.py", True), ((1,), True), ((), 1)):
+        with RaisesException(ValueError, message=message):
+            iter_files(["."], excludes=excludes, gitignore=gitignore)
+
+    # -------------------------------------------------------------------------
+    # Test 5: The output must be known, and match the extension of the file.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 5: A ValueError must be raised."
+
+    # Must raise a ValueError.
+    for function in (lint_flake8, lint_pylint, lint_all):
+        for path, output in (("a.txt", "json"), ("a.txt", "ndjson")):
+            with RaisesException(ValueError, message=message):
+                function(["."], path, output=output)
+
+    for file, codes, files in ((None, None, None), (__file__, "E", None)):
+        with RaisesException(ValueError, message=message):
+            iter_results(file, codes, files)
+
+    # -------------------------------------------------------------------------
+    # Test 6: The address of the daemon must be a path.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 6: A ValueError must be raised."
+
+    # Must raise a ValueError.
+    for address in (None, "", 1):
+        with RaisesException(ValueError, message=message):
+            lint_pylint_daemon(["."], address=address)
+
+        with RaisesException(ValueError, message=message):
+            serve_pylint(address)
@@ -8,9 +8,18 @@
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+# Standard Library.
+import mmap
+import tempfile
+
+from typing import Iterator
+from unittest.mock import patch
+
 # User.
 from gutilities.general.gstrings import (
-    messages_concat, normalize, normalize_repr, sindent
+    MessageBuilder, iter_normalize, iter_normalize_bytes, iter_normalize_repr,
+    messages_concat, normalize, normalize_bytes, normalize_many,
+    normalize_repr, normalize_repr_many, sindent
 )
 
 from tests.auxiliary.genutils import RaisesException
@@ -21,6 +30,184 @@ from tests.auxiliary.genutils import RaisesException
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def test_iter_normalize_correct_values() -> None:
+    """
+        Tests the iter_normalize and iter_normalize_repr functions yield the
+        same lines as the normalize and normalize_repr functions; whatever the
+        chunks the text is split into.
+    """
+    # Auxiliary variables.
+    text: str = (
+        "The quick brown fox\njumps over the \"lazy\" dog\n\n\tIt's "
+        "abcdefghijklmnopqrstuvwxyz\n"
+    )
+    chunks: tuple = (
+        (text,),
+        text.splitlines(keepends=True),
+        tuple(text),
+        (text[:7], text[7:25], "", text[25:]),
+    )
+
+    # -------------------------------------------------------------------------
+    # Test 1: The lines must be the normalized text, once joined.
+    # -------------------------------------------------------------------------
+
+    for chunk in chunks:
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The joined lines are not the normalized text; chunks: "
+            f"{chunk}."
+        )
+
+        assert "\n".join(iter_normalize(iter(chunk), 1, 16)) == (
+            normalize(text, 1, 16)
+        ), message
+
+        assert "\n".join(iter_normalize_repr(iter(chunk), 1, 16, True)) == (
+            normalize_repr(text, 1, 16, True)
+        ), message
+
+    # -------------------------------------------------------------------------
+    # Test 2: Empty texts are still indented.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: An empty text is not normalized as expected."
+
+    assert list(iter_normalize((), 1)) == [normalize("", 1)], message
+    assert list(iter_normalize_repr([""])) == ["(", "    ", ")"], message
+
+
+def test_iter_normalize_wrong_type() -> None:
+    """
+        Tests that a TypeError is raised when the chunks are not an iterable,
+        right away, or when a chunk is not a string, once it is consumed.
+    """
+    # -------------------------------------------------------------------------
+    # Test 1: The chunks are not an iterable.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = (
+        "Test 1: A TypeError should be raised since the chunks are not an "
+        "iterable."
+    )
+
+    # Must raise a TypeError.
+    for function in (iter_normalize, iter_normalize_repr):
+        with RaisesException(TypeError, message=message):
+            function(10)
+
+    # -------------------------------------------------------------------------
+    # Test 2: A chunk is not a string.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = (
+        "Test 2: A TypeError should be raised since a chunk is not a string."
+    )
+
+    # Must raise a TypeError.
+    for function in (iter_normalize, iter_normalize_repr):
+        with RaisesException(TypeError, message=message):
+            list(function(["This is ", 10]))
+
+    # -------------------------------------------------------------------------
+    # Test 3: Wrong parameters are validated right away.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 3: A TypeError should be raised since the chars is wrong."
+
+    # Must raise a TypeError.
+    for function in (iter_normalize, iter_normalize_repr):
+        with RaisesException(TypeError, message=message):
+            function(["This is a test."], chars=0)
+
+
+def test_message_builder_correct_values() -> None:
+    """
+        Tests the MessageBuilder class builds the same message as the
+        messages_concat function, applied one part after another.
+    """
+    # Auxiliary variables.
+    cases: tuple = (
+        ("This is the base message", ("First.", "", "Second", "Third.")),
+        ("", ("  ", "First", "Second.  ", "Third")),
+        ("Base.\t", ("First.", "\nErrors:\n- a\n- b", "Last")),
+        ("  ", ()),
+    )
+
+    # -------------------------------------------------------------------------
+    # Test 1: The message must be the one of messages_concat.
+    # -------------------------------------------------------------------------
+
+    for base, parts in cases:
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The built message is not the concatenated one; base: "
+            f"{base!r}, parts: {parts}."
+        )
+
+        # Auxiliary variables.
+        builder: MessageBuilder = MessageBuilder(base)
+        expected: str = base
+
+        for part in parts:
+            expected = messages_concat(expected, part)
+
+            assert builder.append(part) is builder, message
+
+        assert builder.build() == expected, message
+        assert str(builder) == expected, message
+
+    # -------------------------------------------------------------------------
+    # Test 2: Parts can be appended after building.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: The message is not the expected one after building."
+
+    builder = MessageBuilder("First")
+
+    assert builder.build() == "First", message
+    assert builder.append("Second").build() == "First. Second", message
+
+
+def test_message_builder_wrong_type() -> None:
+    """
+        Tests that a TypeError is raised when the base message or the
+        appended message are not strings.
+    """
+    # -------------------------------------------------------------------------
+    # Test 1: The base message is not a string.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = (
+        "Test 1: A TypeError should be raised since the base message is not "
+        "a string."
+    )
+
+    # Must raise a TypeError.
+    with RaisesException(TypeError, message=message):
+        MessageBuilder(None)
+
+    # -------------------------------------------------------------------------
+    # Test 2: The appended message is not a string.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = (
+        "Test 2: A TypeError should be raised since the message is not a "
+        "string."
+    )
+
+    # Must raise a TypeError.
+    with RaisesException(TypeError, message=message):
+        MessageBuilder("Base").append(10)
+
+
 def test_message_concat_no_base_message() -> None:
     """
         Tests the messages are properly appended when the base message
@@ -197,6 +384,218 @@ def test_message_concat_wrong_type() -> None:
         messages_concat(message_blank, message_none[0])
 
 
+def test_normalize_bytes_correct_values() -> None:
+    """
+        Tests the normalize_bytes and iter_normalize_bytes functions normalize
+        the bytes-like objects as the normalize function does the decoded
+        text; even if the characters are split between windows.
+    """
+    # Auxiliary variables.
+    text: str = "Héllo wörld, ñandú\n\tThe quick brown fox " * 20 + "ünïcode"
+    encoded: bytes = text.encode()
+    expected: str = normalize(text, 1, 17)
+
+    # -------------------------------------------------------------------------
+    # Test 1: The bytes-like objects must be normalized as the text.
+    # -------------------------------------------------------------------------
+
+    for window in (1, 3, 1 << 20):
+        for buffer in (encoded, bytearray(encoded), memoryview(encoded)):
+            # Set the message in case an error happens.
+            message: str = (
+                f"Test 1: The {type(buffer).__name__} is not normalized as "
+                f"the text; window: {window}."
+            )
+
+            with patch("gutilities.general.gstrings.WINDOW", window):
+                assert normalize_bytes(buffer, 1, 17) == expected, message
+
+    # -------------------------------------------------------------------------
+    # Test 2: A memory-mapped file must be normalized as the text.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: The mmap is not normalized as the text."
+
+    with tempfile.TemporaryFile() as file:
+        file.write(text.encode("utf-16"))
+        file.flush()
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            assert "\n".join(
+                iter_normalize_bytes(buffer, 1, 17, encoding="utf-16")
+            ) == expected, message
+
+    # -------------------------------------------------------------------------
+    # Test 3: The buffer must NOT be exported while the iterator is suspended;
+    # e.g., the mmap can be closed.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 3: The buffer must be released between the lines."
+
+    with tempfile.TemporaryFile() as file:
+        file.write(encoded)
+        file.flush()
+
+        with (
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+            patch("gutilities.general.gstrings.WINDOW", 3)
+        ):
+            lines: Iterator = iter_normalize_bytes(buffer, 1, 17)
+
+            assert next(lines) == expected.split("\n", 1)[0], message
+
+            buffer.close()
+
+            assert buffer.closed, message
+
+    # -------------------------------------------------------------------------
+    # Test 4: The decoding errors are handled as requested.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 4: The decoding errors are not handled as expected."
+
+    assert normalize_bytes(b"a\xff b", errors="replace") == "a\ufffd b", (
+        message
+    )
+
+    with RaisesException(UnicodeDecodeError, message=message):
+        normalize_bytes(b"a\xff b")
+
+
+def test_normalize_bytes_wrong_type() -> None:
+    """
+        Tests that a TypeError is raised when the buffer is not a bytes-like
+        object, or the encoding is not known.
+    """
+    # Auxiliary variables.
+    parameters: tuple = (
+        ({"buffer": "This is a test."}, "the buffer is a string"),
+        (
+            {"buffer": memoryview(b"abcd")[::2]},
+            "the memoryview is not contiguous"
+        ),
+        ({"buffer": b"", "encoding": "unknown"}, "the encoding is unknown"),
+        ({"buffer": b"", "errors": None}, "the errors is not a string"),
+        ({"buffer": b"", "chars": 0}, "the chars is zero"),
+    )
+
+    # -------------------------------------------------------------------------
+    # Test 1: Wrong types are chosen.
+    # -------------------------------------------------------------------------
+
+    for kwargs, reason in parameters:
+        # Set the message in case an error happens.
+        message: str = f"Test 1: A TypeError should be raised since {reason}."
+
+        # Must raise a TypeError.
+        for function in (normalize_bytes, iter_normalize_bytes):
+            with RaisesException(TypeError, message=message):
+                function(**kwargs)
+
+
+def test_normalize_correct_values() -> None:
+    """
+        Tests the normalize function wraps the text as expected; including
+        the words that must be split.
+    """
+    # Auxiliary variables.
+    cases: tuple = (
+        (
+            ("The quick brown fox jumps over the lazy dog", 0, 10, False),
+            "The quick\nbrown fox\njumps over\nthe lazydo\ng"
+        ),
+        (
+            ("short abcdefghijklmnopqrstuvwxyz", 1, 12, False),
+            "    shortabcdefg\n    hijklmnopqrs\n    tuvwxyz"
+        ),
+        (("a" * 25, 0, 10, False), "aaaaaaaaaa\naaaaaaaaaa\naaaaa"),
+        (
+            ("first line\n\n\tsecond  line", 1, 16, True),
+            "    first line\n    \n    second line"
+        ),
+    )
+
+    # -------------------------------------------------------------------------
+    # Test 1: The text must be wrapped as expected.
+    # -------------------------------------------------------------------------
+
+    for parameters, expected in cases:
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The normalized text is not the expected one; "
+            f"parameters: {parameters}."
+        )
+
+        assert normalize(*parameters) == expected, message
+
+
+def test_normalize_display_width() -> None:
+    """
+        Tests the normalize function wraps the text by the number of columns
+        the characters take, with the display width; and as with the number
+        of characters, for the ASCII text.
+    """
+    # Auxiliary variables.
+    cases: tuple = (
+        (("日本語 漢字 中文 한국어", 0, 7), "日本語\n漢字中\n文한국\n어"),
+        (("日本語漢字中文", 0, 5), "日本\n語漢\n字中\n文"),
+        (
+            ("cafe\u0301 cafe\u0301 cafe\u0301", 0, 10),
+            "cafe\u0301 cafe\u0301\ncafe\u0301"
+        ),
+    )
+    text: str = "The quick brown fox\njumps over the lazy dog\n\tabcdefghij"
+
+    # -------------------------------------------------------------------------
+    # Test 1: The wide characters take two columns, the marks none.
+    # -------------------------------------------------------------------------
+
+    for parameters, expected in cases:
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The text is not wrapped by display width; parameters: "
+            f"{parameters}."
+        )
+
+        assert normalize(*parameters, width="display") == expected, message
+
+        assert "\n".join(
+            iter_normalize(
+                iter(parameters[0]), *parameters[1:], width="display"
+            )
+        ) == expected, message
+
+    # -------------------------------------------------------------------------
+    # Test 2: The ASCII text is wrapped as with the number of characters.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: The ASCII text must be wrapped as by characters."
+
+    for chars in (1, 5, 12, 60):
+        assert normalize(text, 1, chars, width="display") == (
+            normalize(text, 1, chars)
+        ), message
+
+    # -------------------------------------------------------------------------
+    # Test 3: The width must be a known one.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 3: A TypeError should be raised; the width is unknown."
+
+    # Must raise a TypeError.
+    for width in ("columns", None):
+        with RaisesException(TypeError, message=message):
+            normalize(text, width=width)
+
+        with RaisesException(TypeError, message=message):
+            iter_normalize([text], width=width)
+
+
 def test_normalize_indent_tool_long() -> None:
     """
         Tests that a TypeError is raised when the input of the
@@ -236,6 +635,76 @@ def test_normalize_indent_tool_long() -> None:
     normalize(**parameters)
 
 
+def test_normalize_many_correct_values() -> None:
+    """
+        Tests the normalize_many and normalize_repr_many functions normalize
+        each text as the normalize and normalize_repr functions; in order,
+        serially and with a pool of processes.
+    """
+    # Auxiliary variables.
+    texts: list = [
+        f"Message {i}: " + "abcdefghij " * (i % 7) + "\tend\n" * (i % 2)
+        for i in range(50)
+    ]
+    expected: list = [normalize(x, 1, 20) for x in texts]
+    expected_repr: list = [normalize_repr(x, 1, 20, True) for x in texts]
+
+    # -------------------------------------------------------------------------
+    # Test 1: Serially; there are too few texts, or a single worker.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = "Test 1: The texts must be normalized serially, in order."
+
+    assert normalize_many(iter(texts), 1, 20) == expected, message
+    assert normalize_repr_many(
+        texts, 1, 20, True, workers=1
+    ) == expected_repr, message
+
+    # -------------------------------------------------------------------------
+    # Test 2: With a pool of processes.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: The texts must be normalized in a pool, in order."
+
+    with patch("gutilities.general.gstrings.POOL_MINIMUM", 0):
+        assert normalize_many(
+            texts, 1, 20, workers=2, chunksize=3
+        ) == expected, message
+
+        assert normalize_repr_many(
+            texts, 1, 20, True, workers=2
+        ) == expected_repr, message
+
+
+def test_normalize_many_wrong_type() -> None:
+    """
+        Tests that a TypeError is raised when the texts are not all strings,
+        or the workers or the chunksize are not valid.
+    """
+    # Auxiliary variables.
+    parameters: tuple = (
+        ({"texts": ["This is a test.", 10]}, "a text is not a string"),
+        ({"texts": [], "workers": 0}, "the workers is zero"),
+        ({"texts": [], "chunksize": 1.5}, "the chunksize is not an integer"),
+        ({"texts": [], "chars": 0}, "the chars is zero"),
+    )
+
+    # -------------------------------------------------------------------------
+    # Test 1: Wrong types are chosen.
+    # -------------------------------------------------------------------------
+
+    for kwargs, reason in parameters:
+        # Set the message in case an error happens.
+        message: str = f"Test 1: A TypeError should be raised since {reason}."
+
+        # Must raise a TypeError.
+        for function in (normalize_many, normalize_repr_many):
+            with RaisesException(TypeError, message=message):
+                function(**kwargs)
+
+
 def test_normalize_wrong_type() -> None:
     """
         Tests that a TypeError is raised when the input is not a
@@ -384,6 +853,51 @@ def test_normalize_wrong_type_indent() -> None:
     normalize(**parameters)
 
 
+def test_normalize_repr_correct_values() -> None:
+    """
+        Tests the normalize_repr function wraps the representation as
+        expected; including the quotes and the escaped characters.
+    """
+    # Auxiliary variables.
+    cases: tuple = (
+        (
+            ("The quick brown fox jumps over the lazy dog", 0, 16, False),
+            "(\n    'The quick brow'\n    'n fox jumps ov'\n"
+            "    'er the lazy do'\n    'g'\n)"
+        ),
+        (
+            ("It's a \"quoted\" word", 0, 12, False),
+            "(\n    'It\\'s a \"q'\n    'uoted\" wor'\n    'd'\n)"
+        ),
+        (
+            ("path C:\\dir\\file", 0, 10, False),
+            "(\n    'path C:'\n    '\\\\dir\\\\f'\n    'ile'\n)"
+        ),
+        (
+            ("a" * 20, 0, 10, False),
+            "(\n    'aaaaaaaa'\n    'aaaaaaaa'\n    'aaaa'\n)"
+        ),
+        (
+            ("first\n\nsecond line", 1, 20, True),
+            "    (\n        'first\\n'\n        '\\n'\n"
+            "        'second lin'\n        'e\\n'\n    )"
+        ),
+    )
+
+    # -------------------------------------------------------------------------
+    # Test 1: The representation must be wrapped as expected.
+    # -------------------------------------------------------------------------
+
+    for parameters, expected in cases:
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The normalized representation is not the expected "
+            f"one; parameters: {parameters}."
+        )
+
+        assert normalize_repr(*parameters) == expected, message
+
+
 def test_normalize_repr_indent_tool_long() -> None:
     """
         Tests that a TypeError is raised when the input of the "indent"
@@ -571,6 +1085,33 @@ def test_normalize_repr_wrong_type_indent() -> None:
     normalize_repr(**parameters)
 
 
+def test_sindent_cached() -> None:
+    """
+        Tests the indentation strings are cached, and that the parameters are
+        still validated for the cached indentations.
+    """
+    # -------------------------------------------------------------------------
+    # Test 1: The same indentation must be returned.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = "Test 1: The indentation must be cached."
+
+    assert sindent(2, base=0) is sindent(2, base=0), message
+    assert sindent(2, base=0, istab=True) == "\t\t", message
+
+    # -------------------------------------------------------------------------
+    # Test 2: Equal, but invalid, parameters must still be validated.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: A ValueError should be raised since the level is wrong."
+
+    # Must raise a ValueError.
+    with RaisesException(ValueError, message=message):
+        sindent(2.0, base=0)
+
+
 def test_sindent_length() -> None:
     """
         Tests that the length of the string is consistent with the
@@ -10,7 +10,11 @@
 
 # User.
 from gutilities.exceptions.ecollections import NotInCollectionError
-from gutilities.validation.vcollections import validate_in
+from gutilities.validation.vcollections import (
+    MembershipIndex,
+    validate_in,
+    validate_in_many
+)
 
 from tests.auxiliary.genutils import RaisesException
 
@@ -20,6 +24,84 @@ from tests.auxiliary.genutils import RaisesException
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def test_membership_index_correct_values() -> None:
+    """
+        Tests the MembershipIndex class picks the proper representation and
+        gives the same results as the collection.
+    """
+    # Auxiliary variables.
+    collections: dict = {
+        "hash": (3, 9, "a"),
+        "range": range(0, 20, 3),
+        "scan": "abc",
+        "sorted": [[1], [1, 2], [3]],
+    }
+    items: tuple = (3, 9.0, 4, 4.5, "a", "ab", [1], [1, 2], [2], True, None)
+
+    # -------------------------------------------------------------------------
+    # Test 1: The representation must be the expected one.
+    # -------------------------------------------------------------------------
+
+    for kind, collection in collections.items():
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The representation of {collection} must be \"{kind}\"."
+        )
+
+        assert MembershipIndex(collection).kind == kind, message
+
+    # -------------------------------------------------------------------------
+    # Test 2: The results must be the same as the collection.
+    # -------------------------------------------------------------------------
+
+    for collection in collections.values():
+        # Index the collection.
+        index: MembershipIndex = MembershipIndex(collection)
+
+        for item in items:
+            # Set the message in case an error happens.
+            message = (
+                f"Test 2: The index of {collection} is not consistent with "
+                f"the collection; current item: {item}."
+            )
+
+            # Strings only contain strings.
+            if isinstance(collection, str) and not isinstance(item, str):
+                continue
+
+            assert (item in index) == (item in collection), message
+
+    # -------------------------------------------------------------------------
+    # Test 3: The items that are NOT totally ordered must be scanned; e.g.,
+    # sets, ordered by inclusion, and NaN.
+    # -------------------------------------------------------------------------
+
+    for collection in ([{3}, {1}, {2}], [[1], [float("nan")]]):
+        # Set the message in case an error happens.
+        message = (
+            f"Test 3: The index of {collection} is not consistent with the "
+            f"collection."
+        )
+
+        # Index the collection.
+        index = MembershipIndex(collection)
+
+        assert index.kind == "scan", message
+        assert all(x in index for x in collection), message
+        assert ({4} in index) == ({4} in collection), message
+
+    # -------------------------------------------------------------------------
+    # Test 4: Must be a collection.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 4: The index must be built from a collection."
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        MembershipIndex(3)
+
+
 def test_validate_in_collection_not_collection() -> None:
     """
         Tests there is an exception if the object to be validated is not
@@ -152,3 +234,68 @@ def test_validate_in_correct_values() -> None:
         kwargs["collection"] = dtype((3, 9))
 
         assert validate_in(**kwargs), message
+
+
+def test_validate_in_many_correct_values() -> None:
+    """
+        Tests the validate_in_many function.
+    """
+    # Auxiliary variables.
+    kwargs: dict = {
+        "values": iter((3, 7, 9)),
+        "index": MembershipIndex([3, 9]),
+        "exception": False,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The results must be given for each object.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = "Test 1: Only the first and last objects are valid."
+
+    assert validate_in_many(**kwargs) == [True, False, True], message
+
+    # -------------------------------------------------------------------------
+    # Test 2: The collection itself can be given.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: The collection must be indexed."
+
+    # Set the proper values.
+    kwargs["values"] = (3, 7, 9)
+    kwargs["index"] = (3, 9)
+
+    assert validate_in_many(**kwargs) == [True, False, True], message
+
+    # -------------------------------------------------------------------------
+    # Test 3: An object not in, with exception.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = (
+        "Test 3: An object is NOT in the collection; an exception must be "
+        "raised."
+    )
+
+    # Set the proper values.
+    kwargs["exception"] = True
+
+    # Must throw a NotInCollectionError.
+    with RaisesException(NotInCollectionError, message=message):
+        validate_in_many(**kwargs)
+
+    # -------------------------------------------------------------------------
+    # Test 4: The values must be an iterable.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 4: The \"values\" parameter must be an iterable."
+
+    # Set the proper values.
+    kwargs["values"] = 3
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        validate_in_many(**kwargs)
@@ -10,6 +10,7 @@
 
 # Standard Library.
 import copy as cp
+import sys
 
 # User.
 from gutilities.exceptions.edicts import (
@@ -19,6 +20,7 @@ from gutilities.exceptions.edicts import (
     WrongKeysSubsetAndTypeError
 )
 from gutilities.validation.vdicts import (
+    compile_schema,
     validate_keys_equal,
     validate_keys_equal_and_type,
     validate_keys_subset,
@@ -96,6 +98,116 @@ BASE_TYPES: dict = {
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def test_compile_schema_mode_not_valid() -> None:
+    """
+        Tests there is an exception if the value of the "mode" parameter is
+        not one of the valid validation modes.
+    """
+    # Auxiliary variables.
+    kwargs: dict = {
+        "base": cp.deepcopy(BASE),
+        "mode": "superset",
+        "depth": 0,
+        "extract": False,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The "mode" is not one of the valid modes.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = (
+        "Test 1: The \"mode\" is one of the valid modes; it must NOT be a "
+        "valid mode to raise an exception."
+    )
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        compile_schema(**kwargs)
+
+    # -------------------------------------------------------------------------
+    # Test 2: Correct values are chosen.
+    # -------------------------------------------------------------------------
+
+    # Must be a valid mode.
+    kwargs["mode"] = "subset"
+
+    compile_schema(**kwargs)
+
+
+def test_compile_schema_validate_keys() -> None:
+    """
+        Tests the compiled validators give the same results as the
+        validate_keys_* functions.
+    """
+    # Auxiliary variables.
+    original: dict = cp.deepcopy(BASE)
+    del original["zero_0"]["one_0"]["two_0"]
+
+    # -------------------------------------------------------------------------
+    # Test 1: The keys only validators must be consistent with the
+    # functions, at every depth.
+    # -------------------------------------------------------------------------
+
+    for depth in (-1, 0, 1, 2):
+        # Compile the validators.
+        equal = compile_schema(BASE, mode="equal", depth=depth)
+        subset = compile_schema(BASE, mode="subset", depth=depth)
+
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The compiled validators are not consistent with the "
+            f"functions; current depth: {depth}."
+        )
+
+        for dictionary in (BASE, original, {"zero_0": {}}):
+            assert equal(dictionary) == validate_keys_equal(
+                BASE, dictionary, depth
+            ), message
+
+            assert subset(dictionary) == validate_keys_subset(
+                BASE, dictionary, depth
+            ), message
+
+    # -------------------------------------------------------------------------
+    # Test 2: The keys and types validators must be consistent with the
+    # functions.
+    # -------------------------------------------------------------------------
+
+    # Compile the validators.
+    equal = compile_schema(BASE_TYPES, mode="equal_and_type")
+    subset = compile_schema(BASE_TYPES, mode="subset_and_type")
+
+    # Set the message in case an error happens.
+    message = (
+        "Test 2: The compiled validators are not consistent with the "
+        "functions."
+    )
+
+    for dictionary in (BASE, original, {"zero_0": {}}):
+        assert equal(dictionary) == validate_keys_equal_and_type(
+            BASE_TYPES, dictionary
+        ), message
+
+        assert subset(dictionary) == validate_keys_subset_and_type(
+            BASE_TYPES, dictionary
+        ), message
+
+    # -------------------------------------------------------------------------
+    # Test 3: Must raise the same exception as the functions.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = (
+        "Test 3: An exception should be raised, since it has been "
+        "requested."
+    )
+
+    # Must throw a WrongKeysSubsetAndTypeError.
+    with RaisesException(WrongKeysSubsetAndTypeError, message=message):
+        subset({"extra": 1}, exception=True)
+
+
 def test_keys_equal_base_not_dict() -> None:
     """
         Tests there is an exception if the value of the "base"
@@ -244,6 +356,45 @@ def test_keys_equal_exception_not_bool() -> None:
     validate_keys_equal(**kwargs)
 
 
+def test_keys_equal_failfast_not_bool() -> None:
+    """
+        Tests there is an exception if the value of the "failfast"
+        parameter is not a boolean.
+    """
+    # Auxiliary variables.
+    kwargs: dict = {
+        "base": {},
+        "dictionary": {},
+        "depth": 0,
+        "exception": False,
+        "failfast": 1,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The expected type of "failfast" is the wrong type.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = (
+        "Test 1: The expected type of \"failfast\" is a boolean value; "
+        "it must NOT be a boolean number to raise an exception."
+    )
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        validate_keys_equal(**kwargs)
+
+    # -------------------------------------------------------------------------
+    # Test 2: Correct types are chosen.
+    # -------------------------------------------------------------------------
+
+    # Must be a boolean value or None.
+    for failfast in (None, True):
+        kwargs["failfast"] = failfast
+
+        validate_keys_equal(**kwargs)
+
+
 def test_keys_equal_validate_keys_equal_basic() -> None:
     """
         Tests the validate_keys_equal function for valid and invalid cases.
@@ -366,6 +517,145 @@ def test_keys_equal_validate_keys_equal_level() -> None:
         validate_keys_equal(**kwargs)
 
 
+def test_keys_equal_validate_keys_equal_deep() -> None:
+    """
+        Tests the validate_keys_* functions for dictionaries that are deeper
+        than the recursion limit.
+    """
+    # Auxiliary variables.
+    base: dict = {"value": 0}
+    dictionary: dict = {"value": 0}
+
+    for i in range(sys.getrecursionlimit() + 100):
+        base = {f"level_{i}": base, "value": i}
+        dictionary = {f"level_{i}": dictionary, "value": i}
+
+    # -------------------------------------------------------------------------
+    # Test 1: The dictionaries are the same; no recursion error should be
+    # raised.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = "Test 1: The deep dictionaries must be valid."
+
+    assert validate_keys_equal(base, dictionary, -1), message
+    assert validate_keys_subset(base, dictionary, -1), message
+    assert validate_keys_equal_and_type(base, dictionary, True), message
+    assert validate_keys_subset_and_type(base, dictionary, True), message
+
+    # -------------------------------------------------------------------------
+    # Test 2: The deepest level has a different key.
+    # -------------------------------------------------------------------------
+
+    # Change the deepest level.
+    deepest: dict = dictionary
+
+    while "level_0" not in deepest:
+        deepest = next(x for x in deepest.values() if isinstance(x, dict))
+
+    deepest["level_0"] = {"other": 0}
+
+    # Set the message in case an error happens.
+    message = "Test 2: The deepest level of the dictionaries is different."
+
+    assert not validate_keys_equal(base, dictionary, -1), message
+
+    with RaisesException(WrongKeysError, message=message):
+        validate_keys_equal(base, dictionary, -1, True)
+
+
+def test_keys_equal_validate_keys_equal_failfast() -> None:
+    """
+        Tests the fail-fast and collect-all modes of the validate_keys_*
+        functions give the same results.
+    """
+    # Auxiliary variables.
+    dictionary: dict = cp.deepcopy(BASE)
+    del dictionary["zero_0"]["one_0"]["two_0"]
+    dictionary["zero_1"]["one_2"]["two_3"] = 12
+
+    # -------------------------------------------------------------------------
+    # Test 1: Both modes must find the dictionaries are different.
+    # -------------------------------------------------------------------------
+
+    for failfast in (None, True):
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The dictionaries must be different; current value of "
+            f"\"failfast\": {failfast}."
+        )
+
+        assert not validate_keys_equal(
+            BASE, dictionary, -1, failfast=failfast
+        ), message
+
+        assert not validate_keys_subset(
+            BASE, dictionary, -1, failfast=failfast
+        ), message
+
+        assert not validate_keys_equal_and_type(
+            BASE_TYPES, dictionary, failfast=failfast
+        ), message
+
+        assert not validate_keys_subset_and_type(
+            BASE_TYPES, dictionary, failfast=failfast
+        ), message
+
+    # -------------------------------------------------------------------------
+    # Test 2: Both modes must raise the exception, if requested.
+    # -------------------------------------------------------------------------
+
+    for failfast in (None, True, False):
+        # Set the message in case an error happens.
+        message = (
+            f"Test 2: An exception should be raised, since it has been "
+            f"requested; current value of \"failfast\": {failfast}."
+        )
+
+        # Must throw a WrongKeysError.
+        with RaisesException(WrongKeysError, message=message):
+            validate_keys_equal(BASE, dictionary, -1, True, failfast)
+
+    # -------------------------------------------------------------------------
+    # Test 3: The exception must report the first mismatch, or all of them.
+    # -------------------------------------------------------------------------
+
+    for failfast, count in ((True, 1), (False, 2), (None, 2)):
+        # Set the message in case an error happens.
+        message = (
+            f"Test 3: The exception must report {count} mismatch(es); current "
+            f"value of \"failfast\": {failfast}."
+        )
+
+        try:
+            validate_keys_equal(BASE, dictionary, -1, True, failfast)
+
+        except WrongKeysError as error:
+            assert error.message.count("\n- ") == count, message
+
+    # -------------------------------------------------------------------------
+    # Test 4: The collect-all mode requires the exception; the mismatches
+    # would be discarded, otherwise.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = (
+        "Test 4: The \"failfast\" parameter can only be False if the "
+        "exception must be raised."
+    )
+
+    for function, kwargs in (
+        (validate_keys_equal, {"base": BASE, "depth": -1}),
+        (validate_keys_subset, {"base": BASE, "depth": -1}),
+        (validate_keys_equal_and_type, {"base": BASE_TYPES}),
+        (validate_keys_subset_and_type, {"base": BASE_TYPES}),
+        (compile_schema(BASE, depth=-1), {}),
+    ):
+        # Must throw a ValueError.
+        with RaisesException(ValueError, message=message):
+            function(dictionary=dictionary, failfast=False, **kwargs)
+
+
 def test_keys_equal_and_type_base_not_dict() -> None:
     """
         Tests there is an exception if the value of the "base"
@@ -514,6 +804,45 @@ def test_keys_equal_and_type_exception_not_bool() -> None:
     validate_keys_equal_and_type(**kwargs)
 
 
+def test_keys_equal_and_type_failfast_not_bool() -> None:
+    """
+        Tests there is an exception if the value of the "failfast"
+        parameter is not a boolean.
+    """
+    # Auxiliary variables.
+    kwargs: dict = {
+        "base": {},
+        "dictionary": {},
+        "extract": False,
+        "exception": False,
+        "failfast": 1,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The expected type of "failfast" is the wrong type.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = (
+        "Test 1: The expected type of \"failfast\" is a boolean value; "
+        "it must NOT be a boolean number to raise an exception."
+    )
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        validate_keys_equal_and_type(**kwargs)
+
+    # -------------------------------------------------------------------------
+    # Test 2: Correct types are chosen.
+    # -------------------------------------------------------------------------
+
+    # Must be a boolean value or None.
+    for failfast in (None, True):
+        kwargs["failfast"] = failfast
+
+        validate_keys_equal_and_type(**kwargs)
+
+
 def test_keys_equal_and_type_validate_keys_equal_basic() -> None:
     """
         Tests the validate_keys_equal function for valid and invalid cases.
@@ -752,6 +1081,45 @@ def test_keys_subset_exception_not_bool() -> None:
     validate_keys_subset(**kwargs)
 
 
+def test_keys_subset_failfast_not_bool() -> None:
+    """
+        Tests there is an exception if the value of the "failfast"
+        parameter is not a boolean.
+    """
+    # Auxiliary variables.
+    kwargs: dict = {
+        "base": {},
+        "dictionary": {},
+        "depth": 0,
+        "exception": False,
+        "failfast": 1,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The expected type of "failfast" is the wrong type.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = (
+        "Test 1: The expected type of \"failfast\" is a boolean value; "
+        "it must NOT be a boolean number to raise an exception."
+    )
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        validate_keys_subset(**kwargs)
+
+    # -------------------------------------------------------------------------
+    # Test 2: Correct types are chosen.
+    # -------------------------------------------------------------------------
+
+    # Must be a boolean value or None.
+    for failfast in (None, True):
+        kwargs["failfast"] = failfast
+
+        validate_keys_subset(**kwargs)
+
+
 def test_keys_subset_validate_keys_subset_basic() -> None:
     """
         Tests the validate_keys_subkeys function for valid and invalid
@@ -1024,6 +1392,45 @@ def test_keys_subset_and_typebase_exception_not_bool() -> None:
     validate_keys_subset_and_type(**kwargs)
 
 
+def test_keys_subset_and_type_failfast_not_bool() -> None:
+    """
+        Tests there is an exception if the value of the "failfast"
+        parameter is not a boolean.
+    """
+    # Auxiliary variables.
+    kwargs: dict = {
+        "base": {},
+        "dictionary": {},
+        "extract": False,
+        "exception": False,
+        "failfast": 1,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The expected type of "failfast" is the wrong type.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = (
+        "Test 1: The expected type of \"failfast\" is a boolean value; "
+        "it must NOT be a boolean number to raise an exception."
+    )
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        validate_keys_subset_and_type(**kwargs)
+
+    # -------------------------------------------------------------------------
+    # Test 2: Correct types are chosen.
+    # -------------------------------------------------------------------------
+
+    # Must be a boolean value or None.
+    for failfast in (None, True):
+        kwargs["failfast"] = failfast
+
+        validate_keys_subset_and_type(**kwargs)
+
+
 def test_keys_subset_and_typebase_validate_keys_subset_basic() -> None:
     """
         Tests the validate_keys_subkeys function for valid and invalid
@@ -9,9 +9,15 @@
 
 
 # User.
+from gutilities.context_managers.ctrusted import TrustedValidation
 from gutilities.exceptions.ecollections import WrongLengthError
 from gutilities.exceptions.etypes import WrongTypeError
-from gutilities.validation.vgeneral import validate_length, validate_type
+from gutilities.validation.vgeneral import (
+    TypeCheck,
+    compile_type_check,
+    validate_length,
+    validate_type
+)
 
 from tests.auxiliary.genutils import RaisesException
 
@@ -21,6 +27,59 @@ from tests.auxiliary.genutils import RaisesException
 # $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 
+def test_compile_type_check_correct_values() -> None:
+    """
+        Tests the compile_type_check function and the compiled TypeCheck
+        objects.
+    """
+    # Auxiliary variables.
+    values: tuple = (1, 1.5, True, "a", None, [1])
+    vtypes: tuple = (int, (str, None), None, (float, None, int))
+
+    # -------------------------------------------------------------------------
+    # Test 1: The type checks must give the same results as validate_type.
+    # -------------------------------------------------------------------------
+
+    for vtype in vtypes:
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The type check for {vtype} is not consistent with the "
+            f"validate_type function."
+        )
+
+        # Type check.
+        check: TypeCheck = compile_type_check(vtype)
+        expected: list = [validate_type(value, vtype) for value in values]
+
+        assert [check(value) for value in values] == expected, message
+        assert check.check_many(iter(values)) == expected, message
+
+    # -------------------------------------------------------------------------
+    # Test 2: The type checks must be cached, with None split out.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: The type checks must be cached."
+
+    # Type check.
+    check = compile_type_check((str, None))
+
+    assert check is compile_type_check((str, None)), message
+    assert check.none and check.types == (str, type(None)), message
+
+    # -------------------------------------------------------------------------
+    # Test 3: The types must be valid; even if they cannot be hashed.
+    # -------------------------------------------------------------------------
+
+    for vtype in ((), (int, 1), [int], (int, [1])):
+        # Set the message in case an error happens.
+        message = f"Test 3: The type {vtype} must NOT be valid."
+
+        # Must throw a ValueError.
+        with RaisesException(ValueError, message=message):
+            compile_type_check(vtype)
+
+
 def test_validate_length_correct_values() -> None:
     """
         Tests the value is false for valid values for the validation
@@ -143,6 +202,77 @@ def test_validate_length_incorrect_values() -> None:
             validate_length(**kwargs)
 
 
+def test_validate_length_iterators() -> None:
+    """
+        Tests the length of the iterators is only counted if they can be
+        consumed, and only until the expected length is exceeded.
+    """
+    # Auxiliary variables.
+    kwargs: dict = {
+        "value": iter(range(100)),
+        "length": 3,
+        "exception": False,
+        "consume": False,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: One-shot iterators must NOT be consumed by default.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = (
+        "Test 1: The iterator can only be consumed if \"consume\" is True."
+    )
+
+    # Must throw a ValueError; even if trusted.
+    with RaisesException(ValueError, message=message):
+        validate_length(**kwargs)
+
+    with TrustedValidation():
+        with RaisesException(ValueError, message=message):
+            validate_length(**kwargs)
+
+    assert next(kwargs["value"]) == 0, message
+
+    # -------------------------------------------------------------------------
+    # Test 2: The counting must stop after the expected length.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: Only the expected length, plus one, must be consumed."
+
+    # Set the values.
+    kwargs["consume"] = True
+
+    assert not validate_length(**kwargs), message
+    assert next(kwargs["value"]) == 5, message
+
+    # -------------------------------------------------------------------------
+    # Test 3: Iterables that are not sized are counted.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 3: The iterator has the expected length."
+
+    # Set the values.
+    kwargs["value"] = iter((1, 2, 3))
+
+    assert validate_length(**kwargs), message
+
+    # -------------------------------------------------------------------------
+    # Test 4: Sized objects are NOT iterated.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 4: The length of sized objects must be taken directly."
+
+    # Set the values.
+    kwargs["length"] = 10 ** 15
+    kwargs["value"] = range(kwargs["length"])
+
+    assert validate_length(**kwargs), message
+
+
 def test_validate_length_length_positive() -> None:
     """
         Tests there is an exception if the value of the length is not
@@ -191,7 +321,7 @@ def test_validate_length_length_positive() -> None:
 def test_validate_length_value_not_a_collection() -> None:
     """
         Tests there is an exception raise when the value passed for
-        validation is not a collection.
+        validation is not an iterable.
     """
     # Auxiliary variables.
     kwargs: dict = {
@@ -201,13 +331,13 @@ def test_validate_length_value_not_a_collection() -> None:
     }
 
     # -------------------------------------------------------------------------
-    # Test 1: The expected type of "value" is NOT a collection.
+    # Test 1: The expected type of "value" is NOT an iterable.
     # -------------------------------------------------------------------------
 
     # Set the message in case an error happens.
     message: str = (
-        "Test 1: The expected type of \"value\" is a \"Collection\"; it "
-        "must NOT be a collection to raise an exception."
+        "Test 1: The expected type of \"value\" is an \"Iterable\"; it "
+        "must NOT be an iterable to raise an exception."
     )
 
     # Must throw a ValueError.
@@ -11,14 +11,21 @@
 # Standard Library.
 import copy as cp
 
+from array import array
+from contextlib import nullcontext
+from unittest.mock import patch
+
 # User.
 from gutilities.exceptions.enumbers import (
     AboveBelowBoundError, NotInRangeError
 )
 from gutilities.validation.vnumbers import (
     validate_greater_than,
+    validate_greater_than_array,
     validate_in_range,
-    validate_less_than
+    validate_in_range_array,
+    validate_less_than,
+    validate_less_than_array
 )
 
 from tests.auxiliary.genutils import RaisesException
@@ -235,6 +242,107 @@ def test_greater_than_validate_greater_than() -> None:
         validate_greater_than(**dictionary)
 
 
+def test_greater_than_validate_greater_than_array() -> None:
+    """
+        Tests the validate_greater_than_array function gives the same results
+        as the validate_greater_than function, for each value.
+    """
+    # Auxiliary variables.
+    values: list = [0.0, 1.0, float("nan"), 2.0, -1.0]
+    kwargs: dict = {
+        "values": array("d", values),
+        "bound": 1.0,
+        "include": False,
+        "mode": "mask",
+        "exception": False,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The mask must match the scalar validation.
+    # -------------------------------------------------------------------------
+
+    for include in (False, True):
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The mask is not the expected one; include: {include}."
+        )
+
+        # Set the values.
+        kwargs["include"] = include
+        expected: list = [
+            validate_greater_than(value, 1.0, include) for value in values
+        ]
+
+        assert list(validate_greater_than_array(**kwargs)) == expected, (
+            message
+        )
+
+    # -------------------------------------------------------------------------
+    # Test 2: The offending values, with exception.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = (
+        "Test 2: There are values below the bound; an exception must be "
+        "raised."
+    )
+
+    # Set the values.
+    kwargs["exception"] = True
+
+    # Must throw an AboveBelowBoundError.
+    with RaisesException(AboveBelowBoundError, message=message):
+        validate_greater_than_array(**kwargs)
+
+    # -------------------------------------------------------------------------
+    # Test 3: The values must be real numbers.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 3: The values must be real numbers."
+
+    # Set the values.
+    kwargs["values"] = "12"
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        validate_greater_than_array(**kwargs)
+
+
+def test_greater_than_validate_greater_than_array_buffer() -> None:
+    """
+        Tests the validate_greater_than_array function gives the same results
+        for the buffer-protocol objects, with NumPy and with the pure Python
+        fallback.
+    """
+    # Auxiliary variables.
+    buffers: tuple = (
+        b"\x01\x05", bytearray(b"\x01\x05"), memoryview(b"\x01\x05"),
+        array("i", [1, 5])
+    )
+
+    # -------------------------------------------------------------------------
+    # Test 1: The buffers must be arrays of numbers; e.g., bytes are NOT a
+    # string.
+    # -------------------------------------------------------------------------
+
+    for numpy in (True, False):
+        with patch(
+            "gutilities.validation.vnumbers._get_numpy",
+            return_value=None
+        ) if not numpy else nullcontext():
+            for values in buffers:
+                # Set the message in case an error happens.
+                message: str = (
+                    f"Test 1: The mask is not the expected one; values: "
+                    f"{values!r}, numpy: {numpy}."
+                )
+
+                assert list(validate_greater_than_array(values, 1)) == [
+                    False, True
+                ], message
+
+
 def test_greater_than_value_not_real() -> None:
     """
         Tests there is an exception if the value of the "value"
@@ -628,6 +736,197 @@ def test_in_range_validate_in_range() -> None:
         validate_in_range(**dictionary)
 
 
+def test_in_range_validate_in_range_array() -> None:
+    """
+        Tests the validate_in_range_array function gives the same results as
+        the validate_in_range function, for each value.
+    """
+    # Auxiliary variables.
+    values: list = [0.0, 1.0, float("nan"), 2.0, -1.0, 3.0]
+    kwargs: dict = {
+        "values": array("d", values),
+        "crange": (0, 2),
+        "include": (True, True),
+        "mode": "mask",
+        "exception": False,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The mask must match the scalar validation.
+    # -------------------------------------------------------------------------
+
+    for include in ((True, True), (False, True), (True, False)):
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The mask is not the expected one; include: {include}."
+        )
+
+        # Set the values.
+        kwargs["include"] = include
+        expected: list = [
+            validate_in_range(value, (0, 2), include) for value in values
+        ]
+
+        assert list(validate_in_range_array(**kwargs)) == expected, message
+
+    # -------------------------------------------------------------------------
+    # Test 2: The "all" and "any" modes.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: Some, but not all, values are in the range."
+
+    # Set the values.
+    kwargs["mode"] = "all"
+
+    assert validate_in_range_array(**kwargs) is False, message
+
+    # Set the values.
+    kwargs["mode"] = "any"
+
+    assert validate_in_range_array(**kwargs) is True, message
+
+    # -------------------------------------------------------------------------
+    # Test 3: The offending values, with exception.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = (
+        "Test 3: The offending indices must be given with the exception."
+    )
+
+    # Set the values.
+    kwargs["exception"] = True
+    kwargs["include"] = (True, True)
+    kwargs["mode"] = "all"
+
+    # Must throw a NotInRangeError.
+    with RaisesException(NotInRangeError, message=message):
+        validate_in_range_array(**kwargs)
+
+    try:
+        validate_in_range_array(**kwargs)
+
+    except NotInRangeError as error:
+        assert error.count == 3, message
+        assert list(error.indices) == [2, 4, 5], message
+
+    # -------------------------------------------------------------------------
+    # Test 4: The mode must be a valid one.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 4: The mode must be \"mask\", \"all\" or \"any\"."
+
+    # Set the values.
+    kwargs["mode"] = "none"
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        validate_in_range_array(**kwargs)
+
+
+def test_in_range_validate_in_range_array_empty() -> None:
+    """
+        Tests the array validation functions with no values, in each mode;
+        with NumPy and with the pure Python fallback.
+    """
+    # Auxiliary variables.
+    calls: tuple = (
+        (validate_greater_than_array, (0,), AboveBelowBoundError),
+        (validate_in_range_array, ((0, 1),), NotInRangeError),
+        (validate_less_than_array, (1,), AboveBelowBoundError),
+    )
+    expected: dict = {"mask": [], "all": True, "any": False}
+
+    # -------------------------------------------------------------------------
+    # Test 1: The result must be the one of no values; i.e., all of them pass,
+    # but none of them does.
+    # -------------------------------------------------------------------------
+
+    for numpy in (True, False):
+        with patch(
+            "gutilities.validation.vnumbers._get_numpy",
+            return_value=None
+        ) if not numpy else nullcontext():
+            for (function, args, _), (mode, result) in (
+                (x, y) for x in calls for y in expected.items()
+            ):
+                # Set the message in case an error happens.
+                message: str = (
+                    f"Test 1: The result of {function.__name__} with no "
+                    f"values must be {result}; mode: {mode}, numpy: {numpy}."
+                )
+
+                for values in ([], array("d")):
+                    value: object = function(values, *args, mode=mode)
+
+                    assert (
+                        list(value) if mode == "mask" else value
+                    ) == result, message
+
+    # -------------------------------------------------------------------------
+    # Test 2: The "any" mode must raise the error of the function, with no
+    # offending values.
+    # -------------------------------------------------------------------------
+
+    for function, args, error in calls:
+        # Set the message in case an error happens.
+        message = (
+            f"Test 2: The {function.__name__} function must raise its error."
+        )
+
+        # Must throw an error of the function.
+        with RaisesException(error, message=message):
+            function([], *args, mode="any", exception=True)
+
+
+def test_in_range_validate_in_range_array_no_numpy() -> None:
+    """
+        Tests the validate_in_range_array function without NumPy; i.e., with
+        the pure Python fallback.
+    """
+    # Auxiliary variables.
+    kwargs: dict = {
+        "values": memoryview(array("d", [0.0, 1.0, float("nan"), 3.0])),
+        "crange": (0, 2),
+        "include": (False, True),
+        "mode": "mask",
+        "exception": False,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The mask must be a list.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message: str = "Test 1: The mask must be a list with the expected values."
+
+    with patch(
+        "gutilities.validation.vnumbers._get_numpy", return_value=None
+    ):
+        assert validate_in_range_array(**kwargs) == [
+            False, True, False, False
+        ], message
+
+        # ---------------------------------------------------------------------
+        # Test 2: The offending values, with exception.
+        # ---------------------------------------------------------------------
+
+        # Set the message in case an error happens.
+        message = (
+            "Test 2: There are values out of the range; an exception must "
+            "be raised."
+        )
+
+        # Set the values.
+        kwargs["exception"] = True
+
+        # Must throw a NotInRangeError.
+        with RaisesException(NotInRangeError, message=message):
+            validate_in_range_array(**kwargs)
+
+
 def test_less_than_bound_not_real() -> None:
     """
         Tests there is an exception if the value of the "bound"
@@ -831,6 +1130,63 @@ def test_less_than_validate_less_than() -> None:
         validate_less_than(**dictionary)
 
 
+def test_less_than_validate_less_than_array() -> None:
+    """
+        Tests the validate_less_than_array function gives the same results as
+        the validate_less_than function, for each value.
+    """
+    # Auxiliary variables.
+    values: list = [0.0, 1.0, float("nan"), 2.0, -1.0]
+    kwargs: dict = {
+        "values": values,
+        "bound": 1.0,
+        "include": False,
+        "mode": "mask",
+        "exception": False,
+    }
+
+    # -------------------------------------------------------------------------
+    # Test 1: The mask must match the scalar validation.
+    # -------------------------------------------------------------------------
+
+    for include in (False, True):
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The mask is not the expected one; include: {include}."
+        )
+
+        # Set the values.
+        kwargs["include"] = include
+        expected: list = [
+            validate_less_than(value, 1.0, include) for value in values
+        ]
+
+        assert list(validate_less_than_array(**kwargs)) == expected, message
+
+    # -------------------------------------------------------------------------
+    # Test 2: The offending values, with exception.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = (
+        "Test 2: There are values above the bound; an exception must be "
+        "raised."
+    )
+
+    # Set the values.
+    kwargs["exception"] = True
+    kwargs["mode"] = "any"
+
+    assert validate_less_than_array(**kwargs), message
+
+    # Set the values.
+    kwargs["mode"] = "all"
+
+    # Must throw an AboveBelowBoundError.
+    with RaisesException(AboveBelowBoundError, message=message):
+        validate_less_than_array(**kwargs)
+
+
 def test_less_than_value_not_real() -> None:
     """
         Tests there is an exception if the value of the "value"
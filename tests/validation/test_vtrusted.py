@@ -0,0 +1,88 @@
+"""
+    Contains the tests for the trusted mode of the validation functions.
+"""
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Imports
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+# User.
+from gutilities.validation.vcollections import validate_in
+from gutilities.validation.vdicts import (
+    validate_keys_equal,
+    validate_keys_subset_and_type
+)
+from gutilities.validation.vgeneral import validate_length, validate_type
+from gutilities.validation.vnumbers import (
+    validate_greater_than,
+    validate_in_range,
+    validate_less_than
+)
+from gutilities.validation.vstrings import validate_string_empty
+from gutilities.validation.vtrusted import is_trusted, set_trusted
+
+from tests.auxiliary.genutils import RaisesException
+
+
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+# Functions - Test
+# $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def test_set_trusted_correct_values() -> None:
+    """
+        Tests the results of the validation functions are the same in the
+        trusted mode.
+    """
+    # Auxiliary variables.
+    calls: tuple = (
+        (validate_type, (3, (int, float))),
+        (validate_type, ("3", int)),
+        (validate_length, ((1, 2, 3), 3)),
+        (validate_length, ((1, 2), 3)),
+        (validate_in, (3, (1, 2, 3))),
+        (validate_in, (4, (1, 2, 3))),
+        (validate_in_range, (1.5, (0, 3))),
+        (validate_in_range, (3, (0, 3), (True, False))),
+        (validate_greater_than, (0, 0, True)),
+        (validate_less_than, (0, 0)),
+        (validate_string_empty, ("  ", False, True)),
+        (validate_keys_equal, ({"a": {"b": 1}}, {"a": {"c": 1}}, -1)),
+        (validate_keys_subset_and_type, ({"a": int, "b": str}, {"a": 1})),
+    )
+
+    # -------------------------------------------------------------------------
+    # Test 1: The results must be the same.
+    # -------------------------------------------------------------------------
+
+    for function, parameters in calls:
+        # Set the message in case an error happens.
+        message: str = (
+            f"Test 1: The result of {function.__name__}{parameters} must be "
+            f"the same in the trusted mode."
+        )
+
+        # Checked result.
+        expected: bool = function(*parameters)
+
+        try:
+            set_trusted(True)
+            assert function(*parameters) == expected, message
+
+        finally:
+            set_trusted(False)
+
+    # -------------------------------------------------------------------------
+    # Test 2: The flag must be a boolean value.
+    # -------------------------------------------------------------------------
+
+    # Set the message in case an error happens.
+    message = "Test 2: The flag must be a boolean value."
+
+    # Must throw a ValueError.
+    with RaisesException(ValueError, message=message):
+        set_trusted("yes")
+
+    assert not is_trusted(), message